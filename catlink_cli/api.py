@@ -1,10 +1,16 @@
 """CatLink API client."""
 
+import asyncio
 import base64
 import hashlib
+import json
 import logging
 import pathlib
+import queue
+import threading
 import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import httpx
 import keyring
@@ -12,17 +18,32 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 
+from .cache import (
+    CapabilityCache,
+    DeviceRegistry,
+    ResponseCache,
+    account_key,
+    endpoint_key,
+)
 from .const import (
     API_SERVERS,
+    BACKGROUND_REFRESH_GRACE,
     DEFAULT_API_BASE,
+    DEFAULT_MAX_CONCURRENCY,
     KEYRING_API_BASE_KEY,
     KEYRING_IAC_KEY,
     KEYRING_PHONE_KEY,
+    KEYRING_PROFILES_KEY,
     KEYRING_SERVICE,
     KEYRING_TOKEN_KEY,
+    KEYRING_TOKEN_TIME_KEY,
     KEYRING_VERIFY_KEY,
+    LOG_PAGE_SIZE,
     RSA_PUBLIC_KEY,
     SIGN_KEY,
+    TOKEN_CHECK_PERIOD,
+    TOKEN_REFRESH_AGE,
+    TOKEN_VALIDATE_INTERVAL,
 )
 
 logger = logging.getLogger(__name__)
@@ -67,6 +88,51 @@ def _region_from_api_base(api_base: str) -> str | None:
     return None
 
 
+def fan_out[K, T](
+    calls: Sequence[tuple[K, Callable[[], T]]],
+    timeout: float | None = None,
+) -> Iterator[tuple[K, T | None, BaseException | None]]:
+    """
+    Run calls concurrently and yield their outcomes as they complete.
+
+    Each call runs on its own daemon thread, so calls still blocked on the
+    network when the deadline passes never delay interpreter exit.
+
+    Args:
+        calls: Sequence of (key, zero-argument callable) pairs.
+        timeout: Overall deadline in seconds for all calls, or None to wait forever.
+
+    Returns:
+        Iterator of (key, result, exception) tuples in completion order. Calls that
+        miss the deadline are reported with a TimeoutError.
+    """
+    outcomes: queue.Queue[tuple[int, object, BaseException | None]] = queue.Queue()
+
+    def _run(index: int, call: Callable[[], T]) -> None:
+        try:
+            outcomes.put((index, call(), None))
+        except BaseException as exc:  # noqa: BLE001 - re-raised by the consumer
+            outcomes.put((index, None, exc))
+
+    for index, (_, call) in enumerate(calls):
+        threading.Thread(target=_run, args=(index, call), daemon=True).start()
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending = set(range(len(calls)))
+    while pending:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        try:
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            index, result, exc = outcomes.get(timeout=remaining)
+        except queue.Empty:
+            for index in sorted(pending):
+                yield calls[index][0], None, TimeoutError(f"Timed out after {timeout:g}s")
+            return
+        pending.discard(index)
+        yield calls[index][0], result, exc
+
+
 def _merge_devices(primary: list[dict], extra: list[dict]) -> list[dict]:
     """
     Merge device lists and de-duplicate by ID.
@@ -144,8 +210,128 @@ def _extract_devices_or_ids(data: dict) -> tuple[list[dict], list[str]]:
     return [], []
 
 
-class CatLinkAPI:
-    """Client for the CatLink cloud API."""
+_DETAIL_APIS: dict[str, str] = {
+    "SCOOPER": "token/device/info",
+    "LITTER_BOX_599": "token/litterbox/info",
+    "C08": "token/litterbox/info/c08",
+    "FEEDER": "token/device/feeder/detail",
+    "PUREPRO": "token/device/purepro/detail",
+}
+
+_LOG_APIS: dict[str, str] = {
+    "SCOOPER": "token/device/scooper/stats/log/top5",
+    "LITTER_BOX_599": "token/litterbox/stats/log/top5",
+    "FEEDER": "token/device/feeder/stats/log/top5",
+    "PUREPRO": "token/device/purepro/stats/log/top5",
+}
+
+# Paged log history. These endpoints are not documented; they follow the naming of
+# the top-5 endpoints above and are expected to page like token/device/list
+# ("current"/"size" in, "records"/"pages" out).
+_LOG_HISTORY_APIS: dict[str, str] = {
+    "SCOOPER": "token/device/scooper/stats/log/page",
+    "LITTER_BOX_599": "token/litterbox/stats/log/page",
+    "FEEDER": "token/device/feeder/stats/log/page",
+    "PUREPRO": "token/device/purepro/stats/log/page",
+}
+
+_TOKEN_PROBE: tuple[str, dict] = ("token/device/union/list/sorted", {"type": "NONE"})
+
+_EXPAND_CANDIDATES: list[tuple[str, dict | None]] = [
+    ("token/device/union/list/sorted", {"type": "FEEDER"}),
+    ("token/device/union/list/sorted", {"type": "ALL"}),
+    ("token/device/feeder/list", None),
+    ("token/device/feeder/list/sorted", None),
+    ("token/device/list", {"type": "NONE", "current": 1, "size": 100}),
+]
+
+
+def _extract_logs(data: dict) -> list[dict]:
+    """
+    Extract log entries from a log endpoint response.
+
+    Args:
+        data: Response data section.
+
+    Returns:
+        List of log entry dictionaries.
+    """
+    return (
+        data.get("scooperLogTop5")
+        or data.get("feederLogTop5")
+        or data.get("pureLogTop5")
+        or data.get("logs")
+        or data.get("list")
+        or []
+    )
+
+
+def _log_page_params(device_id: str, page: int, since_ms: int, until_ms: int, size: int) -> dict:
+    return {
+        "deviceId": device_id,
+        "current": page,
+        "size": size,
+        "startTime": since_ms,
+        "endTime": until_ms,
+    }
+
+
+def _history_unavailable(device_type: str, exc: Exception) -> CatLinkAPIError | None:
+    """
+    Recognize a history request that failed because the endpoint does not exist.
+
+    The paged history endpoints are guessed, so a 404 or a body that is not JSON
+    means there is no history endpoint for this device type.
+
+    Args:
+        device_type: Device type the history was requested for.
+        exc: Error raised by the request.
+
+    Returns:
+        CatLinkAPIError to raise instead, or None if exc is an ordinary failure.
+    """
+    if isinstance(exc, ValueError) or (
+        isinstance(exc, CatLinkAPIError) and exc.code == httpx.codes.NOT_FOUND
+    ):
+        return CatLinkAPIError(
+            f"history endpoint not available for {device_type}", code=httpx.codes.NOT_FOUND
+        )
+    return None
+
+
+def _extract_log_page(data: dict, page: int, size: int) -> tuple[list[dict], int]:
+    """
+    Extract one page of log history and the number of pages.
+
+    Args:
+        data: Response data section.
+        page: Page number that was requested.
+        size: Page size that was requested.
+
+    Returns:
+        Tuple of (log entries, total pages). When the response does not report
+        a page count, a full page implies at least one more page.
+    """
+    if not isinstance(data, dict):
+        return [], page
+    records = data.get("records") or _extract_logs(data)
+    entries = [entry for entry in records if isinstance(entry, dict)]
+    try:
+        pages = int(data["pages"])
+    except (KeyError, TypeError, ValueError):
+        try:
+            pages = -(-int(data["total"]) // size)
+        except (KeyError, TypeError, ValueError):
+            pages = page + 1 if len(entries) >= size else page
+    return entries, pages
+
+
+def _has_feeder(devices: list[dict]) -> bool:
+    return any(dev.get("deviceType") == "FEEDER" for dev in devices)
+
+
+class _CatLinkClientBase:
+    """Request signing and response checking shared by the sync and async clients."""
 
     def __init__(
         self,
@@ -153,16 +339,24 @@ class CatLinkAPI:
         token: str | None = None,
         language: str = "en_GB",
         verify: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        account: str | None = None,
+        capabilities: CapabilityCache | None = None,
+        registry: DeviceRegistry | None = None,
+        response_cache: ResponseCache | None = None,
     ) -> None:
         self.api_base = api_base.rstrip("/") + "/"
         self.token = token or ""
         self.language = language
         self.verify = verify
-        self._client = httpx.Client(timeout=60.0, verify=verify)
-
-    def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        self.max_concurrency = max(1, max_concurrency)
+        self.account = account
+        self.capabilities = capabilities
+        self.registry = registry
+        self.response_cache = response_cache
+        self.cache_reads = True
+        self.token_issued_at: float | None = None
+        self._token_checked_at = 0.0
 
     def _api_url(self, api: str) -> str:
         if api.startswith("http"):
@@ -185,83 +379,959 @@ class CatLinkAPI:
         pad = padding.PKCS1v15()
         return base64.b64encode(pub.encrypt(sha.encode(), pad)).decode()
 
-    def request(
-        self,
-        api: str,
-        params: dict | None = None,
-        method: str = "GET",
-    ) -> dict:
-        """Make a signed request to the CatLink API."""
-        url = self._api_url(api)
-        headers = {
+    def _headers(self) -> dict[str, str]:
+        return {
             "language": self.language,
             "User-Agent": "okhttp/3.10.0",
             "token": self.token,
         }
 
+    def _signed_params(self, params: dict | None) -> dict:
+        """
+        Add the nonce, token and signature to request parameters.
+
+        Args:
+            params: Unsigned request parameters.
+
+        Returns:
+            Signed parameter dictionary.
+        """
         pms = dict(params) if params else {}
         pms["noncestr"] = int(time.time() * 1000)
         if self.token:
             pms["token"] = self.token
         pms["sign"] = self._params_sign(pms)
+        return pms
+
+    def _check_response(self, rsp: dict) -> dict:
+        """Check API response for errors, re-authenticate on token expiry."""
+        code = rsp.get("returnCode", 0)
+        if code == 1002:
+            raise CatLinkAPIError("Token expired", code=1002)
+        if code and code != 0:
+            msg = rsp.get("msg") or rsp.get("message") or f"Error code {code}"
+            raise CatLinkAPIError(msg, code=code)
+        return rsp
+
+    def _login_params(self, phone_iac: str, phone: str, password: str) -> dict:
+        encrypted = password if len(password) > 16 else self.encrypt_password(password)
+        return {
+            "platform": "ANDROID",
+            "internationalCode": phone_iac,
+            "mobile": phone,
+            "password": encrypted,
+        }
+
+    @staticmethod
+    def _token_from_login(rsp: dict) -> str:
+        tok = rsp.get("data", {}).get("token")
+        if not tok:
+            msg = rsp.get("msg") or rsp.get("message") or "Login failed"
+            raise CatLinkAPIError(f"Login failed: {msg}")
+        return tok
+
+    def _cache_key(self, api: str, params: dict | None, method: str) -> str | None:
+        """
+        Build the response cache key for a read, or None if it is not cached.
+
+        The key covers the account, region and unsigned parameters, so the
+        nonce, token and signature never affect it.
+
+        Args:
+            api: API path.
+            params: Unsigned request parameters.
+            method: HTTP method name.
+
+        Returns:
+            Cache key, or None.
+        """
+        cache = self.response_cache
+        if cache is None or method.upper() != "GET" or not cache.cacheable(api):
+            return None
+        owner = account_key(self.account or self.token)
+        return f"{owner}|{self.api_base}|{endpoint_key(api, params)}"
+
+    def _token_action(self) -> str | None:
+        """
+        Decide whether the token should be refreshed or checked before it is used.
+
+        Returns:
+            "refresh" when the token is older than TOKEN_REFRESH_AGE, "probe" when
+            no request has confirmed it for TOKEN_VALIDATE_INTERVAL, otherwise None.
+        """
+        if not self.token:
+            return None
+        issued_at = self.token_issued_at
+        if issued_at is not None and time.time() - issued_at > TOKEN_REFRESH_AGE:
+            return "refresh"
+        if time.monotonic() - self._token_checked_at > TOKEN_VALIDATE_INTERVAL:
+            return "probe"
+        return None
+
+    def _decode(self, api: str, method: str, resp: httpx.Response) -> dict:
+        """
+        Decode a response body.
+
+        Args:
+            api: API path, for messages.
+            method: HTTP method name, for logging.
+            resp: HTTP response.
+
+        Returns:
+            Response dictionary.
+
+        Raises:
+            CatLinkAPIError: With code 404 if the server does not know the endpoint.
+        """
+        if resp.status_code == httpx.codes.NOT_FOUND:
+            raise CatLinkAPIError(f"Endpoint {api} not found", code=httpx.codes.NOT_FOUND)
+        result = resp.json()
+        logger.debug("API %s %s -> %s", method, api, result)
+        self._note_token_result(result)
+        return result
+
+    def _note_token_result(self, result: dict) -> None:
+        if self.token and result.get("returnCode", 0) != 1002:
+            self._token_checked_at = time.monotonic()
+
+    def _note_login(self) -> None:
+        self.token_issued_at = time.time()
+        self._token_checked_at = time.monotonic()
+
+    def _flight_key(self, api: str, params: dict | None, method: str) -> str | None:
+        """
+        Build the key under which identical in-flight reads are coalesced.
+
+        Args:
+            api: API path.
+            params: Unsigned request parameters.
+            method: HTTP method name.
+
+        Returns:
+            Key for GET requests, or None for requests that change state.
+        """
+        if method.upper() != "GET":
+            return None
+        return f"{self.token}|{endpoint_key(api, params)}"
+
+    def _cache_lookup(self, key: str | None, api: str) -> tuple[dict, bool] | None:
+        if key is None or not self.cache_reads:
+            return None
+        return self.response_cache.get(key, api)
+
+    def _cache_store(self, key: str | None, api: str, params: dict | None, rsp: dict) -> None:
+        if key is None or not self.cache_reads or rsp.get("returnCode", 0):
+            return
+        device_id = (params or {}).get("deviceId")
+        self.response_cache.put(key, api, str(device_id) if device_id else None, rsp)
+
+    def _invalidate_device(self, device_id: str) -> None:
+        if self.response_cache is not None:
+            self.response_cache.invalidate_device(device_id)
+
+    def _record_devices(self, devices: list[dict]) -> None:
+        """
+        Record listed devices in the device registry, if one is attached.
+
+        Args:
+            devices: Devices returned by get_devices.
+
+        Returns:
+            None.
+        """
+        region = _region_from_api_base(self.api_base)
+        if self.registry is None or region is None:
+            return
+        account = account_key(self.account) if self.account else None
+        self.registry.record(region, devices, account=account)
+
+    def _capability_scope(self) -> tuple[str, str] | None:
+        if self.capabilities is None or not self.account:
+            return None
+        return account_key(self.account), _region_from_api_base(self.api_base) or self.api_base
+
+    def _expand_candidates(self, rediscover: bool) -> tuple[list[tuple[str, dict | None]], bool]:
+        """
+        Choose which fallback list endpoints to probe.
+
+        Args:
+            rediscover: Ignore cached capabilities and probe every endpoint.
+
+        Returns:
+            Tuple of (candidates, full_probe).
+        """
+        scope = self._capability_scope()
+        known = None if scope is None or rediscover else self.capabilities.get(*scope)
+        if known is None:
+            return list(_EXPAND_CANDIDATES), True
+        return [c for c in _EXPAND_CANDIDATES if endpoint_key(*c) in known], False
+
+    def _record_capabilities(
+        self, candidates: list[tuple[str, dict | None]], results: list[list[dict] | None]
+    ) -> None:
+        """
+        Store which probed endpoints returned devices.
+
+        Nothing is stored if any endpoint failed: a timeout or server error says
+        nothing about whether the endpoint lists devices for this account.
+
+        Args:
+            candidates: Probed (api, params) pairs.
+            results: Device lists returned for each candidate, or None where the
+                request failed.
+
+        Returns:
+            None.
+        """
+        scope = self._capability_scope()
+        if scope is None or any(extra is None for extra in results):
+            return
+        live = [endpoint_key(*c) for c, extra in zip(candidates, results, strict=True) if extra]
+        self.capabilities.put(*scope, live)
+
+
+class CatLinkAPI(_CatLinkClientBase):
+    """Client for the CatLink cloud API."""
+
+    def __init__(
+        self,
+        api_base: str = DEFAULT_API_BASE,
+        token: str | None = None,
+        language: str = "en_GB",
+        verify: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        account: str | None = None,
+        capabilities: CapabilityCache | None = None,
+        registry: DeviceRegistry | None = None,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
+        super().__init__(
+            api_base=api_base,
+            token=token,
+            language=language,
+            verify=verify,
+            max_concurrency=max_concurrency,
+            account=account,
+            capabilities=capabilities,
+            registry=registry,
+            response_cache=response_cache,
+        )
+        self._client = httpx.Client(timeout=60.0, verify=verify)
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._refresh_lock = threading.Lock()
+        self._refreshing: dict[str, threading.Thread] = {}
+        self._flight_lock = threading.Lock()
+        self._in_flight: dict[str, Future[dict]] = {}
+        self._auth_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the HTTP client and save the response cache once background refreshes end."""
+        with self._refresh_lock:
+            pending = list(self._refreshing.values())
+        deadline = time.monotonic() + BACKGROUND_REFRESH_GRACE
+        for thread in pending:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        if self.response_cache is not None:
+            self.response_cache.save()
+        self._client.close()
+
+    def _map_concurrently[T, R](self, func: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """
+        Apply a function to items on worker threads, bounded by max_concurrency.
+
+        Args:
+            func: Function to call for each item.
+            items: Items to process.
+
+        Returns:
+            Results in the same order as the items.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items))) as pool:
+            return list(pool.map(func, items))
+
+    def request(
+        self,
+        api: str,
+        params: dict | None = None,
+        method: str = "GET",
+        fresh: bool = False,
+    ) -> dict:
+        """Make a signed request to the CatLink API, serving cached reads unless fresh."""
+        key = None if fresh or not self.cache_reads else self._cache_key(api, params, method)
+        cached = self._cache_lookup(key, api)
+        if cached is not None:
+            rsp, stale = cached
+            if stale:
+                self._refresh_in_background(key, api, params, method)
+            return rsp
+        rsp = self._send_shared(api, params, method)
+        self._cache_store(key, api, params, rsp)
+        return rsp
+
+    def _send_shared(self, api: str, params: dict | None, method: str) -> dict:
+        """
+        Send a request, sharing the result of an identical read already in flight.
+
+        Args:
+            api: API path.
+            params: Unsigned request parameters.
+            method: HTTP method name.
+
+        Returns:
+            Response dictionary.
+        """
+        key = self._flight_key(api, params, method)
+        if key is None:
+            return self._send(api, params, method)
+        with self._flight_lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._in_flight[key] = Future()
+        if not leader:
+            return flight.result()
+        try:
+            rsp = self._send(api, params, method)
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(rsp)
+            return rsp
+        finally:
+            with self._flight_lock:
+                self._in_flight.pop(key, None)
+
+    def _refresh_in_background(self, key: str, api: str, params: dict | None, method: str) -> None:
+        """
+        Refetch a stale cached response on a background thread.
+
+        Args:
+            key: Cache key of the stale entry.
+            api: API path.
+            params: Unsigned request parameters.
+            method: HTTP method name.
+
+        Returns:
+            None.
+        """
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            thread = threading.Thread(
+                target=self._refresh, args=(key, api, params, method), daemon=True
+            )
+            self._refreshing[key] = thread
+        thread.start()
+
+    def _refresh(self, key: str, api: str, params: dict | None, method: str) -> None:
+        try:
+            self._cache_store(key, api, params, self._send_shared(api, params, method))
+        except (CatLinkAPIError, httpx.HTTPError, ValueError) as exc:
+            logger.debug("Background refresh of %s failed: %s", api, exc)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.pop(key, None)
+
+    def _send(self, api: str, params: dict | None, method: str) -> dict:
+        """Sign and send a request, bypassing the response cache."""
+        url = self._api_url(api)
+        headers = self._headers()
+        pms = self._signed_params(params)
+
+        with self._request_slots:
+            if method.upper() == "GET":
+                resp = self._client.get(url, params=pms, headers=headers)
+            elif method.upper() == "POST_GET":
+                resp = self._client.post(url, params=pms, headers=headers)
+            else:
+                resp = self._client.post(url, data=pms, headers=headers)
+        return self._decode(api, method, resp)
+
+    def login(self, phone_iac: str, phone: str, password: str) -> str:
+        """Login and return the authentication token."""
+        pms = self._login_params(phone_iac, phone, password)
+        self.token = ""
+        rsp = self.request("login/password", pms, "POST")
+        self.token = self._token_from_login(rsp)
+        self.account = f"{phone_iac}:{phone}"
+        self._note_login()
+        return self.token
+
+    def _region_clients(self) -> dict[str, "CatLinkAPI"]:
+        """
+        Build one client per API region, each with its own connection pool.
+
+        Returns:
+            Mapping of region name to client.
+        """
+        return {
+            region: type(self)(
+                api_base=base_url,
+                language=self.language,
+                verify=self.verify,
+                max_concurrency=self.max_concurrency,
+                capabilities=self.capabilities,
+                registry=self.registry,
+            )
+            for region, base_url in API_SERVERS.items()
+        }
+
+    def login_auto_region(self, phone_iac: str, phone: str, password: str) -> tuple[str, str]:
+        """
+        Log in to all API regions concurrently and return the first success.
+
+        Attempts still in flight when one region succeeds are cancelled by closing
+        their connections.
+
+        Args:
+            phone_iac: Country calling code.
+            phone: Phone number.
+            password: Account password (plaintext or encrypted).
+
+        Returns:
+            Tuple of (token, api_base) for the first region that accepted the login.
+        """
+        clients = self._region_clients()
+        calls = [
+            (region, lambda c=client: c.login(phone_iac, phone, password))
+            for region, client in clients.items()
+        ]
+        failures: dict[str, str] = {}
+        try:
+            for region, tok, exc in fan_out(calls):
+                if exc is None:
+                    self.api_base = clients[region].api_base
+                    self.token = tok
+                    return tok, self.api_base
+                if not isinstance(exc, (CatLinkAPIError, httpx.HTTPError)):
+                    raise exc
+                failures[region] = str(exc)
+        finally:
+            for client in clients.values():
+                client.close()
+        errors = [f"{region}: {failures[region]}" for region in API_SERVERS if region in failures]
+        raise CatLinkAPIError(f"Login failed on all regions: {'; '.join(errors)}")
+
+    def login_all_regions(
+        self, phone_iac: str, phone: str, password: str
+    ) -> tuple[list[tuple[str, str, str]], list[tuple[str, str]]]:
+        """
+        Log in to all API regions concurrently and return successes and errors.
+
+        Args:
+            phone_iac: Country calling code.
+            phone: Phone number.
+            password: Account password (plaintext or encrypted).
+
+        Returns:
+            Tuple of (successes, errors), each in API_SERVERS order.
+        """
+        clients = self._region_clients()
+        calls = [
+            (region, lambda c=client: c.login(phone_iac, phone, password))
+            for region, client in clients.items()
+        ]
+        tokens: dict[str, str] = {}
+        failures: dict[str, str] = {}
+        try:
+            for region, tok, exc in fan_out(calls):
+                if exc is None:
+                    tokens[region] = tok
+                elif isinstance(exc, (CatLinkAPIError, httpx.HTTPError)):
+                    failures[region] = str(exc)
+                else:
+                    raise exc
+        finally:
+            for client in clients.values():
+                client.close()
+        successes = [
+            (region, base_url, tokens[region])
+            for region, base_url in API_SERVERS.items()
+            if region in tokens
+        ]
+        errors = [(region, failures[region]) for region in API_SERVERS if region in failures]
+        return successes, errors
+
+    def _request_with_reauth(
+        self,
+        api: str,
+        params: dict | None = None,
+        method: str = "GET",
+        fresh: bool = False,
+    ) -> dict:
+        """Make a request, re-authenticating once on token expiry."""
+        token = self.token
+        rsp = self.request(api, params, method, fresh)
+        if rsp.get("returnCode", 0) == 1002 and self._reauthenticate(token):
+            rsp = self.request(api, params, method, fresh)
+        return rsp
+
+    def _reauthenticate(self, rejected_token: str) -> bool:
+        """
+        Log in again after the token was rejected, once for all concurrent callers.
+
+        Callers that were rejected with the same token wait for the first one to
+        log in and then reuse the new token.
+
+        Args:
+            rejected_token: Token that the API rejected.
+
+        Returns:
+            True if a new token is available, False if no credentials are stored.
+        """
+        with self._auth_lock:
+            if self.token != rejected_token:
+                return True
+            invalidate_credential_cache()
+            creds = _load_credentials(region=_region_from_api_base(self.api_base))
+            if not creds:
+                return False
+            token = self.login(creds["phone_iac"], creds["phone"], creds["token"])
+            _store_refreshed_token(self.api_base, token)
+            return True
+
+    def validate_token(self) -> bool:
+        """
+        Check the token with one uncached request.
+
+        Returns:
+            False if the API rejected the token.
+        """
+        api, params = _TOKEN_PROBE
+        return self._send_shared(api, params, "GET").get("returnCode", 0) != 1002
+
+    def ensure_token(self) -> None:
+        """
+        Refresh the token ahead of use if it is old or no longer accepted.
+
+        Long-running modes call this periodically so that requests do not pay
+        for a rejected call and a re-login.
+
+        Returns:
+            None.
+        """
+        action = self._token_action()
+        if action == "refresh" or (action == "probe" and not self.validate_token()):
+            self._reauthenticate(self.token)
+
+    def get_devices(self, rediscover: bool = False, fresh: bool = False) -> list[dict]:
+        """
+        Get the list of devices.
+
+        Args:
+            rediscover: Probe every fallback list endpoint, ignoring cached capabilities.
+            fresh: Fetch from the network instead of serving cached responses.
+
+        Returns:
+            List of device dictionaries.
+        """
+        rsp = self._request_with_reauth(
+            "token/device/union/list/sorted", {"type": "NONE"}, fresh=fresh
+        )
+        self._check_response(rsp)
+        devices = _extract_devices(rsp.get("data") or {})
+        if not _has_feeder(devices):
+            devices = self._try_expand_devices(devices, rediscover=rediscover, fresh=fresh)
+        self._record_devices(devices)
+        return devices
+
+    def _try_expand_devices(
+        self, devices: list[dict], rediscover: bool = False, fresh: bool = False
+    ) -> list[dict]:
+        """
+        Attempt to expand the device list with alternate type filters.
+
+        Candidates are fetched concurrently and merged in candidate order. Endpoints
+        that returned nothing on the last full probe are skipped until the capability
+        cache entry expires.
+
+        Args:
+            devices: Existing device list.
+            rediscover: Probe every candidate regardless of cached capabilities.
+            fresh: Fetch from the network instead of serving cached responses.
+
+        Returns:
+            Expanded device list with duplicates removed.
+        """
+        expanded = list(devices)
+        candidates, full_probe = self._expand_candidates(rediscover)
+        results = self._map_concurrently(
+            lambda candidate: self._fetch_device_list(*candidate, fresh=fresh), candidates
+        )
+        if full_probe:
+            self._record_capabilities(candidates, results)
+        for extra in results:
+            if extra:
+                expanded = _merge_devices(expanded, extra)
+        return expanded
+
+    def _fetch_device_list(
+        self, api: str, params: dict | None = None, fresh: bool = False
+    ) -> list[dict] | None:
+        """
+        Fetch device data from a list endpoint, expanding IDs when needed.
+
+        Args:
+            api: API path for device listing.
+            params: Optional query parameters.
+            fresh: Fetch from the network instead of serving cached responses.
+
+        Returns:
+            List of device info dictionaries; empty if the endpoint does not exist,
+            None if the request failed.
+        """
+        try:
+            rsp = self._request_with_reauth(api, params, fresh=fresh)
+            self._check_response(rsp)
+        except CatLinkAPIError as exc:
+            return [] if exc.code == httpx.codes.NOT_FOUND else None
+        except (httpx.HTTPError, ValueError):
+            return None
+        data = rsp.get("data") or {}
+        devices, ids = _extract_devices_or_ids(data)
+        if devices:
+            return devices
+        if ids:
+            return self._fetch_devices_by_ids(ids, fresh)
+        return []
+
+    def _fetch_devices_by_ids(self, device_ids: list[str], fresh: bool = False) -> list[dict]:
+        """
+        Fetch device info for a list of IDs concurrently, preserving order.
+
+        Args:
+            device_ids: Device identifier list.
+            fresh: Fetch from the network instead of serving cached responses.
+
+        Returns:
+            List of device info dictionaries.
+        """
+        infos = self._map_concurrently(
+            lambda device_id: self._fetch_device_info(device_id, fresh), device_ids
+        )
+        return [info for info in infos if info]
+
+    def _fetch_device_info(self, device_id: str, fresh: bool = False) -> dict:
+        """
+        Fetch device info for a single device ID.
+
+        Args:
+            device_id: Device identifier.
+            fresh: Fetch from the network instead of serving cached responses.
+
+        Returns:
+            Device info dictionary.
+        """
+        try:
+            rsp = self._request_with_reauth(
+                "token/device/info", {"deviceId": device_id}, fresh=fresh
+            )
+            self._check_response(rsp)
+        except (CatLinkAPIError, httpx.HTTPError):
+            return {}
+        data = rsp.get("data") or {}
+        return data.get("deviceInfo") or data
+
+    def get_device_detail(self, device_id: str, device_type: str, fresh: bool = False) -> dict:
+        """Get detailed info for a device, bypassing cached responses if fresh."""
+        api = _DETAIL_APIS.get(device_type, "token/device/info")
+        rsp = self._request_with_reauth(api, {"deviceId": device_id}, fresh=fresh)
+        self._check_response(rsp)
+        return rsp.get("data", {}).get("deviceInfo") or rsp.get("data", {})
+
+    def change_mode(self, device_id: str, mode_code: str, device_type: str) -> dict:
+        """Change the device working mode."""
+        if device_type == "LITTER_BOX_599":
+            api = "token/litterbox/changeMode"
+        else:
+            api = "token/device/changeMode"
+        pms = {"workModel": mode_code, "deviceId": device_id}
+        rsp = self.request(api, pms, "POST")
+        self._check_response(rsp)
+        self._invalidate_device(device_id)
+        return rsp
+
+    def send_action(self, device_id: str, action_code: str, device_type: str) -> dict:
+        """Send an action command to the device."""
+        if device_type == "LITTER_BOX_599":
+            api = "token/litterbox/actionCmd"
+        else:
+            api = "token/device/actionCmd"
+        pms = {"cmd": action_code, "deviceId": device_id}
+        rsp = self.request(api, pms, "POST")
+        self._check_response(rsp)
+        self._invalidate_device(device_id)
+        return rsp
+
+    def get_device_logs(self, device_id: str, device_type: str) -> list[dict]:
+        """Get recent device logs."""
+        api = _LOG_APIS.get(device_type, "token/device/union/logs")
+        rsp = self._request_with_reauth(api, {"deviceId": device_id})
+        self._check_response(rsp)
+        return _extract_logs(rsp.get("data", {}))
+
+    def get_device_log_page(
+        self,
+        device_id: str,
+        device_type: str,
+        page: int,
+        since_ms: int,
+        until_ms: int,
+        size: int = LOG_PAGE_SIZE,
+    ) -> tuple[list[dict], int]:
+        """Get one page of device log history between two epoch-millisecond times."""
+        api = _LOG_HISTORY_APIS.get(device_type, "token/device/union/logs/page")
+        pms = _log_page_params(device_id, page, since_ms, until_ms, size)
+        try:
+            rsp = self._request_with_reauth(api, pms)
+        except (CatLinkAPIError, ValueError) as exc:
+            unavailable = _history_unavailable(device_type, exc)
+            if unavailable is None:
+                raise
+            raise unavailable from exc
+        self._check_response(rsp)
+        return _extract_log_page(rsp.get("data") or {}, page, size)
+
+    def replace_garbage_bag(self, device_id: str, enable: bool = True) -> dict:
+        """Trigger garbage bag replacement on a LitterBox."""
+        api = "token/litterbox/replaceGarbageBagCmd"
+        pms = {"enable": "1" if enable else "0", "deviceId": device_id}
+        rsp = self.request(api, pms, "POST")
+        self._check_response(rsp)
+        self._invalidate_device(device_id)
+        return rsp
+
+    def reset_consumable(self, device_id: str, device_type: str, consumable_type: str) -> dict:
+        """Reset a consumable counter (CAT_LITTER or DEODORIZER_02)."""
+        api = "token/device/union/consumableReset"
+        pms = {
+            "consumablesType": consumable_type,
+            "deviceId": device_id,
+            "deviceType": device_type,
+        }
+        rsp = self.request(api, pms, "POST")
+        self._check_response(rsp)
+        self._invalidate_device(device_id)
+        return rsp
+
+    def food_out(self, device_id: str, portions: int = 5) -> dict:
+        """Manually dispense food from a feeder."""
+        pms = {"footOutNum": portions, "deviceId": device_id}
+        rsp = self.request("token/device/feeder/foodOut", pms, "POST")
+        self._check_response(rsp)
+        self._invalidate_device(device_id)
+        return rsp
+
+    def get_cats(self, timezone_id: str | None = None, fresh: bool = False) -> list[dict]:
+        """Get the list of cats, bypassing cached responses if fresh."""
+        pms: dict[str, str] = {}
+        if timezone_id:
+            pms["timezoneId"] = timezone_id
+        rsp = self._request_with_reauth("token/pet/health/v3/cats", pms or None, fresh=fresh)
+        self._check_response(rsp)
+        return rsp.get("data", {}).get("cats") or []
+
+    def get_cat_summary(self, pet_id: str, date: str, timezone_id: str | None = None) -> dict:
+        """Get a cat's health summary for a given date."""
+        pms: dict[str, str | int] = {"petId": pet_id, "date": date, "sport": 1}
+        if timezone_id:
+            pms["timezoneId"] = timezone_id
+        rsp = self._request_with_reauth("token/pet/health/v3/summarySimple", pms)
+        self._check_response(rsp)
+        return rsp.get("data") or {}
+
+
+class AsyncCatLinkAPI(_CatLinkClientBase):
+    """Asyncio client for the CatLink cloud API, mirroring CatLinkAPI."""
+
+    def __init__(
+        self,
+        api_base: str = DEFAULT_API_BASE,
+        token: str | None = None,
+        language: str = "en_GB",
+        verify: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        account: str | None = None,
+        capabilities: CapabilityCache | None = None,
+        registry: DeviceRegistry | None = None,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
+        super().__init__(
+            api_base=api_base,
+            token=token,
+            language=language,
+            verify=verify,
+            max_concurrency=max_concurrency,
+            account=account,
+            capabilities=capabilities,
+            registry=registry,
+            response_cache=response_cache,
+        )
+        self._client = httpx.AsyncClient(timeout=60.0, verify=verify)
+        self._request_slots = asyncio.Semaphore(self.max_concurrency)
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._in_flight: dict[str, asyncio.Task[dict]] = {}
+        self._auth_lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        """Close the HTTP client and save the response cache once background refreshes end."""
+        if self._refreshing:
+            await asyncio.wait(list(self._refreshing.values()), timeout=BACKGROUND_REFRESH_GRACE)
+        if self.response_cache is not None:
+            self.response_cache.save()
+        await self._client.aclose()
+
+    async def request(
+        self,
+        api: str,
+        params: dict | None = None,
+        method: str = "GET",
+        fresh: bool = False,
+    ) -> dict:
+        """Make a signed request to the CatLink API, serving cached reads unless fresh."""
+        key = None if fresh or not self.cache_reads else self._cache_key(api, params, method)
+        cached = self._cache_lookup(key, api)
+        if cached is not None:
+            rsp, stale = cached
+            if stale and key not in self._refreshing:
+                self._refreshing[key] = asyncio.ensure_future(
+                    self._refresh(key, api, params, method)
+                )
+            return rsp
+        rsp = await self._send_shared(api, params, method)
+        self._cache_store(key, api, params, rsp)
+        return rsp
 
-        if method.upper() == "GET":
-            resp = self._client.get(url, params=pms, headers=headers)
-        elif method.upper() == "POST_GET":
-            resp = self._client.post(url, params=pms, headers=headers)
-        else:
-            resp = self._client.post(url, data=pms, headers=headers)
+    async def _send_shared(self, api: str, params: dict | None, method: str) -> dict:
+        """
+        Send a request, sharing the result of an identical read already in flight.
 
-        result = resp.json()
-        logger.debug("API %s %s -> %s", method, api, result)
-        return result
+        The shared request runs as its own task, so a cancelled caller does not
+        cancel it for the others.
 
-    def _check_response(self, rsp: dict) -> dict:
-        """Check API response for errors, re-authenticate on token expiry."""
-        code = rsp.get("returnCode", 0)
-        if code == 1002:
-            raise CatLinkAPIError("Token expired", code=1002)
-        if code and code != 0:
-            msg = rsp.get("msg") or rsp.get("message") or f"Error code {code}"
-            raise CatLinkAPIError(msg, code=code)
-        return rsp
+        Args:
+            api: API path.
+            params: Unsigned request parameters.
+            method: HTTP method name.
 
-    def login(self, phone_iac: str, phone: str, password: str) -> str:
+        Returns:
+            Response dictionary.
+        """
+        key = self._flight_key(api, params, method)
+        if key is None:
+            return await self._send(api, params, method)
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._send(api, params, method))
+            self._in_flight[key] = flight
+            flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(flight)
+
+    async def _refresh(self, key: str, api: str, params: dict | None, method: str) -> None:
+        try:
+            self._cache_store(key, api, params, await self._send_shared(api, params, method))
+        except (CatLinkAPIError, httpx.HTTPError, ValueError) as exc:
+            logger.debug("Background refresh of %s failed: %s", api, exc)
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def _send(self, api: str, params: dict | None, method: str) -> dict:
+        """Sign and send a request, bypassing the response cache."""
+        url = self._api_url(api)
+        headers = self._headers()
+        pms = self._signed_params(params)
+
+        async with self._request_slots:
+            if method.upper() == "GET":
+                resp = await self._client.get(url, params=pms, headers=headers)
+            elif method.upper() == "POST_GET":
+                resp = await self._client.post(url, params=pms, headers=headers)
+            else:
+                resp = await self._client.post(url, data=pms, headers=headers)
+        return self._decode(api, method, resp)
+
+    async def login(self, phone_iac: str, phone: str, password: str) -> str:
         """Login and return the authentication token."""
-        encrypted = password if len(password) > 16 else self.encrypt_password(password)
-        pms = {
-            "platform": "ANDROID",
-            "internationalCode": phone_iac,
-            "mobile": phone,
-            "password": encrypted,
-        }
+        pms = self._login_params(phone_iac, phone, password)
         self.token = ""
-        rsp = self.request("login/password", pms, "POST")
-        tok = rsp.get("data", {}).get("token")
-        if not tok:
-            msg = rsp.get("msg") or rsp.get("message") or "Login failed"
-            raise CatLinkAPIError(f"Login failed: {msg}")
-        self.token = tok
-        return tok
+        rsp = await self.request("login/password", pms, "POST")
+        self.token = self._token_from_login(rsp)
+        self.account = f"{phone_iac}:{phone}"
+        self._note_login()
+        return self.token
 
-    def login_auto_region(self, phone_iac: str, phone: str, password: str) -> tuple[str, str]:
-        """Try all API regions and return (token, api_base) for the first success."""
-        errors: list[str] = []
-        for region, base_url in API_SERVERS.items():
-            self.api_base = base_url
-            try:
-                tok = self.login(phone_iac, phone, password)
-                return tok, base_url
-            except (CatLinkAPIError, httpx.HTTPError) as exc:
-                errors.append(f"{region}: {exc}")
-                continue
+    def _region_clients(self) -> dict[str, "AsyncCatLinkAPI"]:
+        """
+        Build one client per API region, each with its own connection pool.
+
+        Returns:
+            Mapping of region name to client.
+        """
+        return {
+            region: type(self)(
+                api_base=base_url,
+                language=self.language,
+                verify=self.verify,
+                max_concurrency=self.max_concurrency,
+                capabilities=self.capabilities,
+                registry=self.registry,
+            )
+            for region, base_url in API_SERVERS.items()
+        }
+
+    async def _login_region(
+        self, region: str, client: "AsyncCatLinkAPI", phone_iac: str, phone: str, password: str
+    ) -> tuple[str, str | None, str | None]:
+        try:
+            return region, await client.login(phone_iac, phone, password), None
+        except (CatLinkAPIError, httpx.HTTPError) as exc:
+            return region, None, str(exc)
+
+    async def login_auto_region(self, phone_iac: str, phone: str, password: str) -> tuple[str, str]:
+        """
+        Log in to all API regions concurrently and return the first success.
+
+        Attempts still in flight when one region succeeds are cancelled.
+
+        Args:
+            phone_iac: Country calling code.
+            phone: Phone number.
+            password: Account password (plaintext or encrypted).
+
+        Returns:
+            Tuple of (token, api_base) for the first region that accepted the login.
+        """
+        clients = self._region_clients()
+        tasks = [
+            asyncio.ensure_future(self._login_region(region, client, phone_iac, phone, password))
+            for region, client in clients.items()
+        ]
+        failures: dict[str, str] = {}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                region, tok, err = await next_done
+                if tok:
+                    self.api_base = clients[region].api_base
+                    self.token = tok
+                    return tok, self.api_base
+                failures[region] = err or "Login failed"
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*(client.close() for client in clients.values()))
+        errors = [f"{region}: {failures[region]}" for region in API_SERVERS if region in failures]
         raise CatLinkAPIError(f"Login failed on all regions: {'; '.join(errors)}")
 
-    def login_all_regions(
+    async def login_all_regions(
         self, phone_iac: str, phone: str, password: str
     ) -> tuple[list[tuple[str, str, str]], list[tuple[str, str]]]:
         """
-        Try all API regions and return successes and errors.
+        Log in to all API regions concurrently and return successes and errors.
 
         Args:
             phone_iac: Country calling code.
@@ -269,195 +1339,279 @@ class CatLinkAPI:
             password: Account password (plaintext or encrypted).
 
         Returns:
-            Tuple of (successes, errors).
+            Tuple of (successes, errors), each in API_SERVERS order.
         """
+        clients = self._region_clients()
+        try:
+            outcomes = await asyncio.gather(
+                *(
+                    self._login_region(region, client, phone_iac, phone, password)
+                    for region, client in clients.items()
+                )
+            )
+        finally:
+            await asyncio.gather(*(client.close() for client in clients.values()))
         successes: list[tuple[str, str, str]] = []
         errors: list[tuple[str, str]] = []
-        for region, base_url in API_SERVERS.items():
-            self.api_base = base_url
-            try:
-                tok = self.login(phone_iac, phone, password)
-            except (CatLinkAPIError, httpx.HTTPError) as exc:
-                errors.append((region, str(exc)))
-                continue
-            successes.append((region, base_url, tok))
+        for region, tok, err in outcomes:
+            if tok:
+                successes.append((region, API_SERVERS[region], tok))
+            else:
+                errors.append((region, err or "Login failed"))
         return successes, errors
 
-    def _request_with_reauth(
+    async def _request_with_reauth(
         self,
         api: str,
         params: dict | None = None,
         method: str = "GET",
+        fresh: bool = False,
     ) -> dict:
         """Make a request, re-authenticating once on token expiry."""
-        rsp = self.request(api, params, method)
-        code = rsp.get("returnCode", 0)
-        if code == 1002:
-            region = _region_from_api_base(self.api_base)
-            creds = _load_credentials(region=region)
-            if creds:
-                self.login(creds["phone_iac"], creds["phone"], creds["token"])
-                rsp = self.request(api, params, method)
+        token = self.token
+        rsp = await self.request(api, params, method, fresh)
+        if rsp.get("returnCode", 0) == 1002 and await self._reauthenticate(token):
+            rsp = await self.request(api, params, method, fresh)
         return rsp
 
-    def get_devices(self) -> list[dict]:
-        """Get the list of devices."""
-        rsp = self._request_with_reauth("token/device/union/list/sorted", {"type": "NONE"})
+    async def _reauthenticate(self, rejected_token: str) -> bool:
+        """
+        Log in again after the token was rejected, once for all concurrent tasks.
+
+        Args:
+            rejected_token: Token that the API rejected.
+
+        Returns:
+            True if a new token is available, False if no credentials are stored.
+        """
+        async with self._auth_lock:
+            if self.token != rejected_token:
+                return True
+            region = _region_from_api_base(self.api_base)
+            invalidate_credential_cache()
+            creds = await asyncio.to_thread(_load_credentials, region=region)
+            if not creds:
+                return False
+            token = await self.login(creds["phone_iac"], creds["phone"], creds["token"])
+            await asyncio.to_thread(_store_refreshed_token, self.api_base, token)
+            return True
+
+    async def validate_token(self) -> bool:
+        """
+        Check the token with one uncached request.
+
+        Returns:
+            False if the API rejected the token.
+        """
+        api, params = _TOKEN_PROBE
+        rsp = await self._send_shared(api, params, "GET")
+        return rsp.get("returnCode", 0) != 1002
+
+    async def ensure_token(self) -> None:
+        """
+        Refresh the token ahead of use if it is old or no longer accepted.
+
+        Returns:
+            None.
+        """
+        action = self._token_action()
+        if action == "refresh" or (action == "probe" and not await self.validate_token()):
+            await self._reauthenticate(self.token)
+
+    async def get_devices(self, rediscover: bool = False, fresh: bool = False) -> list[dict]:
+        """
+        Get the list of devices.
+
+        Args:
+            rediscover: Probe every fallback list endpoint, ignoring cached capabilities.
+            fresh: Fetch from the network instead of serving cached responses.
+
+        Returns:
+            List of device dictionaries.
+        """
+        rsp = await self._request_with_reauth(
+            "token/device/union/list/sorted", {"type": "NONE"}, fresh=fresh
+        )
         self._check_response(rsp)
         devices = _extract_devices(rsp.get("data") or {})
-        if not any(dev.get("deviceType") == "FEEDER" for dev in devices):
-            devices = self._try_expand_devices(devices)
+        if not _has_feeder(devices):
+            devices = await self._try_expand_devices(devices, rediscover=rediscover, fresh=fresh)
+        self._record_devices(devices)
         return devices
 
-    def _try_expand_devices(self, devices: list[dict]) -> list[dict]:
+    async def _try_expand_devices(
+        self, devices: list[dict], rediscover: bool = False, fresh: bool = False
+    ) -> list[dict]:
         """
         Attempt to expand the device list with alternate type filters.
 
+        Candidates are fetched concurrently and merged in candidate order. Endpoints
+        that returned nothing on the last full probe are skipped until the capability
+        cache entry expires.
+
         Args:
             devices: Existing device list.
+            rediscover: Probe every candidate regardless of cached capabilities.
+            fresh: Fetch from the network instead of serving cached responses.
 
         Returns:
             Expanded device list with duplicates removed.
         """
         expanded = list(devices)
-        candidates: list[tuple[str, dict | None]] = [
-            ("token/device/union/list/sorted", {"type": "FEEDER"}),
-            ("token/device/union/list/sorted", {"type": "ALL"}),
-            ("token/device/feeder/list", None),
-            ("token/device/feeder/list/sorted", None),
-            ("token/device/list", {"type": "NONE", "current": 1, "size": 100}),
-        ]
-        for api, params in candidates:
-            extra = self._fetch_device_list(api, params)
+        candidates, full_probe = self._expand_candidates(rediscover)
+        results = list(
+            await asyncio.gather(
+                *(self._fetch_device_list(api, params, fresh) for api, params in candidates)
+            )
+        )
+        if full_probe:
+            self._record_capabilities(candidates, results)
+        for extra in results:
             if extra:
                 expanded = _merge_devices(expanded, extra)
         return expanded
 
-    def _fetch_device_list(self, api: str, params: dict | None = None) -> list[dict]:
+    async def _fetch_device_list(
+        self, api: str, params: dict | None = None, fresh: bool = False
+    ) -> list[dict] | None:
         """
         Fetch device data from a list endpoint, expanding IDs when needed.
 
         Args:
             api: API path for device listing.
             params: Optional query parameters.
+            fresh: Fetch from the network instead of serving cached responses.
 
         Returns:
-            List of device info dictionaries.
+            List of device info dictionaries; empty if the endpoint does not exist,
+            None if the request failed.
         """
         try:
-            rsp = self._request_with_reauth(api, params)
+            rsp = await self._request_with_reauth(api, params, fresh=fresh)
             self._check_response(rsp)
-        except (CatLinkAPIError, httpx.HTTPError):
-            return []
+        except CatLinkAPIError as exc:
+            return [] if exc.code == httpx.codes.NOT_FOUND else None
+        except (httpx.HTTPError, ValueError):
+            return None
         data = rsp.get("data") or {}
         devices, ids = _extract_devices_or_ids(data)
         if devices:
             return devices
         if ids:
-            return self._fetch_devices_by_ids(ids)
+            return await self._fetch_devices_by_ids(ids, fresh)
         return []
 
-    def _fetch_devices_by_ids(self, device_ids: list[str]) -> list[dict]:
+    async def _fetch_devices_by_ids(self, device_ids: list[str], fresh: bool = False) -> list[dict]:
         """
-        Fetch device info for a list of IDs.
+        Fetch device info for a list of IDs concurrently, preserving order.
 
         Args:
             device_ids: Device identifier list.
+            fresh: Fetch from the network instead of serving cached responses.
 
         Returns:
             List of device info dictionaries.
         """
-        devices: list[dict] = []
-        for device_id in device_ids:
-            info = self._fetch_device_info(device_id)
-            if info:
-                devices.append(info)
-        return devices
+        infos = await asyncio.gather(
+            *(self._fetch_device_info(device_id, fresh) for device_id in device_ids)
+        )
+        return [info for info in infos if info]
 
-    def _fetch_device_info(self, device_id: str) -> dict:
+    async def _fetch_device_info(self, device_id: str, fresh: bool = False) -> dict:
         """
         Fetch device info for a single device ID.
 
         Args:
             device_id: Device identifier.
+            fresh: Fetch from the network instead of serving cached responses.
 
         Returns:
             Device info dictionary.
         """
         try:
-            rsp = self._request_with_reauth("token/device/info", {"deviceId": device_id})
+            rsp = await self._request_with_reauth(
+                "token/device/info", {"deviceId": device_id}, fresh=fresh
+            )
             self._check_response(rsp)
         except (CatLinkAPIError, httpx.HTTPError):
             return {}
         data = rsp.get("data") or {}
         return data.get("deviceInfo") or data
 
-    def get_device_detail(self, device_id: str, device_type: str) -> dict:
-        """Get detailed info for a device."""
-        api_map = {
-            "SCOOPER": "token/device/info",
-            "LITTER_BOX_599": "token/litterbox/info",
-            "C08": "token/litterbox/info/c08",
-            "FEEDER": "token/device/feeder/detail",
-            "PUREPRO": "token/device/purepro/detail",
-        }
-        api = api_map.get(device_type, "token/device/info")
-        rsp = self._request_with_reauth(api, {"deviceId": device_id})
+    async def get_device_detail(
+        self, device_id: str, device_type: str, fresh: bool = False
+    ) -> dict:
+        """Get detailed info for a device, bypassing cached responses if fresh."""
+        api = _DETAIL_APIS.get(device_type, "token/device/info")
+        rsp = await self._request_with_reauth(api, {"deviceId": device_id}, fresh=fresh)
         self._check_response(rsp)
         return rsp.get("data", {}).get("deviceInfo") or rsp.get("data", {})
 
-    def change_mode(self, device_id: str, mode_code: str, device_type: str) -> dict:
+    async def change_mode(self, device_id: str, mode_code: str, device_type: str) -> dict:
         """Change the device working mode."""
         if device_type == "LITTER_BOX_599":
             api = "token/litterbox/changeMode"
         else:
             api = "token/device/changeMode"
         pms = {"workModel": mode_code, "deviceId": device_id}
-        rsp = self.request(api, pms, "POST")
+        rsp = await self.request(api, pms, "POST")
         self._check_response(rsp)
+        self._invalidate_device(device_id)
         return rsp
 
-    def send_action(self, device_id: str, action_code: str, device_type: str) -> dict:
+    async def send_action(self, device_id: str, action_code: str, device_type: str) -> dict:
         """Send an action command to the device."""
         if device_type == "LITTER_BOX_599":
             api = "token/litterbox/actionCmd"
         else:
             api = "token/device/actionCmd"
         pms = {"cmd": action_code, "deviceId": device_id}
-        rsp = self.request(api, pms, "POST")
+        rsp = await self.request(api, pms, "POST")
         self._check_response(rsp)
+        self._invalidate_device(device_id)
         return rsp
 
-    def get_device_logs(self, device_id: str, device_type: str) -> list[dict]:
+    async def get_device_logs(self, device_id: str, device_type: str) -> list[dict]:
         """Get recent device logs."""
-        api_map = {
-            "SCOOPER": "token/device/scooper/stats/log/top5",
-            "LITTER_BOX_599": "token/litterbox/stats/log/top5",
-            "FEEDER": "token/device/feeder/stats/log/top5",
-            "PUREPRO": "token/device/purepro/stats/log/top5",
-        }
-        api = api_map.get(device_type, "token/device/union/logs")
-        rsp = self._request_with_reauth(api, {"deviceId": device_id})
+        api = _LOG_APIS.get(device_type, "token/device/union/logs")
+        rsp = await self._request_with_reauth(api, {"deviceId": device_id})
         self._check_response(rsp)
-        data = rsp.get("data", {})
-        return (
-            data.get("scooperLogTop5")
-            or data.get("feederLogTop5")
-            or data.get("pureLogTop5")
-            or data.get("logs")
-            or data.get("list")
-            or []
-        )
+        return _extract_logs(rsp.get("data", {}))
 
-    def replace_garbage_bag(self, device_id: str, enable: bool = True) -> dict:
+    async def get_device_log_page(
+        self,
+        device_id: str,
+        device_type: str,
+        page: int,
+        since_ms: int,
+        until_ms: int,
+        size: int = LOG_PAGE_SIZE,
+    ) -> tuple[list[dict], int]:
+        """Get one page of device log history between two epoch-millisecond times."""
+        api = _LOG_HISTORY_APIS.get(device_type, "token/device/union/logs/page")
+        pms = _log_page_params(device_id, page, since_ms, until_ms, size)
+        try:
+            rsp = await self._request_with_reauth(api, pms)
+        except (CatLinkAPIError, ValueError) as exc:
+            unavailable = _history_unavailable(device_type, exc)
+            if unavailable is None:
+                raise
+            raise unavailable from exc
+        self._check_response(rsp)
+        return _extract_log_page(rsp.get("data") or {}, page, size)
+
+    async def replace_garbage_bag(self, device_id: str, enable: bool = True) -> dict:
         """Trigger garbage bag replacement on a LitterBox."""
         api = "token/litterbox/replaceGarbageBagCmd"
         pms = {"enable": "1" if enable else "0", "deviceId": device_id}
-        rsp = self.request(api, pms, "POST")
+        rsp = await self.request(api, pms, "POST")
         self._check_response(rsp)
+        self._invalidate_device(device_id)
         return rsp
 
-    def reset_consumable(self, device_id: str, device_type: str, consumable_type: str) -> dict:
+    async def reset_consumable(
+        self, device_id: str, device_type: str, consumable_type: str
+    ) -> dict:
         """Reset a consumable counter (CAT_LITTER or DEODORIZER_02)."""
         api = "token/device/union/consumableReset"
         pms = {
@@ -465,69 +1619,61 @@ class CatLinkAPI:
             "deviceId": device_id,
             "deviceType": device_type,
         }
-        rsp = self.request(api, pms, "POST")
+        rsp = await self.request(api, pms, "POST")
         self._check_response(rsp)
+        self._invalidate_device(device_id)
         return rsp
 
-    def food_out(self, device_id: str, portions: int = 5) -> dict:
+    async def food_out(self, device_id: str, portions: int = 5) -> dict:
         """Manually dispense food from a feeder."""
         pms = {"footOutNum": portions, "deviceId": device_id}
-        rsp = self.request("token/device/feeder/foodOut", pms, "POST")
+        rsp = await self.request("token/device/feeder/foodOut", pms, "POST")
         self._check_response(rsp)
+        self._invalidate_device(device_id)
         return rsp
 
-    def get_cats(self, timezone_id: str | None = None) -> list[dict]:
-        """Get the list of cats."""
+    async def get_cats(self, timezone_id: str | None = None, fresh: bool = False) -> list[dict]:
+        """Get the list of cats, bypassing cached responses if fresh."""
         pms: dict[str, str] = {}
         if timezone_id:
             pms["timezoneId"] = timezone_id
-        rsp = self._request_with_reauth("token/pet/health/v3/cats", pms or None)
+        rsp = await self._request_with_reauth("token/pet/health/v3/cats", pms or None, fresh=fresh)
         self._check_response(rsp)
         return rsp.get("data", {}).get("cats") or []
 
-    def get_cat_summary(self, pet_id: str, date: str, timezone_id: str | None = None) -> dict:
+    async def get_cat_summary(self, pet_id: str, date: str, timezone_id: str | None = None) -> dict:
         """Get a cat's health summary for a given date."""
         pms: dict[str, str | int] = {"petId": pet_id, "date": date, "sport": 1}
         if timezone_id:
             pms["timezoneId"] = timezone_id
-        rsp = self._request_with_reauth("token/pet/health/v3/summarySimple", pms)
+        rsp = await self._request_with_reauth("token/pet/health/v3/summarySimple", pms)
         self._check_response(rsp)
         return rsp.get("data") or {}
 
 
-def save_credentials(
-    token: str, phone: str, phone_iac: str, api_base: str, verify: bool = True
-) -> None:
-    """
-    Persist authentication credentials in the system keyring.
+_profiles_lock = threading.RLock()
+_profiles_cache: dict | None = None
 
-    Args:
-        token: Authentication token.
-        phone: Phone number used to authenticate.
-        phone_iac: Country calling code used to authenticate.
-        api_base: API base URL for the region.
-        verify: Whether SSL certificate verification is enabled.
+_LEGACY_KEYS = (
+    KEYRING_TOKEN_KEY,
+    KEYRING_PHONE_KEY,
+    KEYRING_IAC_KEY,
+    KEYRING_API_BASE_KEY,
+    KEYRING_VERIFY_KEY,
+    KEYRING_TOKEN_TIME_KEY,
+)
 
-    Returns:
-        None.
-    """
-    keyring.set_password(KEYRING_SERVICE, KEYRING_TOKEN_KEY, token)
-    keyring.set_password(KEYRING_SERVICE, KEYRING_PHONE_KEY, phone)
-    keyring.set_password(KEYRING_SERVICE, KEYRING_IAC_KEY, phone_iac)
-    keyring.set_password(KEYRING_SERVICE, KEYRING_API_BASE_KEY, api_base)
-    keyring.set_password(KEYRING_SERVICE, KEYRING_VERIFY_KEY, str(verify))
-    region = _region_from_api_base(api_base)
-    if region:
-        keyring.set_password(KEYRING_SERVICE, _region_key(KEYRING_TOKEN_KEY, region), token)
-        keyring.set_password(KEYRING_SERVICE, _region_key(KEYRING_PHONE_KEY, region), phone)
-        keyring.set_password(KEYRING_SERVICE, _region_key(KEYRING_IAC_KEY, region), phone_iac)
-        keyring.set_password(KEYRING_SERVICE, _region_key(KEYRING_API_BASE_KEY, region), api_base)
-        keyring.set_password(KEYRING_SERVICE, _region_key(KEYRING_VERIFY_KEY, region), str(verify))
+
+def _issued_at(value: str | None) -> float | None:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
 
 
-def _load_credentials_for_region(region: str) -> dict | None:
+def _read_keyring_region(region: str) -> dict | None:
     """
-    Load stored credentials for a specific region.
+    Read credentials for a region from the per-key keyring layout.
 
     Args:
         region: Region identifier.
@@ -558,12 +1704,15 @@ def _load_credentials_for_region(region: str) -> dict | None:
         )
         or API_SERVERS.get(region, DEFAULT_API_BASE),
         "verify": verify_str != "False" if verify_str is not None else True,
+        "issued_at": _issued_at(
+            keyring.get_password(KEYRING_SERVICE, _region_key(KEYRING_TOKEN_TIME_KEY, region))
+        ),
     }
 
 
-def _load_legacy_credentials() -> dict | None:
+def _read_keyring_legacy() -> dict | None:
     """
-    Load legacy (non-region-scoped) credentials.
+    Read legacy (non-region-scoped) credentials from the per-key keyring layout.
 
     Returns:
         Stored credential dictionary, or None if missing.
@@ -579,9 +1728,170 @@ def _load_legacy_credentials() -> dict | None:
         "phone_iac": keyring.get_password(KEYRING_SERVICE, KEYRING_IAC_KEY) or "86",
         "api_base": api_base,
         "verify": verify_str != "False" if verify_str is not None else True,
+        "issued_at": _issued_at(keyring.get_password(KEYRING_SERVICE, KEYRING_TOKEN_TIME_KEY)),
     }
 
 
+def _delete_keys(keys: Iterable[str]) -> None:
+    for key in keys:
+        try:
+            keyring.delete_password(KEYRING_SERVICE, key)
+        except keyring.errors.PasswordDeleteError:
+            pass
+
+
+def _migrate_keyring_layout() -> dict:
+    """
+    Convert credentials stored one value per keyring entry into a profiles blob.
+
+    The old entries are removed once the blob has been written.
+
+    Returns:
+        Profiles dictionary, empty if nothing was stored.
+    """
+    profiles: dict[str, dict] = {}
+    for region in API_SERVERS:
+        creds = _read_keyring_region(region)
+        if creds:
+            profiles[region] = creds
+    legacy = _read_keyring_legacy()
+    default = None
+    if legacy:
+        default = _region_from_api_base(legacy["api_base"]) or "default"
+        profiles.setdefault(default, legacy)
+    if not profiles:
+        return {}
+    data = {"default": default or next(iter(profiles)), "profiles": profiles}
+    _write_profiles(data)
+    region_keys = [_region_key(key, region) for region in API_SERVERS for key in _LEGACY_KEYS]
+    _delete_keys([*region_keys, *_LEGACY_KEYS])
+    return data
+
+
+def _read_profiles() -> dict:
+    """
+    Return all stored credential profiles, reading the keyring once per process.
+
+    Returns:
+        Dictionary with "default" (region name) and "profiles" (region name to
+        credential dictionary), or an empty dictionary.
+    """
+    global _profiles_cache
+    with _profiles_lock:
+        if _profiles_cache is None:
+            raw = keyring.get_password(KEYRING_SERVICE, KEYRING_PROFILES_KEY)
+            data: dict = {}
+            if raw:
+                try:
+                    data = json.loads(raw)
+                except ValueError:
+                    logger.warning("Ignoring unreadable credentials in the keyring")
+            else:
+                data = _migrate_keyring_layout()
+            _profiles_cache = data if isinstance(data.get("profiles"), dict) else {}
+        return _profiles_cache
+
+
+def _write_profiles(data: dict) -> None:
+    """
+    Store all credential profiles as one keyring secret and cache them.
+
+    Args:
+        data: Profiles dictionary as returned by _read_profiles.
+
+    Returns:
+        None.
+    """
+    global _profiles_cache
+    with _profiles_lock:
+        if data.get("profiles"):
+            keyring.set_password(KEYRING_SERVICE, KEYRING_PROFILES_KEY, json.dumps(data))
+        else:
+            _delete_keys([KEYRING_PROFILES_KEY])
+            data = {}
+        _profiles_cache = data
+
+
+def invalidate_credential_cache() -> None:
+    """
+    Forget credentials cached in this process so the keyring is read again.
+
+    Long-running processes call this when another process may have changed
+    the stored credentials.
+
+    Returns:
+        None.
+    """
+    global _profiles_cache
+    with _profiles_lock:
+        _profiles_cache = None
+
+
+def save_credentials(
+    token: str, phone: str, phone_iac: str, api_base: str, verify: bool = True
+) -> None:
+    """
+    Persist authentication credentials in the system keyring.
+
+    Args:
+        token: Authentication token.
+        phone: Phone number used to authenticate.
+        phone_iac: Country calling code used to authenticate.
+        api_base: API base URL for the region.
+        verify: Whether SSL certificate verification is enabled.
+
+    Returns:
+        None.
+    """
+    region = _region_from_api_base(api_base) or "default"
+    with _profiles_lock:
+        data = _read_profiles()
+        profiles = dict(data.get("profiles", {}))
+        profiles[region] = {
+            "token": token,
+            "phone": phone,
+            "phone_iac": phone_iac,
+            "api_base": api_base,
+            "verify": verify,
+            "issued_at": time.time(),
+        }
+        _write_profiles({"default": region, "profiles": profiles})
+
+
+def _store_refreshed_token(api_base: str, token: str) -> None:
+    """
+    Replace the stored token for a region after a re-login.
+
+    Args:
+        api_base: API base URL of the client that logged in again.
+        token: New authentication token.
+
+    Returns:
+        None.
+    """
+    with _profiles_lock:
+        data = _read_profiles()
+        profiles = dict(data.get("profiles", {}))
+        for region, creds in profiles.items():
+            if creds.get("api_base") == api_base:
+                profiles[region] = {**creds, "token": token, "issued_at": time.time()}
+        _write_profiles({**data, "profiles": profiles})
+
+
+def _load_credentials_for_region(region: str) -> dict | None:
+    """
+    Load stored credentials for a specific region.
+
+    Args:
+        region: Region identifier.
+
+    Returns:
+        Stored credential dictionary, or None if missing.
+    """
+    creds = _read_profiles().get("profiles", {}).get(region)
+    return dict(creds) if creds else None
+
+
 def _load_credentials(*, region: str | None = None) -> dict | None:
     """
     Load stored credentials from the system keyring.
@@ -594,14 +1904,12 @@ def _load_credentials(*, region: str | None = None) -> dict | None:
     """
     if region:
         return _load_credentials_for_region(region)
-    api_base = keyring.get_password(KEYRING_SERVICE, KEYRING_API_BASE_KEY)
-    if api_base:
-        region_name = _region_from_api_base(api_base)
-        if region_name:
-            creds = _load_credentials_for_region(region_name)
-            if creds:
-                return creds
-    return _load_legacy_credentials()
+    data = _read_profiles()
+    profiles = data.get("profiles", {})
+    default = data.get("default")
+    if default in profiles:
+        return dict(profiles[default])
+    return dict(next(iter(profiles.values()))) if profiles else None
 
 
 def _load_all_credentials() -> list[tuple[str, dict]]:
@@ -609,20 +1917,12 @@ def _load_all_credentials() -> list[tuple[str, dict]]:
     Load credentials for all regions that have stored tokens.
 
     Returns:
-        List of (region, credential dict) tuples.
+        List of (region, credential dict) tuples, in API_SERVERS order.
     """
-    creds: list[tuple[str, dict]] = []
-    for region in API_SERVERS:
-        region_creds = _load_credentials_for_region(region)
-        if region_creds:
-            creds.append((region, region_creds))
-    if creds:
-        return creds
-    legacy = _load_legacy_credentials()
-    if legacy:
-        region_name = _region_from_api_base(legacy["api_base"]) or "default"
-        return [(region_name, legacy)]
-    return []
+    profiles = _read_profiles().get("profiles", {})
+    order = {region: index for index, region in enumerate(API_SERVERS)}
+    names = sorted(profiles, key=lambda name: order.get(name, len(order)))
+    return [(name, dict(profiles[name])) for name in names]
 
 
 def clear_credentials() -> None:
@@ -632,19 +1932,9 @@ def clear_credentials() -> None:
     Returns:
         None.
     """
-    for region in API_SERVERS:
-        clear_credentials_for_region(region)
-    for key in (
-        KEYRING_TOKEN_KEY,
-        KEYRING_PHONE_KEY,
-        KEYRING_IAC_KEY,
-        KEYRING_API_BASE_KEY,
-        KEYRING_VERIFY_KEY,
-    ):
-        try:
-            keyring.delete_password(KEYRING_SERVICE, key)
-        except keyring.errors.PasswordDeleteError:
-            pass
+    with _profiles_lock:
+        _read_profiles()
+        _write_profiles({})
 
 
 def clear_credentials_for_region(region: str) -> None:
@@ -657,30 +1947,15 @@ def clear_credentials_for_region(region: str) -> None:
     Returns:
         None.
     """
-    for key in (
-        _region_key(KEYRING_TOKEN_KEY, region),
-        _region_key(KEYRING_PHONE_KEY, region),
-        _region_key(KEYRING_IAC_KEY, region),
-        _region_key(KEYRING_API_BASE_KEY, region),
-        _region_key(KEYRING_VERIFY_KEY, region),
-    ):
-        try:
-            keyring.delete_password(KEYRING_SERVICE, key)
-        except keyring.errors.PasswordDeleteError:
-            pass
-    api_base = keyring.get_password(KEYRING_SERVICE, KEYRING_API_BASE_KEY)
-    if api_base and _region_from_api_base(api_base) == region:
-        for key in (
-            KEYRING_TOKEN_KEY,
-            KEYRING_PHONE_KEY,
-            KEYRING_IAC_KEY,
-            KEYRING_API_BASE_KEY,
-            KEYRING_VERIFY_KEY,
-        ):
-            try:
-                keyring.delete_password(KEYRING_SERVICE, key)
-            except keyring.errors.PasswordDeleteError:
-                pass
+    with _profiles_lock:
+        data = _read_profiles()
+        profiles = {
+            name: creds for name, creds in data.get("profiles", {}).items() if name != region
+        }
+        default = data.get("default")
+        if default not in profiles:
+            default = next(iter(profiles), None)
+        _write_profiles({"default": default, "profiles": profiles})
 
 
 def get_system_timezone() -> str:
@@ -695,12 +1970,83 @@ def get_system_timezone() -> str:
     return "UTC"
 
 
-def get_authenticated_client(*, region: str | None = None) -> CatLinkAPI:
+def _client_from_credentials(
+    creds: dict,
+    capabilities: CapabilityCache | None,
+    registry: DeviceRegistry | None,
+    response_cache: ResponseCache | None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> CatLinkAPI:
+    """
+    Build a client from a stored credential dictionary.
+
+    Args:
+        creds: Credential dictionary as returned by _load_credentials.
+        capabilities: Shared endpoint capability cache.
+        registry: Shared device registry.
+        response_cache: Shared response cache.
+        max_concurrency: Maximum concurrent requests the client may have in flight.
+
+    Returns:
+        CatLinkAPI client.
+    """
+    account = f"{creds['phone_iac']}:{creds['phone']}" if creds.get("phone") else None
+    client = CatLinkAPI(
+        api_base=creds["api_base"],
+        token=creds["token"],
+        verify=creds["verify"],
+        account=account,
+        capabilities=capabilities,
+        registry=registry,
+        response_cache=response_cache,
+        max_concurrency=max_concurrency,
+    )
+    client.token_issued_at = creds.get("issued_at")
+    return client
+
+
+def keep_tokens_fresh(
+    clients: Callable[[], Iterable[CatLinkAPI]],
+    stop: threading.Event,
+    period: float = TOKEN_CHECK_PERIOD,
+) -> threading.Thread:
+    """
+    Start a background thread that keeps client tokens valid for long-running modes.
+
+    Every period seconds each client's token is refreshed if it is old, or
+    probed if no request has confirmed it recently.
+
+    Args:
+        clients: Function returning the clients to look after.
+        stop: Event that ends the thread.
+        period: Seconds between checks.
+
+    Returns:
+        The started thread.
+    """
+
+    def run() -> None:
+        while not stop.wait(period):
+            for client in clients():
+                try:
+                    client.ensure_token()
+                except (CatLinkAPIError, httpx.HTTPError) as exc:
+                    logger.warning("Token refresh for %s failed: %s", client.api_base, exc)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def get_authenticated_client(
+    *, region: str | None = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> CatLinkAPI:
     """
     Return a CatLinkAPI client using stored credentials, or raise.
 
     Args:
         region: Optional region identifier to select region-scoped credentials.
+        max_concurrency: Maximum concurrent requests the client may have in flight.
 
     Returns:
         Authenticated CatLinkAPI client.
@@ -708,34 +2054,38 @@ def get_authenticated_client(*, region: str | None = None) -> CatLinkAPI:
     creds = _load_credentials(region=region)
     if not creds:
         raise CatLinkAPIError("Not logged in. Run 'catlink login' first.")
-    return CatLinkAPI(api_base=creds["api_base"], token=creds["token"], verify=creds["verify"])
+    return _client_from_credentials(
+        creds, CapabilityCache(), DeviceRegistry(), ResponseCache(), max_concurrency
+    )
 
 
-def get_authenticated_clients(*, region: str | None = None) -> list[tuple[str, CatLinkAPI]]:
+def get_authenticated_clients(
+    *, region: str | None = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> list[tuple[str, CatLinkAPI]]:
     """
     Return CatLinkAPI clients for one or more regions.
 
     Args:
         region: Optional region identifier to select a single region client.
+        max_concurrency: Maximum concurrent requests each client may have in flight.
 
     Returns:
         List of (region, CatLinkAPI) tuples.
     """
     if region:
-        return [(region, get_authenticated_client(region=region))]
+        return [(region, get_authenticated_client(region=region, max_concurrency=max_concurrency))]
     creds_list = _load_all_credentials()
     if not creds_list:
         raise CatLinkAPIError("Not logged in. Run 'catlink login' first.")
-    clients: list[tuple[str, CatLinkAPI]] = []
-    for region_name, creds in creds_list:
-        clients.append(
-            (
-                region_name,
-                CatLinkAPI(
-                    api_base=creds["api_base"],
-                    token=creds["token"],
-                    verify=creds["verify"],
-                ),
-            )
+    capabilities = CapabilityCache()
+    registry = DeviceRegistry()
+    response_cache = ResponseCache()
+    return [
+        (
+            region_name,
+            _client_from_credentials(
+                creds, capabilities, registry, response_cache, max_concurrency
+            ),
         )
-    return clients
+        for region_name, creds in creds_list
+    ]
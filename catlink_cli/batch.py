@@ -0,0 +1,349 @@
+"""Scripted device commands for 'catlink batch'."""
+
+import shlex
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import httpx
+
+from .api import CatLinkAPI, CatLinkAPIError
+from .cache import DeviceRegistry
+from .const import (
+    ACTION_TYPES,
+    BAG_TYPES,
+    DEFAULT_MAX_CONCURRENCY,
+    DEVICE_ACTIONS,
+    DEVICE_MODES,
+    FEED_TYPES,
+)
+from .models import Device
+
+# Command name -> (positional arguments after DEVICE_ID, accepted options, device
+# types the command supports).
+BATCH_COMMANDS: dict[str, tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]] = {
+    "clean": ((), ("--type",), ACTION_TYPES),
+    "pause": ((), ("--type",), ACTION_TYPES),
+    "mode": (("MODE",), ("--type",), ACTION_TYPES),
+    "action": (("ACTION",), ("--type",), ACTION_TYPES),
+    "feed": ((), ("--portions",), FEED_TYPES),
+    "reset-litter": ((), ("--type",), ACTION_TYPES),
+    "reset-deodorant": ((), ("--type",), ACTION_TYPES),
+    "change-bag": ((), (), BAG_TYPES),
+}
+
+
+class BatchError(Exception):
+    """A batch line that cannot be parsed or run."""
+
+
+@dataclass(slots=True, frozen=True)
+class BatchStep:
+    """One parsed line of a batch script."""
+
+    line: int
+    text: str
+    command: str
+    device_id: str
+    args: tuple[str, ...] = ()
+    device_type: str | None = None
+    portions: int = 5
+
+
+@dataclass(slots=True, frozen=True)
+class BatchResult:
+    """Outcome of one batch step."""
+
+    step: BatchStep
+    region: str | None
+    message: str
+    ok: bool
+
+
+def parse_step(line: int, text: str) -> BatchStep | None:
+    """
+    Parse one batch line such as "mode DEV2 auto" or "feed DEV3 --portions 2".
+
+    Args:
+        line: Line number, for error messages.
+        text: Line text. Blank lines and lines starting with '#' are skipped.
+
+    Returns:
+        Parsed step, or None for blank and comment lines.
+
+    Raises:
+        BatchError: If the command, its arguments or options are invalid.
+    """
+    try:
+        words = shlex.split(text, comments=True)
+    except ValueError as exc:
+        raise BatchError(f"line {line}: {exc}") from exc
+    if not words:
+        return None
+    command, *rest = words
+    if command not in BATCH_COMMANDS:
+        valid = ", ".join(BATCH_COMMANDS)
+        raise BatchError(f"line {line}: unknown command '{command}'. Valid commands: {valid}")
+    names, options, _ = BATCH_COMMANDS[command]
+    positional: list[str] = []
+    values: dict[str, str] = {}
+    while rest:
+        word = rest.pop(0)
+        if not word.startswith("--"):
+            positional.append(word)
+            continue
+        name, _, value = word.partition("=")
+        if name not in options:
+            raise BatchError(f"line {line}: {command} does not accept {name}")
+        if not value:
+            if not rest:
+                raise BatchError(f"line {line}: {name} requires a value")
+            value = rest.pop(0)
+        values[name] = value
+    usage = " ".join([command, "DEVICE_ID", *names])
+    if len(positional) != len(names) + 1:
+        raise BatchError(f"line {line}: usage: {usage}")
+    portions = 5
+    if "--portions" in values:
+        try:
+            portions = int(values["--portions"])
+        except ValueError:
+            portions = 0
+        if not 1 <= portions <= 10:
+            raise BatchError(f"line {line}: --portions must be between 1 and 10")
+    return BatchStep(
+        line=line,
+        text=" ".join(words),
+        command=command,
+        device_id=positional[0],
+        args=tuple(positional[1:]),
+        device_type=values.get("--type"),
+        portions=portions,
+    )
+
+
+def parse_script(lines: Iterable[str]) -> list[BatchStep]:
+    """
+    Parse a whole batch script, reporting every invalid line at once.
+
+    Args:
+        lines: Script lines.
+
+    Returns:
+        Steps in script order.
+
+    Raises:
+        BatchError: If any line is invalid; the message lists all of them.
+    """
+    steps: list[BatchStep] = []
+    problems: list[str] = []
+    for number, text in enumerate(lines, start=1):
+        try:
+            step = parse_step(number, text)
+        except BatchError as exc:
+            problems.append(str(exc))
+            continue
+        if step is not None:
+            steps.append(step)
+    if problems:
+        raise BatchError("\n".join(problems))
+    return steps
+
+
+def code_for(names: dict[str, str], name: str, kind: str) -> str:
+    """
+    Find the API code of a mode or action name.
+
+    Args:
+        names: Code -> name mapping, e.g. DEVICE_MODES[device_type].
+        name: Name given by the user.
+        kind: "mode" or "action", for the error message.
+
+    Returns:
+        The code.
+
+    Raises:
+        BatchError: If the name is not valid for the device type.
+    """
+    for code, value in names.items():
+        if value == name:
+            return code
+    valid = ", ".join(names.values())
+    raise BatchError(f"invalid {kind} '{name}'. Valid {kind}s: {valid}")
+
+
+def device_operation(
+    command: str,
+    device_id: str,
+    device_type: str,
+    args: tuple[str, ...] = (),
+    portions: int = 5,
+) -> tuple[Callable[[CatLinkAPI], object], str]:
+    """
+    Choose the client call and success message for a device command.
+
+    Args:
+        command: Command name, one of BATCH_COMMANDS.
+        device_id: Device identifier.
+        device_type: Resolved device type.
+        args: Positional arguments after the device ID (the mode or action).
+        portions: Portions for feed.
+
+    Returns:
+        Tuple of (call taking the client, message printed on success).
+
+    Raises:
+        BatchError: If the command does not apply to this device.
+    """
+    _, _, types = BATCH_COMMANDS[command]
+    if device_type not in types:
+        supported = ", ".join(types)
+        raise BatchError(f"device is a {device_type}; {command} supports {supported}")
+    dev = device_id
+    if command == "clean":
+        actions = DEVICE_ACTIONS.get(device_type, {})
+        code = next((k for k, v in actions.items() if v in ("start", "clean")), None)
+        if code is None:
+            raise BatchError("clean action not available for this device type")
+        return lambda c: c.send_action(dev, code, device_type), "Cleaning started."
+    if command == "pause":
+        return lambda c: c.send_action(dev, "00", device_type), "Device paused."
+    if command == "mode":
+        name = args[0]
+        code = code_for(DEVICE_MODES.get(device_type, {}), name, "mode")
+        return lambda c: c.change_mode(dev, code, device_type), f"Mode set to '{name}'."
+    if command == "action":
+        name = args[0]
+        code = code_for(DEVICE_ACTIONS.get(device_type, {}), name, "action")
+        return lambda c: c.send_action(dev, code, device_type), f"Action '{name}' sent."
+    if command == "feed":
+        return lambda c: c.food_out(dev, portions), f"Dispensing {portions} portion(s)."
+    if command == "reset-litter":
+        return (
+            lambda c: c.reset_consumable(dev, device_type, "CAT_LITTER"),
+            "Litter counter reset.",
+        )
+    if command == "reset-deodorant":
+        return (
+            lambda c: c.reset_consumable(dev, device_type, "DEODORIZER_02"),
+            "Deodorant counter reset.",
+        )
+    return lambda c: c.replace_garbage_bag(dev, enable=True), "Garbage bag change triggered."
+
+
+class BatchRunner:
+    """Run batch steps on shared clients: devices in parallel, each device in order."""
+
+    def __init__(
+        self,
+        clients: list[tuple[str, CatLinkAPI]],
+        concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        registry: DeviceRegistry | None = None,
+    ) -> None:
+        self.clients = clients
+        self.concurrency = concurrency
+        self.registry = registry or DeviceRegistry()
+
+    def resolve(self, device_ids: Iterable[str]) -> dict[str, tuple[str, str | None]]:
+        """
+        Find the region and type of each device.
+
+        The device registry is consulted first. Devices it does not know (or that
+        belong to a region without loaded credentials) are looked up with one
+        uncached device list per region.
+
+        Args:
+            device_ids: Device identifiers.
+
+        Returns:
+            Mapping of device ID to (region, device type) for devices that were
+            found.
+        """
+        regions = {name for name, _ in self.clients}
+        found: dict[str, tuple[str, str | None]] = {}
+        missing: set[str] = set()
+        for device_id in device_ids:
+            entry = self.registry.lookup(device_id)
+            if entry and entry["region"] in regions and entry.get("deviceType"):
+                found[device_id] = (entry["region"], entry["deviceType"])
+            else:
+                missing.add(device_id)
+        if not missing:
+            return found
+
+        def listing(client: CatLinkAPI) -> list[dict]:
+            cache_reads = client.cache_reads
+            client.cache_reads = False
+            try:
+                return client.get_devices()
+            except (CatLinkAPIError, httpx.HTTPError):
+                return []
+            finally:
+                client.cache_reads = cache_reads
+
+        with ThreadPoolExecutor(max_workers=len(self.clients)) as pool:
+            listings = list(pool.map(listing, [client for _, client in self.clients]))
+        for (region, _), devices in zip(self.clients, listings, strict=True):
+            for dev in devices:
+                device = Device.from_payload(dev)
+                if device.id in missing and device.id not in found:
+                    found[device.id] = (region, device.type or None)
+        return found
+
+    def _run_device(
+        self, steps: list[BatchStep], region: str | None, device_type: str | None
+    ) -> list[BatchResult]:
+        by_region = dict(self.clients)
+        results: list[BatchResult] = []
+        failed = False
+        for step in steps:
+            if region is None:
+                results.append(BatchResult(step, None, "device not found", False))
+                continue
+            if failed:
+                results.append(BatchResult(step, region, "skipped after an earlier failure", False))
+                continue
+            try:
+                call, message = device_operation(
+                    step.command,
+                    step.device_id,
+                    step.device_type or device_type or "SCOOPER",
+                    step.args,
+                    step.portions,
+                )
+                call(by_region[region])
+            except (BatchError, CatLinkAPIError, httpx.HTTPError) as exc:
+                results.append(BatchResult(step, region, str(exc), False))
+                failed = True
+                continue
+            results.append(BatchResult(step, region, message, True))
+        return results
+
+    def run(self, steps: list[BatchStep]) -> Iterator[BatchResult]:
+        """
+        Run steps and yield results as each device finishes a step sequence.
+
+        Steps for the same device run in script order. Once a step fails, the
+        device's later steps are skipped so that a sequence such as "reset-litter"
+        then "clean" never runs half-way.
+
+        Args:
+            steps: Parsed steps.
+
+        Returns:
+            Iterator of results, grouped per device in completion order.
+        """
+        by_device: dict[str, list[BatchStep]] = {}
+        for step in steps:
+            by_device.setdefault(step.device_id, []).append(step)
+        if not by_device:
+            return
+        located = self.resolve(by_device)
+        workers = min(self.concurrency, len(by_device))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures: list[Future[list[BatchResult]]] = [
+                pool.submit(self._run_device, device_steps, *located.get(device_id, (None, None)))
+                for device_id, device_steps in by_device.items()
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
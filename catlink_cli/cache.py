@@ -0,0 +1,501 @@
+"""On-disk caches for the CatLink CLI."""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+import time
+
+from .const import (
+    CACHE_DIR_ENV,
+    CAPABILITY_CACHE_TTL,
+    RESPONSE_CACHE_FLUSH_INTERVAL,
+    RESPONSE_CACHE_TTLS,
+    SUMMARY_CACHE_FLUSH_INTERVAL,
+)
+from .models import Device
+
+logger = logging.getLogger(__name__)
+
+
+def cache_dir() -> pathlib.Path:
+    """
+    Return the directory used for CatLink CLI cache files.
+
+    Returns:
+        Cache directory path (not necessarily existing yet).
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return pathlib.Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = pathlib.Path(xdg) if xdg else pathlib.Path.home() / ".cache"
+    return base / "catlink-cli"
+
+
+def account_key(account: str) -> str:
+    """
+    Hash an account identifier so phone numbers never appear in cache files.
+
+    Args:
+        account: Account identifier (e.g. "86:15551234567").
+
+    Returns:
+        Short hex digest identifying the account.
+    """
+    return hashlib.sha256(account.encode()).hexdigest()[:16]
+
+
+def read_json(path: pathlib.Path) -> dict:
+    """
+    Read a JSON object from disk, treating missing or corrupt files as empty.
+
+    Args:
+        path: File to read.
+
+    Returns:
+        Parsed dictionary, or an empty dictionary.
+    """
+    try:
+        data = json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.debug("Ignoring unreadable cache file %s: %s", path, exc)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_json(path: pathlib.Path, data: dict) -> None:
+    """
+    Atomically write a JSON object to disk.
+
+    Args:
+        path: Destination file.
+        data: Dictionary to serialize.
+
+    Returns:
+        None.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(fd, "w") as fh:
+            json.dump(data, fh, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("Could not write cache file %s: %s", path, exc)
+
+
+def endpoint_key(api: str, params: dict | None) -> str:
+    """
+    Build a stable key for an endpoint and its unsigned parameters.
+
+    Args:
+        api: API path.
+        params: Unsigned request parameters.
+
+    Returns:
+        Key string.
+    """
+    if not params:
+        return api
+    query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    return f"{api}?{query}"
+
+
+class CapabilityCache:
+    """Remember which fallback device-list endpoints return devices for an account."""
+
+    def __init__(self, path: pathlib.Path | None = None, ttl: float = CAPABILITY_CACHE_TTL) -> None:
+        self.path = path or cache_dir() / "capabilities.json"
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def get(self, account: str, region: str) -> list[str] | None:
+        """
+        Return the endpoints known to return devices.
+
+        Args:
+            account: Hashed account key.
+            region: Region name.
+
+        Returns:
+            List of endpoint keys, or None if unknown or expired.
+        """
+        with self._lock:
+            entry = read_json(self.path).get(f"{account}:{region}")
+        if not isinstance(entry, dict):
+            return None
+        if time.time() - entry.get("checked_at", 0) > self.ttl:
+            return None
+        endpoints = entry.get("endpoints")
+        return list(endpoints) if isinstance(endpoints, list) else None
+
+    def put(self, account: str, region: str, endpoints: list[str]) -> None:
+        """
+        Record the endpoints that returned devices after a full probe.
+
+        Args:
+            account: Hashed account key.
+            region: Region name.
+            endpoints: Endpoint keys that returned devices.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            data = read_json(self.path)
+            data[f"{account}:{region}"] = {"checked_at": time.time(), "endpoints": endpoints}
+            write_json(self.path, data)
+
+
+class DeviceRegistry:
+    """Map device IDs to the region, device type and model that own them."""
+
+    def __init__(self, path: pathlib.Path | None = None) -> None:
+        self.path = path or cache_dir() / "devices.json"
+        self._lock = threading.Lock()
+
+    def record(self, region: str, devices: list[dict], account: str | None = None) -> None:
+        """
+        Store the devices returned by a full device listing for a region.
+
+        Entries previously recorded for the same account and region that are no
+        longer listed are removed.
+
+        Args:
+            region: Region name the devices were listed from.
+            devices: Device dictionaries from get_devices.
+            account: Hashed account key, if known.
+
+        Returns:
+            None.
+        """
+        now = time.time()
+        listed: dict[str, dict] = {}
+        for dev in devices:
+            if not isinstance(dev, dict):
+                continue
+            dev_id = Device.from_payload(dev).id
+            if not dev_id:
+                continue
+            listed[dev_id] = {
+                "region": region,
+                "account": account,
+                "deviceType": dev.get("deviceType"),
+                "model": dev.get("model"),
+                "deviceName": dev.get("deviceName"),
+                "updated_at": now,
+            }
+        with self._lock:
+            data = read_json(self.path)
+            stale = [
+                dev_id
+                for dev_id, entry in data.items()
+                if isinstance(entry, dict)
+                and entry.get("region") == region
+                and entry.get("account") == account
+                and dev_id not in listed
+            ]
+            for dev_id in stale:
+                del data[dev_id]
+            data.update(listed)
+            write_json(self.path, data)
+
+    def lookup(self, device_id: str) -> dict | None:
+        """
+        Return the registry entry for a device.
+
+        Args:
+            device_id: Device identifier.
+
+        Returns:
+            Entry with region, deviceType, model and deviceName, or None.
+        """
+        with self._lock:
+            entry = read_json(self.path).get(str(device_id))
+        return entry if isinstance(entry, dict) and entry.get("region") else None
+
+    def forget(self, device_id: str) -> None:
+        """
+        Remove the entry for a device, e.g. when its recorded region is stale.
+
+        Args:
+            device_id: Device identifier.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            data = read_json(self.path)
+            if data.pop(str(device_id), None) is not None:
+                write_json(self.path, data)
+
+    def clear(self, region: str | None = None) -> None:
+        """
+        Remove all entries, or only those recorded for one region.
+
+        Args:
+            region: Region whose entries are removed; None removes every entry.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            data = read_json(self.path)
+            kept = {
+                dev_id: entry
+                for dev_id, entry in data.items()
+                if region is not None and isinstance(entry, dict) and entry.get("region") != region
+            }
+            if kept != data:
+                write_json(self.path, kept)
+
+    def entries(self) -> dict[str, dict]:
+        """
+        Return all registry entries keyed by device ID.
+
+        Returns:
+            Mapping of device ID to entry.
+        """
+        with self._lock:
+            data = read_json(self.path)
+        return {dev_id: entry for dev_id, entry in data.items() if isinstance(entry, dict)}
+
+
+class ResponseCache:
+    """
+    On-disk cache of read responses with per-endpoint fresh and stale lifetimes.
+
+    New responses are kept in memory and written by save(), which merges them
+    into the file's current contents so that entries and invalidations written
+    by other processes are kept. put() saves on its own once flush_interval
+    seconds have passed since the last save; clients save when they are closed.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path | None = None,
+        ttls: dict[str, tuple[float, float]] | None = None,
+        flush_interval: float = RESPONSE_CACHE_FLUSH_INTERVAL,
+    ) -> None:
+        self.path = path or cache_dir() / "responses.json"
+        self.ttls = RESPONSE_CACHE_TTLS if ttls is None else ttls
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._data: dict | None = None
+        self._pending: dict[str, dict] = {}
+        self._saved_at = time.monotonic()
+
+    def _entries(self) -> dict:
+        if self._data is None:
+            self._data = read_json(self.path)
+        return self._data
+
+    def _expired(self, entry: object, now: float) -> bool:
+        if not isinstance(entry, dict):
+            return True
+        return now - entry.get("stored_at", 0) > self.ttls.get(entry.get("api"), (0, 0))[1]
+
+    def cacheable(self, api: str) -> bool:
+        """
+        Check whether responses from an endpoint are cached.
+
+        Args:
+            api: API path.
+
+        Returns:
+            True if the endpoint has a configured lifetime.
+        """
+        return api in self.ttls
+
+    def get(self, key: str, api: str) -> tuple[dict, bool] | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key.
+            api: API path the key belongs to.
+
+        Returns:
+            Tuple of (response, stale), or None if missing or too old to serve.
+        """
+        fresh, stale = self.ttls.get(api, (0, 0))
+        with self._lock:
+            entry = self._entries().get(key)
+        if not isinstance(entry, dict):
+            return None
+        age = time.time() - entry.get("stored_at", 0)
+        if age > stale:
+            return None
+        return entry.get("response") or {}, age > fresh
+
+    def put(self, key: str, api: str, device_id: str | None, response: dict) -> None:
+        """
+        Store a response in memory; it reaches the disk with the next save.
+
+        Args:
+            key: Cache key.
+            api: API path the key belongs to.
+            device_id: Device the response describes, used for invalidation.
+            response: Response dictionary.
+
+        Returns:
+            None.
+        """
+        entry = {
+            "api": api,
+            "device_id": device_id,
+            "stored_at": time.time(),
+            "response": response,
+        }
+        with self._lock:
+            self._entries()[key] = entry
+            self._pending[key] = entry
+            if time.monotonic() - self._saved_at >= self.flush_interval:
+                self._write()
+
+    def invalidate_device(self, device_id: str) -> None:
+        """
+        Drop every cached response for a device, in memory and on disk.
+
+        Args:
+            device_id: Device identifier.
+
+        Returns:
+            None.
+        """
+        device_id = str(device_id)
+        with self._lock:
+            for entries in (self._entries(), self._pending):
+                for key in [
+                    k for k, entry in entries.items() if entry.get("device_id") == device_id
+                ]:
+                    del entries[key]
+            self._write(drop_device=device_id)
+
+    def save(self) -> None:
+        """
+        Merge responses stored since the last save into the cache file.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            if self._pending:
+                self._write()
+
+    def _write(self, drop_device: str | None = None) -> None:
+        """
+        Merge pending entries into the file's current contents and write it.
+
+        Must be called with the lock held. The newer of two entries for the same
+        key wins; expired entries and, if given, a device's entries are dropped.
+
+        Args:
+            drop_device: Device whose entries are removed from the file.
+
+        Returns:
+            None.
+        """
+        now = time.time()
+        merged = read_json(self.path)
+        for key, entry in self._pending.items():
+            current = merged.get(key)
+            if not isinstance(current, dict) or current.get("stored_at", 0) <= entry["stored_at"]:
+                merged[key] = entry
+        merged = {
+            key: entry
+            for key, entry in merged.items()
+            if not self._expired(entry, now)
+            and (drop_device is None or entry.get("device_id") != drop_device)
+        }
+        write_json(self.path, merged)
+        self._data = merged
+        self._pending.clear()
+        self._saved_at = time.monotonic()
+
+
+class SummaryCache:
+    """
+    Permanent on-disk cache of cat health summaries for days that are over.
+
+    put() saves on its own once flush_interval seconds have passed since the
+    last save, so an interrupted long range keeps most of what it fetched.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path | None = None,
+        flush_interval: float = SUMMARY_CACHE_FLUSH_INTERVAL,
+    ) -> None:
+        self.path = path or cache_dir() / "cat-summaries.json"
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._data: dict | None = None
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def _entries(self) -> dict:
+        if self._data is None:
+            self._data = read_json(self.path)
+        return self._data
+
+    def get(self, account: str, region: str, pet_id: str, date: str) -> dict | None:
+        """
+        Look up a stored summary.
+
+        Args:
+            account: Hashed account key.
+            region: Region name.
+            pet_id: Cat identifier.
+            date: Day in YYYY-MM-DD format.
+
+        Returns:
+            Summary dictionary, or None if not stored.
+        """
+        with self._lock:
+            entry = self._entries().get(f"{account}:{region}:{pet_id}:{date}")
+        return entry if isinstance(entry, dict) else None
+
+    def put(self, account: str, region: str, pet_id: str, date: str, summary: dict) -> None:
+        """
+        Remember a summary; it reaches the disk with the next save.
+
+        Only past days should be stored: their summaries no longer change.
+
+        Args:
+            account: Hashed account key.
+            region: Region name.
+            pet_id: Cat identifier.
+            date: Day in YYYY-MM-DD format.
+            summary: Summary dictionary.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            self._entries()[f"{account}:{region}:{pet_id}:{date}"] = summary
+            self._dirty = True
+            if time.monotonic() - self._saved_at >= self.flush_interval:
+                self._write()
+
+    def save(self) -> None:
+        """
+        Persist summaries added since the last save.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            if self._dirty:
+                self._write()
+
+    def _write(self) -> None:
+        write_json(self.path, self._entries())
+        self._dirty = False
+        self._saved_at = time.monotonic()
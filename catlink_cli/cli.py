@@ -1,25 +1,66 @@
 """CatLink CLI - Command-line interface for CatLink litter boxes."""
 
 import datetime
+import fnmatch
 import logging
+import pathlib
 import sys
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TextIO
 
 import click
+import httpx
 
 from .api import (
     CatLinkAPI,
     CatLinkAPIError,
     clear_credentials,
     clear_credentials_for_region,
+    fan_out,
     get_authenticated_clients,
     get_system_timezone,
+    keep_tokens_fresh,
     save_credentials,
 )
-from .const import API_SERVERS, DEVICE_ACTIONS, DEVICE_MODES, WORK_STATUSES
+from .batch import BatchError, BatchRunner, device_operation, parse_script
+from .cache import DeviceRegistry, SummaryCache, account_key
+from .const import (
+    ACTION_TYPES,
+    API_SERVERS,
+    BAG_TYPES,
+    DEFAULT_MAX_CONCURRENCY,
+    DEVICE_ACTIONS,
+    DEVICE_MODES,
+    FAN_OUT_TIMEOUT,
+    FEED_TYPES,
+    OUTPUT_FORMATS,
+    RECORD_INTERVAL,
+    STATS_WINDOW,
+    STATS_Z_THRESHOLD,
+    WATCH_MAX_INTERVAL,
+    WATCH_MIN_INTERVAL,
+    WORK_STATUSES,
+)
+from .daemon import DaemonServer, daemon_clients, notify_reload, send_command, socket_path
+from .exporter import FleetPoller, MetricsServer, parse_listen
+from .gateway import Gateway, GatewayServer
+from .history import ExportCursor, LogExport, log_csv_header, log_csv_row
+from .models import Cat, Device, FeederDetail, LitterBoxDetail, LogEntry, parse_detail
+from .output import OutputWriter
+from .stats import analyse, numpy_available
+from .store import STATUS_COLUMNS, HistoryStore, Recorder, default_db_path, format_timestamp
+from .top import curses_available, run_dashboard, terminal_attached
+from .watch import DeviceWatcher, WatchedDevice
+
+logger = logging.getLogger(__name__)
 
 _URL_TO_REGION = {url: name for name, url in API_SERVERS.items()}
 _REGION_CHOICES = list(API_SERVERS.keys())
+_STATUS_TYPES = ["SCOOPER", "LITTER_BOX_599", "C08", "FEEDER", "PUREPRO"]
+_LOG_TYPES = ["SCOOPER", "LITTER_BOX_599", "FEEDER", "PUREPRO"]
+_TIME_FORMATS = ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"]
 
 
 def _region_name_from_url(api_base: str) -> str:
@@ -44,20 +85,262 @@ def _region_option(func: Callable[..., object]) -> Callable[..., object]:
     )(func)
 
 
-def _load_clients(region: str | None) -> tuple[list[tuple[str, CatLinkAPI]], bool]:
+def _cli_setting[T](name: str, default: T) -> T:
+    """
+    Read a global option stored on the root Click context.
+
+    Args:
+        name: Setting name.
+        default: Value used outside a Click context or when unset.
+
+    Returns:
+        Setting value.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None or not isinstance(ctx.obj, dict):
+        return default
+    return ctx.obj.get(name, default)
+
+
+def _authenticated_clients(
+    region: str | None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> list[tuple[str, CatLinkAPI]]:
+    """
+    Build authenticated clients and apply global client settings.
+
+    Args:
+        region: Optional region identifier.
+        max_concurrency: Maximum concurrent requests per client.
+
+    Returns:
+        List of (region, client) tuples.
+    """
+    clients = None
+    if not _cli_setting("no_daemon", False):
+        clients = daemon_clients(region, _cli_setting("timeout", FAN_OUT_TIMEOUT))
+    if clients is None:
+        clients = get_authenticated_clients(region=region, max_concurrency=max_concurrency)
+    if _cli_setting("no_cache", False):
+        for _, client in clients:
+            client.cache_reads = False
+    return clients
+
+
+def _load_clients(
+    region: str | None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> tuple[list[tuple[str, CatLinkAPI]], bool]:
     """
     Load clients for one or more regions.
 
     Args:
         region: Optional region identifier.
+        max_concurrency: Maximum concurrent requests per client; commands with a
+            concurrency option pass it here so the option is the real limit.
 
     Returns:
         Tuple of clients and a flag indicating multiple regions.
     """
-    clients = get_authenticated_clients(region=region)
+    clients = _authenticated_clients(region, max_concurrency)
     return clients, len(clients) > 1
 
 
+def _keep_tokens_fresh(clients: list[tuple[str, CatLinkAPI]], stop: threading.Event) -> None:
+    """
+    Refresh tokens ahead of expiry while a long-running command is active.
+
+    Clients served by 'catlink daemon' are skipped; the daemon refreshes them.
+
+    Args:
+        clients: List of (region, client) tuples.
+        stop: Event set when the command ends.
+
+    Returns:
+        None.
+    """
+    direct = [client for _, client in clients if isinstance(client, CatLinkAPI)]
+    if direct:
+        keep_tokens_fresh(lambda: direct, stop)
+
+
+def _load_device_clients(
+    device_id: str, region: str | None, entry: dict | None = None
+) -> tuple[list[tuple[str, CatLinkAPI]], bool]:
+    """
+    Load the client for the region that owns a device.
+
+    The device registry filled by 'catlink devices' is consulted first, so the
+    command goes to one region instead of every stored region. Unknown devices
+    fall back to all regions; _fan_out_device retries the other regions when the
+    registry entry turns out to be stale.
+
+    Args:
+        device_id: Device identifier.
+        region: Optional region identifier that overrides the registry.
+        entry: Registry entry already looked up by the caller, if any.
+
+    Returns:
+        Tuple of clients and a flag indicating multiple regions.
+    """
+    if region is None:
+        entry = entry or DeviceRegistry().lookup(device_id)
+        if entry:
+            try:
+                return _authenticated_clients(entry["region"]), False
+            except CatLinkAPIError:
+                pass
+    return _load_clients(region)
+
+
+def _device_type_option(
+    choices: Sequence[str], selects: bool = False
+) -> Callable[[Callable[..., object]], object]:
+    """
+    Build an optional --type option for a device command.
+
+    Args:
+        choices: Device types the command supports.
+        selects: Whether the command also selects devices by type when DEVICE_ID
+            is omitted.
+
+    Returns:
+        Click option decorator.
+    """
+    help_text = "Device type. Detected from the device list when omitted."
+    if selects:
+        help_text += " With --all, --model or --name, selects only devices of this type."
+    return click.option(
+        "--type",
+        "device_type",
+        default=None,
+        type=click.Choice(choices),
+        help=help_text,
+    )
+
+
+def _fetch_devices_uncached(client: CatLinkAPI) -> list[dict]:
+    """
+    Fetch the device list from the network, bypassing cached responses.
+
+    Args:
+        client: Client to query.
+
+    Returns:
+        List of device dictionaries.
+    """
+    cache_reads = client.cache_reads
+    client.cache_reads = False
+    try:
+        return client.get_devices()
+    finally:
+        client.cache_reads = cache_reads
+
+
+def _find_device(clients: list[tuple[str, CatLinkAPI]], device_id: str) -> tuple[str, dict] | None:
+    """
+    Refresh the device list and find a device by ID.
+
+    Args:
+        clients: List of (region, client) tuples to search.
+        device_id: Device identifier.
+
+    Returns:
+        Tuple of (region, device dict), or None if no region lists the device.
+    """
+    errors: list[tuple[str, str]] = []
+    for region_name, _, devices in _fan_out(clients, _fetch_devices_uncached, errors):
+        for dev in devices:
+            if Device.from_payload(dev).id == str(device_id):
+                return region_name, dev
+    for region_name, err in errors:
+        logger.debug("Device lookup failed (%s): %s", region_name, err)
+    return None
+
+
+def _load_device_target(
+    device_id: str,
+    device_type: str | None,
+    region: str | None,
+    choices: Sequence[str],
+    default: str,
+) -> tuple[list[tuple[str, CatLinkAPI]], bool, str]:
+    """
+    Load clients for a device and resolve its type when --type was omitted.
+
+    The type comes from the device registry. For unknown IDs the device list is
+    refreshed once, which also narrows the clients to the owning region. If the
+    device still cannot be found, the command's historical default is used.
+
+    Args:
+        device_id: Device identifier.
+        device_type: Device type from --type, or None.
+        region: Optional region identifier.
+        choices: Device types the command supports.
+        default: Device type used when the device cannot be found.
+
+    Returns:
+        Tuple of clients, a flag indicating multiple regions, and the device type.
+    """
+    entry = DeviceRegistry().lookup(device_id)
+    clients, multi = _load_device_clients(device_id, region, entry)
+    if device_type is None:
+        if entry and entry.get("deviceType"):
+            device_type = entry["deviceType"]
+        else:
+            found = _find_device(clients, device_id)
+            if found:
+                owner, dev = found
+                device_type = dev.get("deviceType")
+                for region_name, client in clients:
+                    if region_name != owner:
+                        client.close()
+                clients = [(name, client) for name, client in clients if name == owner]
+                multi = False
+        device_type = device_type or default
+    if device_type not in choices:
+        for _, client in clients:
+            client.close()
+        supported = ", ".join(choices)
+        click.echo(
+            f"Error: device {device_id} is a {device_type}; this command supports {supported}.",
+            err=True,
+        )
+        sys.exit(1)
+    return clients, multi, device_type
+
+
+def _output_writer() -> OutputWriter:
+    """
+    Create a writer for the output format selected with 'catlink --output'.
+
+    Returns:
+        OutputWriter for stdout.
+    """
+    return OutputWriter(_cli_setting("output", "text"))
+
+
+def _write_sent(
+    out: OutputWriter, region: str, api_base: str, multi: bool, device_id: str, message: str
+) -> None:
+    """
+    Write the result of a command sent to one device.
+
+    Args:
+        out: Output writer of the command.
+        region: Region the command was sent to.
+        api_base: API base URL of the region.
+        multi: Whether multiple regions are active.
+        device_id: Device identifier.
+        message: Success message, e.g. "Cleaning started.".
+
+    Returns:
+        None.
+    """
+    if multi:
+        out.header(f"Region: {region} ({api_base})")
+    out.record({"region": region, "deviceId": device_id, "ok": True, "message": message}, message)
+    out.flush()
+
+
 def _echo_region_header(region: str, api_base: str, multi: bool) -> None:
     """
     Print a region header when multiple regions are active.
@@ -74,12 +357,192 @@ def _echo_region_header(region: str, api_base: str, multi: bool) -> None:
         click.echo(f"Region: {region} ({api_base})")
 
 
+def _fan_out[T](
+    clients: list[tuple[str, CatLinkAPI]],
+    call: Callable[[CatLinkAPI], T],
+    errors: list[tuple[str, str]],
+) -> Iterator[tuple[str, CatLinkAPI, T]]:
+    """
+    Run a per-region call on all clients at once.
+
+    Args:
+        clients: List of (region, client) tuples.
+        call: Function invoked with each client.
+        errors: List that collects (region, message) for failed regions.
+
+    Returns:
+        Iterator of (region, client, result) for each successful region, in
+        completion order.
+    """
+    timeout = _cli_setting("timeout", FAN_OUT_TIMEOUT)
+    by_region = dict(clients)
+    calls = [(region_name, lambda c=client: call(c)) for region_name, client in clients]
+    for region_name, result, exc in fan_out(calls, timeout=timeout):
+        if exc is None:
+            yield region_name, by_region[region_name], result
+        elif isinstance(exc, (CatLinkAPIError, httpx.HTTPError, TimeoutError)):
+            errors.append((region_name, str(exc)))
+        else:
+            raise exc
+
+
+def _stale_route(
+    device_id: str,
+    region: str | None,
+    clients: list[tuple[str, CatLinkAPI]],
+) -> bool:
+    """
+    Check whether a failed call was routed by a registry entry that is out of date.
+
+    Args:
+        device_id: Device identifier.
+        region: Region from --region, or None.
+        clients: Clients the call was sent to.
+
+    Returns:
+        True when the registry picked the only client's region and that region no
+        longer lists the device.
+    """
+    if region is not None or len(clients) != 1:
+        return False
+    entry = DeviceRegistry().lookup(device_id)
+    region_name, client = clients[0]
+    if not entry or entry["region"] != region_name:
+        return False
+    try:
+        devices = _fetch_devices_uncached(client)
+    except (CatLinkAPIError, httpx.HTTPError):
+        return False
+    return all(Device.from_payload(dev).id != str(device_id) for dev in devices)
+
+
+def _fan_out_device[T](
+    device_id: str,
+    region: str | None,
+    clients: list[tuple[str, CatLinkAPI]],
+    call: Callable[[CatLinkAPI], T],
+    errors: list[tuple[str, str]],
+) -> Iterator[tuple[str, CatLinkAPI, T]]:
+    """
+    Run a call for one device like _fan_out, retrying once on a stale registry entry.
+
+    When the registry routed the call to a region that rejects it and no longer
+    lists the device, the entry is dropped and the call is sent to the other
+    stored regions. Their clients are appended to clients so the caller closes
+    them.
+
+    Args:
+        device_id: Device identifier.
+        region: Region from --region, or None.
+        clients: List of (region, client) tuples from _load_device_clients.
+        call: Function invoked with each client.
+        errors: List that collects (region, message) for failed regions.
+
+    Returns:
+        Iterator of (region, client, result) for each successful region.
+    """
+    failed: list[tuple[str, str]] = []
+    yield from _fan_out(clients, call, failed)
+    if not failed or not _stale_route(device_id, region, clients):
+        errors.extend(failed)
+        return
+    DeviceRegistry().forget(device_id)
+    stale_region = clients[0][0]
+    try:
+        reloaded = _authenticated_clients(None)
+    except CatLinkAPIError:
+        errors.extend(failed)
+        return
+    others: list[tuple[str, CatLinkAPI]] = []
+    for region_name, client in reloaded:
+        if region_name == stale_region:
+            client.close()
+        else:
+            others.append((region_name, client))
+    clients.extend(others)
+    retried = 0
+    for result in _fan_out(others, call, errors):
+        retried += 1
+        yield result
+    if not retried:
+        errors.extend(failed)
+
+
+def _report_outcome(
+    errors: list[tuple[str, str]],
+    count: int,
+    clients: list[tuple[str, CatLinkAPI]],
+    empty_message: str | None = None,
+) -> None:
+    """
+    Print the error, empty-result, or warning summary for a command.
+
+    Args:
+        errors: Collected (region, message) errors.
+        count: Number of successful results.
+        clients: List of (region, client) tuples that were queried.
+        empty_message: Message for an empty result, or None when an empty result
+            is an error (e.g. for commands that change device state).
+
+    Returns:
+        None.
+    """
+    if count == 0:
+        if empty_message is None or (errors and len(errors) == len(clients)):
+            msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
+            click.echo(f"Error: {msg}", err=True)
+            sys.exit(1)
+        click.echo(empty_message, err=_cli_setting("output", "text") != "text")
+    if errors and count > 0:
+        for region_name, err in errors:
+            click.echo(f"Warning ({region_name}): {err}", err=True)
+
+
 @click.group()
 @click.option("-v", "--verbose", is_flag=True, help="Enable debug logging.")
-def cli(verbose: bool) -> None:
+@click.option(
+    "--timeout",
+    default=FAN_OUT_TIMEOUT,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Overall deadline in seconds for commands that query several regions.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Fetch fresh data instead of serving cached responses.",
+)
+@click.option(
+    "--no-daemon",
+    is_flag=True,
+    default=False,
+    help="Talk to the CatLink API directly even if 'catlink daemon' is running.",
+)
+@click.option(
+    "--output",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="text",
+    show_default=True,
+    help="Output format. 'ndjson' writes one JSON record per line as each region answers.",
+)
+@click.pass_context
+def cli(
+    ctx: click.Context,
+    verbose: bool,
+    timeout: float,
+    no_cache: bool,
+    no_daemon: bool,
+    output: str,
+) -> None:
     """CatLink CLI - manage your CatLink litter box from the terminal."""
     level = logging.DEBUG if verbose else logging.WARNING
     logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
+    settings = ctx.ensure_object(dict)
+    settings["timeout"] = timeout
+    settings["no_cache"] = no_cache
+    settings["no_daemon"] = no_daemon
+    settings["output"] = output
 
 
 @cli.command()
@@ -132,11 +595,13 @@ def login(phone: str, iac: str, password: str, region: str, no_verify: bool) ->
                     click.echo(f"  {region_name}: {api_base}")
             for region_name, err in errors:
                 click.echo(f"Warning ({region_name}): {err}", err=True)
+            notify_reload()
         else:
             api_base = API_SERVERS[region]
             client.api_base = api_base
             token = client.login(iac, phone, password)
             save_credentials(token, phone, iac, api_base, verify=verify)
+            notify_reload()
             region_name = _region_name_from_url(api_base)
             click.echo(f"Login successful. Connected to {region_name} ({api_base}).")
     except CatLinkAPIError as exc:
@@ -154,222 +619,630 @@ def login(phone: str, iac: str, password: str, region: str, no_verify: bool) ->
     help="Clear stored credentials for this region only.",
 )
 def logout(region: str | None) -> None:
-    """Clear stored credentials."""
+    """Clear stored credentials and the device registry."""
     if region:
         clear_credentials_for_region(region)
+        DeviceRegistry().clear(region)
         click.echo(f"Credentials cleared for region {region}.")
     else:
         clear_credentials()
+        DeviceRegistry().clear()
         click.echo("Credentials cleared.")
+    notify_reload()
+
+
+@cli.command()
+@click.option("--stop", is_flag=True, default=False, help="Stop a running daemon.")
+def daemon(stop: bool) -> None:
+    """Keep clients and caches warm for other commands."""
+    path = socket_path()
+    if stop:
+        try:
+            send_command("shutdown", path)
+        except OSError:
+            click.echo("Daemon is not running.", err=True)
+            sys.exit(1)
+        click.echo("Daemon stopped.")
+        return
+    try:
+        send_command("ping", path)
+    except OSError:
+        pass
+    else:
+        click.echo(f"Error: daemon already running on {path}", err=True)
+        sys.exit(1)
+    server = DaemonServer(path)
+    click.echo(f"Listening on {path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+@cli.command()
+@click.option(
+    "--listen",
+    default=":9877",
+    show_default=True,
+    help="Address to serve /metrics on, as [HOST]:PORT.",
+)
+@click.option(
+    "--interval",
+    default=60.0,
+    show_default=True,
+    type=click.FloatRange(min=1),
+    help="Seconds between polls of the CatLink API.",
+)
+@click.option(
+    "--concurrency",
+    default=DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Detail requests in flight at the same time per region.",
+)
+@_region_option
+def exporter(listen: str, interval: float, concurrency: int, region: str | None) -> None:
+    """Serve device metrics for Prometheus."""
+    try:
+        address = parse_listen(listen)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--listen") from exc
+    clients, _ = _load_clients(region, concurrency)
+    for _, client in clients:
+        client.cache_reads = False
+    poller = FleetPoller(
+        clients, interval, timeout=_cli_setting("timeout", FAN_OUT_TIMEOUT), concurrency=concurrency
+    )
+    stop = threading.Event()
+    try:
+        server = MetricsServer(address, poller)
+    except OSError as exc:
+        for _, client in clients:
+            client.close()
+        click.echo(f"Error: cannot listen on {listen}: {exc}", err=True)
+        sys.exit(1)
+    worker = threading.Thread(target=poller.run, args=(stop,), daemon=True)
+    worker.start()
+    _keep_tokens_fresh(clients, stop)
+    click.echo(f"Serving metrics on http://{address[0] or '0.0.0.0'}:{address[1]}/metrics")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+        worker.join(timeout=interval)
+        for _, client in clients:
+            client.close()
+
+
+@cli.command()
+@click.option(
+    "--listen",
+    default="127.0.0.1:8765",
+    show_default=True,
+    help="Address to serve the JSON API on, as [HOST]:PORT.",
+)
+@click.option(
+    "--max-upstream",
+    default=DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum concurrent calls to the CatLink API across all callers.",
+)
+@_region_option
+def serve(listen: str, max_upstream: int, region: str | None) -> None:
+    """Serve a local JSON API shared by several callers."""
+    try:
+        address = parse_listen(listen)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--listen") from exc
+    clients, _ = _load_clients(region, max_upstream)
+    try:
+        gateway = Gateway(clients, max_upstream, timeout=_cli_setting("timeout", FAN_OUT_TIMEOUT))
+        try:
+            server = GatewayServer(address, gateway)
+        except OSError as exc:
+            click.echo(f"Error: cannot listen on {listen}: {exc}", err=True)
+            sys.exit(1)
+        click.echo(f"Serving CatLink API on http://{address[0] or '0.0.0.0'}:{address[1]}/")
+        stop = threading.Event()
+        _keep_tokens_fresh(clients, stop)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
+            server.server_close()
+    finally:
+        for _, client in clients:
+            client.close()
 
 
 @cli.command("devices")
+@click.option(
+    "--rediscover",
+    is_flag=True,
+    default=False,
+    help="Probe every device-list endpoint, ignoring cached endpoint capabilities.",
+)
 @_region_option
-def list_devices(region: str | None) -> None:
+def list_devices(rediscover: bool, region: str | None) -> None:
     """List all devices on the account."""
     clients, multi = _load_clients(region)
     errors: list[tuple[str, str]] = []
-    total_devices = 0
+    out = _output_writer()
     try:
-        for region_name, client in clients:
-            try:
-                devices = client.get_devices()
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
+        for region_name, client, devices in _fan_out(
+            clients, lambda c: c.get_devices(rediscover=rediscover), errors
+        ):
             if not devices:
                 continue
-            _echo_region_header(region_name, client.api_base, multi)
+            if multi:
+                out.header(f"Region: {region_name} ({client.api_base})")
             for dev in devices:
-                dtype = dev.get("deviceType", "unknown")
-                name = dev.get("deviceName", "unnamed")
-                did = dev.get("id", "?")
-                model = dev.get("model", "?")
-                click.echo(f"  [{dtype}] {name}  (id={did}, model={model})")
-                total_devices += 1
-        if total_devices == 0:
-            if errors and len(errors) == len(clients):
-                msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-                click.echo(f"Error: {msg}", err=True)
-                sys.exit(1)
-            click.echo("No devices found.")
-        if errors and total_devices > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+                device = Device.from_payload(dev)
+                out.record(
+                    {**dev, "region": region_name},
+                    f"  [{device.type or 'unknown'}] {device.name or 'unnamed'}"
+                    f"  (id={device.id or '?'}, model={device.model or '?'})",
+                )
+            out.flush()
+        out.close()
+        _report_outcome(errors, out.count, clients, "No devices found.")
     finally:
         for _, client in clients:
             client.close()
 
 
-def _show_litter_box_status(detail: dict, device_type: str) -> None:
-    work_status = detail.get("workStatus", "")
-    state = WORK_STATUSES.get(str(work_status).strip(), work_status)
-    mode_code = detail.get("workModel", "")
-    modes = DEVICE_MODES.get(device_type, {})
-    mode = modes.get(mode_code, mode_code)
-
-    click.echo(f"State:             {state}")
-    click.echo(f"Mode:              {mode}")
-
-    litter_weight = detail.get("catLitterWeight")
-    if litter_weight is not None:
-        click.echo(f"Litter weight:     {litter_weight} kg")
-
-    countdown = detail.get("litterCountdown")
-    if countdown is not None:
-        click.echo(f"Litter remaining:  {countdown} days")
-
-    induction = int(detail.get("inductionTimes", 0))
-    manual = int(detail.get("manualTimes", 0))
-    click.echo(f"Total cleans:      {induction + manual}")
-    click.echo(f"Manual cleans:     {manual}")
-
-    deodorant = detail.get("deodorantCountdown")
-    if deodorant is not None:
-        click.echo(f"Deodorant days:    {deodorant}")
-
-    temp = detail.get("temperature")
-    if temp is not None and temp != "-":
-        click.echo(f"Temperature:       {temp} C")
-    humidity = detail.get("humidity")
-    if humidity is not None and humidity != "-":
-        click.echo(f"Humidity:          {humidity}%")
-
-    error = detail.get("currentMessage") or detail.get("currentError")
-    if error:
-        click.echo(f"Error:             {error}")
-
-
-def _show_feeder_status(detail: dict) -> None:
-    food_out = detail.get("foodOutStatus", "")
-    if food_out:
-        click.echo(f"Food out status:   {food_out}")
+def _litter_box_status_lines(detail: LitterBoxDetail, device_type: str) -> list[str]:
+    state = WORK_STATUSES.get(detail.work_status, detail.work_status)
+    mode = DEVICE_MODES.get(device_type, {}).get(detail.work_model, detail.work_model)
+
+    lines = [f"State:             {state}", f"Mode:              {mode}"]
+    if detail.litter_weight is not None:
+        lines.append(f"Litter weight:     {detail.litter_weight_text} kg")
+    if detail.litter_days is not None:
+        lines.append(f"Litter remaining:  {detail.litter_days_text} days")
+    lines.append(f"Total cleans:      {detail.total_cleans}")
+    lines.append(f"Manual cleans:     {detail.manual_cleans or 0}")
+    if detail.deodorant_days is not None:
+        lines.append(f"Deodorant days:    {detail.deodorant_days_text}")
+    if detail.temperature is not None:
+        lines.append(f"Temperature:       {detail.temperature_text} C")
+    if detail.humidity is not None:
+        lines.append(f"Humidity:          {detail.humidity_text}%")
+    if detail.error:
+        lines.append(f"Error:             {detail.error}")
+    return lines
+
+
+def _feeder_status_lines(detail: FeederDetail) -> list[str]:
+    return [
+        f"{label:<18} {value}"
+        for label, value in (
+            ("Food out status:", detail.food_out_status),
+            ("Food weight:", "" if detail.weight is None else f"{detail.weight_text} g"),
+            ("Auto-fill:", detail.auto_fill),
+            ("Power supply:", detail.power_supply),
+            ("Key lock:", detail.key_lock),
+            ("Indicator light:", detail.indicator_light),
+            ("Breath light:", detail.breath_light),
+            ("Firmware:", detail.firmware),
+            ("Error:", detail.error),
+        )
+        if value
+    ]
+
+
+def _status_lines(detail: dict, device_type: str) -> list[str]:
+    """
+    Render a device detail the way 'catlink status' prints it.
 
-    weight = detail.get("weight")
-    if weight is not None:
-        click.echo(f"Food weight:       {weight} g")
+    Values are shown as the API reported them (the models' _text fields); a
+    value that is missing or not numeric is left out.
 
-    auto_fill = detail.get("autoFillStatus", "")
-    if auto_fill:
-        click.echo(f"Auto-fill:         {auto_fill}")
+    Args:
+        detail: Detail dictionary from get_device_detail.
+        device_type: Device type the detail was fetched for.
 
-    power = detail.get("powerSupplyStatus", "")
-    if power:
-        click.echo(f"Power supply:      {power}")
+    Returns:
+        Text lines.
+    """
+    parsed = parse_detail(detail, device_type)
+    lines = [f"Online:            {parsed.online_text or '?'}"]
+    if isinstance(parsed, FeederDetail):
+        return lines + _feeder_status_lines(parsed)
+    return lines + _litter_box_status_lines(parsed, device_type)
 
-    key_lock = detail.get("keyLockStatus", "")
-    if key_lock:
-        click.echo(f"Key lock:          {key_lock}")
 
-    indicator = detail.get("indicatorLightStatus", "")
-    if indicator:
-        click.echo(f"Indicator light:   {indicator}")
+def _status_all(device_type: str | None, concurrency: int, region: str | None) -> None:
+    """
+    Show the status of every device.
 
-    breath = detail.get("breathLightStatus", "")
-    if breath:
-        click.echo(f"Breath light:      {breath}")
+    Each region lists its devices once. Detail requests start as soon as a
+    region's list arrives and run at most concurrency at a time, each on the
+    detail endpoint of the device's own type. Results are printed in region and
+    device-list order, each as soon as it and the ones before it have arrived.
 
-    firmware = detail.get("firmwareVersion", "")
-    if firmware:
-        click.echo(f"Firmware:          {firmware}")
+    Args:
+        device_type: Only show devices of this type, or None for all.
+        concurrency: Maximum number of detail requests in flight.
+        region: Optional region identifier.
 
-    error = detail.get("currentErrorMessage") or detail.get("error") or detail.get("currentMessage")
-    if error:
-        click.echo(f"Error:             {error}")
+    Returns:
+        None. Exits with status 1 if any device's detail could not be fetched.
+    """
+    clients, multi = _load_clients(region, concurrency)
+    out = _output_writer()
+    errors: list[tuple[str, str]] = []
+    jobs: dict[str, list[tuple[Device, Future[dict]]]] = {}
+    failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for region_name, client, devices in _fan_out(
+                clients, lambda c: c.get_devices(), errors
+            ):
+                selected = [Device.from_payload(dev) for dev in devices]
+                jobs[region_name] = [
+                    (
+                        device,
+                        pool.submit(client.get_device_detail, device.id, device.type or "SCOOPER"),
+                    )
+                    for device in selected
+                    if device.id and (device_type is None or device.type == device_type)
+                ]
+            _report_outcome(errors, len(jobs), clients)
+            for region_name, client in clients:
+                region_jobs = jobs.get(region_name, [])
+                if multi and region_jobs:
+                    out.header(f"Region: {region_name} ({client.api_base})")
+                for device, future in region_jobs:
+                    dtype = device.type or "SCOOPER"
+                    record = {
+                        "region": region_name,
+                        "deviceId": device.id,
+                        "deviceType": dtype,
+                        "deviceName": device.name,
+                    }
+                    label = f"{device.name or 'unnamed'} ({device.id}) [{dtype}]"
+                    try:
+                        detail = future.result()
+                    except (CatLinkAPIError, httpx.HTTPError) as exc:
+                        failed += 1
+                        out.record({**record, "error": str(exc)}, f"{label}: error: {exc}")
+                        out.flush()
+                        continue
+                    out.record(
+                        {**record, "detail": detail},
+                        label,
+                        *(f"  {line}" for line in _status_lines(detail or {}, dtype)),
+                    )
+                    out.flush()
+        out.close()
+        if not any(jobs.values()):
+            click.echo("No devices found.", err=out.structured)
+        if failed:
+            click.echo(f"Error: no detail for {failed} device(s).", err=True)
+            sys.exit(1)
+    finally:
+        for _, client in clients:
+            client.close()
 
 
 @cli.command()
-@click.argument("device_id")
+@click.argument("device_id", required=False)
+@_device_type_option(_STATUS_TYPES)
+@click.option(
+    "--all",
+    "show_all",
+    is_flag=True,
+    default=False,
+    help="Show every device (of --type, if given) instead of one DEVICE_ID.",
+)
 @click.option(
-    "--type",
-    "device_type",
-    default="SCOOPER",
+    "--concurrency",
+    default=DEFAULT_MAX_CONCURRENCY,
     show_default=True,
-    type=click.Choice(["SCOOPER", "LITTER_BOX_599", "C08", "FEEDER", "PUREPRO"]),
-    help="Device type.",
+    type=click.IntRange(min=1),
+    help="Detail requests in flight at the same time with --all.",
 )
 @_region_option
-def status(device_id: str, device_type: str, region: str | None) -> None:
-    """Show detailed status for a device."""
-    clients, multi = _load_clients(region)
+def status(
+    device_id: str | None,
+    device_type: str | None,
+    show_all: bool,
+    concurrency: int,
+    region: str | None,
+) -> None:
+    """Show detailed status for a device, or for every device with --all."""
+    if show_all:
+        if device_id is not None:
+            raise click.UsageError("DEVICE_ID cannot be combined with --all.")
+        _status_all(device_type, concurrency, region)
+        return
+    if device_id is None:
+        raise click.UsageError("Missing DEVICE_ID (or use --all).")
+    clients, multi, device_type = _load_device_target(
+        device_id, device_type, region, _STATUS_TYPES, "SCOOPER"
+    )
     errors: list[tuple[str, str]] = []
+    out = _output_writer()
     shown = 0
     try:
-        for region_name, client in clients:
-            try:
-                detail = client.get_device_detail(device_id, device_type)
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
+        for region_name, client, detail in _fan_out_device(
+            device_id,
+            region,
+            clients,
+            lambda c: c.get_device_detail(device_id, device_type),
+            errors,
+        ):
             if not detail:
                 continue
+            if out.structured:
+                record = {
+                    "region": region_name,
+                    "deviceId": device_id,
+                    "deviceType": device_type,
+                    "detail": detail,
+                }
+                out.record(record)
+                out.flush()
+                shown += 1
+                continue
             _echo_region_header(region_name, client.api_base, multi)
-            click.echo(f"Online:            {detail.get('online', '?')}")
-
-            if device_type == "FEEDER":
-                _show_feeder_status(detail)
-            else:
-                _show_litter_box_status(detail, device_type)
+            for line in _status_lines(detail, device_type):
+                click.echo(line)
             shown += 1
-        if shown == 0:
-            if errors and len(errors) == len(clients):
-                msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-                click.echo(f"Error: {msg}", err=True)
-                sys.exit(1)
-            click.echo("No detail returned for this device.")
-        if errors and shown > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+        out.close()
+        _report_outcome(errors, shown, clients, "No detail returned for this device.")
     finally:
         for _, client in clients:
             client.close()
 
 
-@cli.command()
-@click.argument("device_id")
-@click.argument("mode")
-@click.option(
-    "--type",
-    "device_type",
-    default="SCOOPER",
-    show_default=True,
-    type=click.Choice(["SCOOPER", "LITTER_BOX_599"]),
-    help="Device type.",
-)
-@_region_option
-def mode(device_id: str, mode: str, device_type: str, region: str | None) -> None:
-    """Change the device working mode (auto, manual, time, empty)."""
-    modes = DEVICE_MODES.get(device_type, {})
-    code = None
-    for k, v in modes.items():
-        if v == mode:
-            code = k
-            break
-    if code is None:
-        valid = ", ".join(modes.values())
-        click.echo(f"Invalid mode '{mode}'. Valid modes: {valid}", err=True)
-        sys.exit(1)
+def _device_selectors(func: Callable[..., object]) -> Callable[..., object]:
+    """
+    Attach the --all, --model and --name device selectors and --concurrency to a
+    Click command.
 
-    clients, multi = _load_clients(region)
+    Args:
+        func: Click command function.
+
+    Returns:
+        Wrapped Click command.
+    """
+    func = click.option(
+        "--name",
+        "name_glob",
+        default=None,
+        metavar="GLOB",
+        help="Select devices whose name matches this pattern (e.g. 'Kitchen*').",
+    )(func)
+    func = click.option(
+        "--concurrency",
+        default=DEFAULT_MAX_CONCURRENCY,
+        show_default=True,
+        type=click.IntRange(min=1),
+        help="Devices worked on at the same time with --all, --model or --name.",
+    )(func)
+    func = click.option("--model", default=None, help="Select devices of this model.")(func)
+    return click.option(
+        "--all",
+        "select_all",
+        is_flag=True,
+        default=False,
+        help="Select every supported device instead of one DEVICE_ID.",
+    )(func)
+
+
+def _selecting(
+    device_id: str | None, select_all: bool, model: str | None, name_glob: str | None
+) -> bool:
+    """
+    Decide whether a device command targets one DEVICE_ID or a selection.
+
+    --type alone never selects devices: sending a command to many devices has to
+    be asked for with --all, --model or --name. --type then narrows the selection.
+
+    Args:
+        device_id: DEVICE_ID argument, or None.
+        select_all: --all flag.
+        model: --model value.
+        name_glob: --name pattern.
+
+    Returns:
+        True when devices are selected with --all, --model or --name.
+
+    Raises:
+        click.UsageError: If DEVICE_ID is combined with a selector, or neither is given.
+    """
+    if device_id is not None:
+        if select_all or model or name_glob:
+            raise click.UsageError("DEVICE_ID cannot be combined with --all, --model or --name.")
+        return False
+    if not (select_all or model or name_glob):
+        raise click.UsageError(
+            "Missing DEVICE_ID; or select devices with --all, --model or --name."
+        )
+    return True
+
+
+def _run_on_selection(
+    command: str,
+    types: Sequence[str],
+    device_type: str | None,
+    model: str | None,
+    name_glob: str | None,
+    region: str | None,
+    concurrency: int,
+    args: tuple[str, ...] = (),
+    portions: int = 5,
+) -> None:
+    """
+    Send a command to every matching device and write one result per device.
+
+    Devices are resolved with one device list per region. The command then runs
+    for all matches at once, at most concurrency at a time, and the results are
+    written in region and device order.
+
+    Args:
+        command: Command name understood by device_operation.
+        types: Device types the command supports; other devices never match.
+        device_type: Only select devices of this type, or None.
+        model: Only select devices of this model (case-insensitive), or None.
+        name_glob: Only select devices whose name matches this pattern
+            (case-insensitive), or None.
+        region: Optional region identifier.
+        concurrency: Maximum number of devices worked on at the same time.
+        args: Command arguments (the mode).
+        portions: Portions for feed.
+
+    Returns:
+        None. Exits with status 1 if nothing matched or any device failed.
+    """
+    clients, multi = _load_clients(region, concurrency)
+    try:
+        errors: list[tuple[str, str]] = []
+        listed = {
+            region_name: devices
+            for region_name, _, devices in _fan_out(clients, lambda c: c.get_devices(), errors)
+        }
+        _report_outcome(errors, len(listed), clients)
+        targets: list[tuple[str, CatLinkAPI, Device]] = []
+        for region_name, client in clients:
+            for dev in listed.get(region_name, []):
+                device = Device.from_payload(dev)
+                if (
+                    device.id
+                    and device.type in types
+                    and (device_type is None or device.type == device_type)
+                    and (model is None or device.model.lower() == model.lower())
+                    and (
+                        name_glob is None
+                        or fnmatch.fnmatchcase(device.name.lower(), name_glob.lower())
+                    )
+                ):
+                    targets.append((region_name, client, device))
+        if not targets:
+            click.echo("Error: no matching devices.", err=True)
+            sys.exit(1)
+
+        def run(target: tuple[str, CatLinkAPI, Device]) -> str:
+            _, client, device = target
+            call, message = device_operation(command, device.id, device.type, args, portions)
+            call(client)
+            return message
+
+        out = _output_writer()
+        failed = 0
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(targets))) as pool:
+            futures = [pool.submit(run, target) for target in targets]
+            for (region_name, _, device), future in zip(targets, futures, strict=True):
+                ok = True
+                try:
+                    message = future.result()
+                except (BatchError, CatLinkAPIError, httpx.HTTPError) as exc:
+                    failed += 1
+                    ok = False
+                    message = str(exc)
+                prefix = f"[{region_name}] " if multi else ""
+                out.record(
+                    {
+                        "region": region_name,
+                        "deviceId": device.id,
+                        "deviceName": device.name,
+                        "ok": ok,
+                        "message": message,
+                    },
+                    f"{prefix}{device.name or 'unnamed'} ({device.id}): "
+                    + (message if ok else f"failed: {message}"),
+                )
+                out.flush()
+        out.close()
+        if failed:
+            click.echo(f"Error: {failed} of {len(targets)} devices failed.", err=True)
+            sys.exit(1)
+    finally:
+        for _, client in clients:
+            client.close()
+
+
+@cli.command()
+@click.argument("device_id", required=False)
+@click.argument("mode", required=False)
+@_device_type_option(ACTION_TYPES, selects=True)
+@_device_selectors
+@_region_option
+def mode(
+    device_id: str | None,
+    mode: str | None,
+    device_type: str | None,
+    select_all: bool,
+    model: str | None,
+    name_glob: str | None,
+    concurrency: int,
+    region: str | None,
+) -> None:
+    """Change the device working mode (auto, manual, time, empty).
+
+    With --all, --model or --name, give only the MODE.
+    """
+    if select_all or model or name_glob:
+        if mode is None:
+            device_id, mode = None, device_id
+        if mode is None:
+            raise click.UsageError("Missing argument 'MODE'.")
+    elif device_id is None:
+        raise click.UsageError(
+            "Missing arguments 'DEVICE_ID' and 'MODE'; or select devices with --all, --model or"
+            " --name and give only the MODE."
+        )
+    elif mode is None:
+        raise click.UsageError(
+            "Missing argument 'MODE'; or select devices with --all, --model or --name and give"
+            " only the MODE."
+        )
+    if _selecting(device_id, select_all, model, name_glob):
+        _run_on_selection(
+            "mode", ACTION_TYPES, device_type, model, name_glob, region, concurrency, args=(mode,)
+        )
+        return
+    clients, multi, device_type = _load_device_target(
+        device_id, device_type, region, ACTION_TYPES, "SCOOPER"
+    )
     errors: list[tuple[str, str]] = []
     updated = 0
     try:
-        for region_name, client in clients:
-            try:
-                client.change_mode(device_id, code, device_type)
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
-            _echo_region_header(region_name, client.api_base, multi)
-            click.echo(f"Mode set to '{mode}'.")
-            updated += 1
-        if updated == 0:
-            msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-            click.echo(f"Error: {msg}", err=True)
+        modes = DEVICE_MODES.get(device_type, {})
+        code = None
+        for k, v in modes.items():
+            if v == mode:
+                code = k
+                break
+        if code is None:
+            valid = ", ".join(modes.values())
+            click.echo(f"Invalid mode '{mode}'. Valid modes: {valid}", err=True)
             sys.exit(1)
-        if errors and updated > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+
+        out = _output_writer()
+        for region_name, client, _ in _fan_out_device(
+            device_id,
+            region,
+            clients,
+            lambda c: c.change_mode(device_id, code, device_type),
+            errors,
+        ):
+            _write_sent(
+                out, region_name, client.api_base, multi, device_id, f"Mode set to '{mode}'."
+            )
+            updated += 1
+        out.close()
+        _report_outcome(errors, updated, clients)
     finally:
         for _, client in clients:
             client.close()
@@ -378,191 +1251,285 @@ def mode(device_id: str, mode: str, device_type: str, region: str | None) -> Non
 @cli.command()
 @click.argument("device_id")
 @click.argument("action")
-@click.option(
-    "--type",
-    "device_type",
-    default="SCOOPER",
-    show_default=True,
-    type=click.Choice(["SCOOPER", "LITTER_BOX_599"]),
-    help="Device type.",
-)
+@_device_type_option(ACTION_TYPES)
 @_region_option
-def action(device_id: str, action: str, device_type: str, region: str | None) -> None:
+def action(device_id: str, action: str, device_type: str | None, region: str | None) -> None:
     """Send an action to the device (clean, pause, start)."""
-    actions = DEVICE_ACTIONS.get(device_type, {})
-    code = None
-    for k, v in actions.items():
-        if v == action:
-            code = k
-            break
-    if code is None:
-        valid = ", ".join(actions.values())
-        click.echo(f"Invalid action '{action}'. Valid actions: {valid}", err=True)
-        sys.exit(1)
-
-    clients, multi = _load_clients(region)
+    clients, multi, device_type = _load_device_target(
+        device_id, device_type, region, ACTION_TYPES, "SCOOPER"
+    )
     errors: list[tuple[str, str]] = []
     sent = 0
     try:
-        for region_name, client in clients:
-            try:
-                client.send_action(device_id, code, device_type)
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
-            _echo_region_header(region_name, client.api_base, multi)
-            click.echo(f"Action '{action}' sent.")
-            sent += 1
-        if sent == 0:
-            msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-            click.echo(f"Error: {msg}", err=True)
+        actions = DEVICE_ACTIONS.get(device_type, {})
+        code = None
+        for k, v in actions.items():
+            if v == action:
+                code = k
+                break
+        if code is None:
+            valid = ", ".join(actions.values())
+            click.echo(f"Invalid action '{action}'. Valid actions: {valid}", err=True)
             sys.exit(1)
-        if errors and sent > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+
+        out = _output_writer()
+        for region_name, client, _ in _fan_out_device(
+            device_id,
+            region,
+            clients,
+            lambda c: c.send_action(device_id, code, device_type),
+            errors,
+        ):
+            _write_sent(
+                out, region_name, client.api_base, multi, device_id, f"Action '{action}' sent."
+            )
+            sent += 1
+        out.close()
+        _report_outcome(errors, sent, clients)
     finally:
         for _, client in clients:
             client.close()
 
 
+def _epoch_ms(value: datetime.datetime | None) -> int | None:
+    return None if value is None else int(value.timestamp() * 1000)
+
+
+def _export_logs(
+    clients: list[tuple[str, CatLinkAPI]],
+    device_id: str,
+    device_type: str,
+    since: datetime.datetime | None,
+    until: datetime.datetime | None,
+    export_format: str,
+    restart: bool,
+) -> None:
+    """
+    Stream a device's full log history as NDJSON or CSV.
+
+    Args:
+        clients: List of (region, client) tuples to export from.
+        device_id: Device identifier.
+        device_type: Device type.
+        since: First time to export, or None for the whole history.
+        until: Last time to export, or None for now.
+        export_format: "ndjson" or "csv".
+        restart: Whether to ignore a saved resume position.
+
+    Returns:
+        None.
+    """
+    errors: list[tuple[str, str]] = []
+    out = OutputWriter("ndjson" if export_format == "ndjson" else "text")
+    since_ms = _epoch_ms(since) or 0
+    until_ms = _epoch_ms(until)
+    exports: list[tuple[str, LogExport]] = []
+    for region_name, client in clients:
+        cursor = ExportCursor(region_name, device_id, device_type, since_ms, until_ms)
+        if restart:
+            cursor.clear()
+        export = LogExport(client, device_id, device_type, since_ms, until_ms, cursor)
+        if export.resumed:
+            click.echo(f"Resuming {region_name} export at page {export.start_page}.", err=True)
+        exports.append((region_name, export))
+    if export_format == "csv" and not any(export.resumed for _, export in exports):
+        out.header(log_csv_header())
+    for region_name, export in exports:
+        try:
+            for entries in export.pages():
+                for entry in entries:
+                    record = {**entry, "region": region_name, "deviceId": device_id}
+                    out.record(record, log_csv_row(record))
+                out.flush()
+        except (CatLinkAPIError, httpx.HTTPError) as exc:
+            errors.append((region_name, str(exc)))
+    out.close()
+    _report_outcome(errors, out.count, clients, "No logs found.")
+
+
 @cli.command()
 @click.argument("device_id")
+@_device_type_option(_LOG_TYPES)
+@click.option(
+    "--all",
+    "export_all",
+    is_flag=True,
+    default=False,
+    help="Export the full log history page by page instead of the recent events.",
+)
+@click.option(
+    "--since",
+    type=click.DateTime(formats=_TIME_FORMATS),
+    default=None,
+    help="With --all, first local time to export. Defaults to the start of the history.",
+)
 @click.option(
-    "--type",
-    "device_type",
-    default="SCOOPER",
+    "--until",
+    type=click.DateTime(formats=_TIME_FORMATS),
+    default=None,
+    help="With --all, last local time to export. Defaults to when the export started.",
+)
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(["ndjson", "csv"]),
+    default="ndjson",
     show_default=True,
-    type=click.Choice(["SCOOPER", "LITTER_BOX_599", "FEEDER", "PUREPRO"]),
-    help="Device type.",
+    help="Record format for --all. A global --output other than text must match it.",
+)
+@click.option(
+    "--restart",
+    is_flag=True,
+    default=False,
+    help="With --all, start over instead of resuming an interrupted export.",
 )
 @_region_option
-def logs(device_id: str, device_type: str, region: str | None) -> None:
-    """Show recent device logs."""
-    clients, multi = _load_clients(region)
+def logs(
+    device_id: str,
+    device_type: str | None,
+    export_all: bool,
+    since: datetime.datetime | None,
+    until: datetime.datetime | None,
+    export_format: str,
+    restart: bool,
+    region: str | None,
+) -> None:
+    """Show recent device logs, or export the full history with --all."""
+    if not export_all and (since or until):
+        raise click.UsageError("--since and --until require --all.")
+    output = _cli_setting("output", "text")
+    if export_all and output not in ("text", export_format):
+        raise click.UsageError(
+            f"--output {output} cannot be combined with logs --all; use --format instead."
+        )
+    clients, multi, device_type = _load_device_target(
+        device_id, device_type, region, _LOG_TYPES, "SCOOPER"
+    )
+    if export_all:
+        try:
+            _export_logs(clients, device_id, device_type, since, until, export_format, restart)
+        finally:
+            for _, client in clients:
+                client.close()
+        return
     errors: list[tuple[str, str]] = []
-    shown = 0
+    out = _output_writer()
     try:
-        for region_name, client in clients:
-            try:
-                entries = client.get_device_logs(device_id, device_type)
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
+        for region_name, client, entries in _fan_out_device(
+            device_id, region, clients, lambda c: c.get_device_logs(device_id, device_type), errors
+        ):
             if not entries:
                 continue
-            _echo_region_header(region_name, client.api_base, multi)
-            for entry in entries:
-                ts = entry.get("time") or entry.get("createTime") or ""
-                event = entry.get("event") or entry.get("msg") or str(entry)
-                parts = [event]
-                for extra in ("firstSection", "secondSection"):
-                    val = entry.get(extra)
-                    if val:
-                        parts.append(str(val))
-                click.echo(f"  [{ts}] {' '.join(parts)}")
-                shown += 1
-        if shown == 0:
-            if errors and len(errors) == len(clients):
-                msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-                click.echo(f"Error: {msg}", err=True)
-                sys.exit(1)
-            click.echo("No logs found.")
-        if errors and shown > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+            if multi:
+                out.header(f"Region: {region_name} ({client.api_base})")
+            for payload in entries:
+                entry = LogEntry.from_payload(payload)
+                out.record(
+                    {**payload, "region": region_name, "deviceId": device_id},
+                    f"  [{entry.time}] {entry.text or payload}",
+                )
+            out.flush()
+        out.close()
+        _report_outcome(errors, out.count, clients, "No logs found.")
     finally:
         for _, client in clients:
             client.close()
 
 
 @cli.command("clean")
-@click.argument("device_id")
-@click.option(
-    "--type",
-    "device_type",
-    default="SCOOPER",
-    show_default=True,
-    type=click.Choice(["SCOOPER", "LITTER_BOX_599"]),
-    help="Device type.",
-)
+@click.argument("device_id", required=False)
+@_device_type_option(ACTION_TYPES, selects=True)
+@_device_selectors
 @_region_option
-def clean(device_id: str, device_type: str, region: str | None) -> None:
+def clean(
+    device_id: str | None,
+    device_type: str | None,
+    select_all: bool,
+    model: str | None,
+    name_glob: str | None,
+    concurrency: int,
+    region: str | None,
+) -> None:
     """Start a cleaning cycle."""
-    actions = DEVICE_ACTIONS.get(device_type, {})
-    code = None
-    for k, v in actions.items():
-        if v in ("start", "clean"):
-            code = k
-            break
-    if code is None:
-        click.echo("Clean action not available for this device type.", err=True)
-        sys.exit(1)
-
-    clients, multi = _load_clients(region)
+    if _selecting(device_id, select_all, model, name_glob):
+        _run_on_selection("clean", ACTION_TYPES, device_type, model, name_glob, region, concurrency)
+        return
+    clients, multi, device_type = _load_device_target(
+        device_id, device_type, region, ACTION_TYPES, "SCOOPER"
+    )
     errors: list[tuple[str, str]] = []
     sent = 0
     try:
-        for region_name, client in clients:
-            try:
-                client.send_action(device_id, code, device_type)
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
-            _echo_region_header(region_name, client.api_base, multi)
-            click.echo("Cleaning started.")
-            sent += 1
-        if sent == 0:
-            msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-            click.echo(f"Error: {msg}", err=True)
+        actions = DEVICE_ACTIONS.get(device_type, {})
+        code = None
+        for k, v in actions.items():
+            if v in ("start", "clean"):
+                code = k
+                break
+        if code is None:
+            click.echo("Clean action not available for this device type.", err=True)
             sys.exit(1)
-        if errors and sent > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+
+        out = _output_writer()
+        for region_name, client, _ in _fan_out_device(
+            device_id,
+            region,
+            clients,
+            lambda c: c.send_action(device_id, code, device_type),
+            errors,
+        ):
+            _write_sent(out, region_name, client.api_base, multi, device_id, "Cleaning started.")
+            sent += 1
+        out.close()
+        _report_outcome(errors, sent, clients)
     finally:
         for _, client in clients:
             client.close()
 
 
 @cli.command("pause")
-@click.argument("device_id")
-@click.option(
-    "--type",
-    "device_type",
-    default="SCOOPER",
-    show_default=True,
-    type=click.Choice(["SCOOPER", "LITTER_BOX_599"]),
-    help="Device type.",
-)
+@click.argument("device_id", required=False)
+@_device_type_option(ACTION_TYPES, selects=True)
+@_device_selectors
 @_region_option
-def pause(device_id: str, device_type: str, region: str | None) -> None:
+def pause(
+    device_id: str | None,
+    device_type: str | None,
+    select_all: bool,
+    model: str | None,
+    name_glob: str | None,
+    concurrency: int,
+    region: str | None,
+) -> None:
     """Pause the current operation."""
-    clients, multi = _load_clients(region)
+    if _selecting(device_id, select_all, model, name_glob):
+        _run_on_selection("pause", ACTION_TYPES, device_type, model, name_glob, region, concurrency)
+        return
+    clients, multi, device_type = _load_device_target(
+        device_id, device_type, region, ACTION_TYPES, "SCOOPER"
+    )
     errors: list[tuple[str, str]] = []
     sent = 0
     try:
-        for region_name, client in clients:
-            try:
-                client.send_action(device_id, "00", device_type)
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
-            _echo_region_header(region_name, client.api_base, multi)
-            click.echo("Device paused.")
+        out = _output_writer()
+        for region_name, client, _ in _fan_out_device(
+            device_id,
+            region,
+            clients,
+            lambda c: c.send_action(device_id, "00", device_type),
+            errors,
+        ):
+            _write_sent(out, region_name, client.api_base, multi, device_id, "Device paused.")
             sent += 1
-        if sent == 0:
-            msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-            click.echo(f"Error: {msg}", err=True)
-            sys.exit(1)
-        if errors and sent > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+        out.close()
+        _report_outcome(errors, sent, clients)
     finally:
         for _, client in clients:
             client.close()
 
 
 @cli.command("feed")
-@click.argument("device_id")
+@click.argument("device_id", required=False)
 @click.option(
     "--portions",
     default=5,
@@ -570,138 +1537,228 @@ def pause(device_id: str, device_type: str, region: str | None) -> None:
     type=click.IntRange(1, 10),
     help="Number of portions to dispense (1-10).",
 )
+@_device_selectors
 @_region_option
-def feed(device_id: str, portions: int, region: str | None) -> None:
+def feed(
+    device_id: str | None,
+    portions: int,
+    select_all: bool,
+    model: str | None,
+    name_glob: str | None,
+    concurrency: int,
+    region: str | None,
+) -> None:
     """Dispense food from a feeder."""
-    clients, multi = _load_clients(region)
+    if _selecting(device_id, select_all, model, name_glob):
+        _run_on_selection(
+            "feed", FEED_TYPES, None, model, name_glob, region, concurrency, portions=portions
+        )
+        return
+    clients, multi = _load_device_clients(device_id, region)
     errors: list[tuple[str, str]] = []
     sent = 0
     try:
-        for region_name, client in clients:
-            try:
-                client.food_out(device_id, portions)
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
-            _echo_region_header(region_name, client.api_base, multi)
-            click.echo(f"Dispensing {portions} portion(s).")
+        out = _output_writer()
+        for region_name, client, _ in _fan_out_device(
+            device_id, region, clients, lambda c: c.food_out(device_id, portions), errors
+        ):
+            _write_sent(
+                out,
+                region_name,
+                client.api_base,
+                multi,
+                device_id,
+                f"Dispensing {portions} portion(s).",
+            )
             sent += 1
-        if sent == 0:
-            msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-            click.echo(f"Error: {msg}", err=True)
-            sys.exit(1)
-        if errors and sent > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+        out.close()
+        _report_outcome(errors, sent, clients)
     finally:
         for _, client in clients:
             client.close()
 
 
 @cli.command("reset-litter")
-@click.argument("device_id")
-@click.option(
-    "--type",
-    "device_type",
-    default="LITTER_BOX_599",
-    show_default=True,
-    type=click.Choice(["SCOOPER", "LITTER_BOX_599"]),
-    help="Device type.",
-)
+@click.argument("device_id", required=False)
+@_device_type_option(ACTION_TYPES, selects=True)
+@_device_selectors
 @_region_option
-def reset_litter(device_id: str, device_type: str, region: str | None) -> None:
+def reset_litter(
+    device_id: str | None,
+    device_type: str | None,
+    select_all: bool,
+    model: str | None,
+    name_glob: str | None,
+    concurrency: int,
+    region: str | None,
+) -> None:
     """Reset the litter consumable counter."""
-    clients, multi = _load_clients(region)
+    if _selecting(device_id, select_all, model, name_glob):
+        _run_on_selection(
+            "reset-litter", ACTION_TYPES, device_type, model, name_glob, region, concurrency
+        )
+        return
+    clients, multi, device_type = _load_device_target(
+        device_id, device_type, region, ACTION_TYPES, "LITTER_BOX_599"
+    )
     errors: list[tuple[str, str]] = []
     reset = 0
     try:
-        for region_name, client in clients:
-            try:
-                client.reset_consumable(device_id, device_type, "CAT_LITTER")
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
-            _echo_region_header(region_name, client.api_base, multi)
-            click.echo("Litter counter reset.")
+        out = _output_writer()
+        for region_name, client, _ in _fan_out_device(
+            device_id,
+            region,
+            clients,
+            lambda c: c.reset_consumable(device_id, device_type, "CAT_LITTER"),
+            errors,
+        ):
+            _write_sent(
+                out, region_name, client.api_base, multi, device_id, "Litter counter reset."
+            )
             reset += 1
-        if reset == 0:
-            msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-            click.echo(f"Error: {msg}", err=True)
-            sys.exit(1)
-        if errors and reset > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+        out.close()
+        _report_outcome(errors, reset, clients)
     finally:
         for _, client in clients:
             client.close()
 
 
 @cli.command("reset-deodorant")
-@click.argument("device_id")
-@click.option(
-    "--type",
-    "device_type",
-    default="LITTER_BOX_599",
-    show_default=True,
-    type=click.Choice(["SCOOPER", "LITTER_BOX_599"]),
-    help="Device type.",
-)
+@click.argument("device_id", required=False)
+@_device_type_option(ACTION_TYPES, selects=True)
+@_device_selectors
 @_region_option
-def reset_deodorant(device_id: str, device_type: str, region: str | None) -> None:
+def reset_deodorant(
+    device_id: str | None,
+    device_type: str | None,
+    select_all: bool,
+    model: str | None,
+    name_glob: str | None,
+    concurrency: int,
+    region: str | None,
+) -> None:
     """Reset the deodorant consumable counter."""
-    clients, multi = _load_clients(region)
+    if _selecting(device_id, select_all, model, name_glob):
+        _run_on_selection(
+            "reset-deodorant", ACTION_TYPES, device_type, model, name_glob, region, concurrency
+        )
+        return
+    clients, multi, device_type = _load_device_target(
+        device_id, device_type, region, ACTION_TYPES, "LITTER_BOX_599"
+    )
     errors: list[tuple[str, str]] = []
     reset = 0
     try:
-        for region_name, client in clients:
-            try:
-                client.reset_consumable(device_id, device_type, "DEODORIZER_02")
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
-            _echo_region_header(region_name, client.api_base, multi)
-            click.echo("Deodorant counter reset.")
+        out = _output_writer()
+        for region_name, client, _ in _fan_out_device(
+            device_id,
+            region,
+            clients,
+            lambda c: c.reset_consumable(device_id, device_type, "DEODORIZER_02"),
+            errors,
+        ):
+            _write_sent(
+                out, region_name, client.api_base, multi, device_id, "Deodorant counter reset."
+            )
             reset += 1
-        if reset == 0:
-            msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-            click.echo(f"Error: {msg}", err=True)
-            sys.exit(1)
-        if errors and reset > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+        out.close()
+        _report_outcome(errors, reset, clients)
     finally:
         for _, client in clients:
             client.close()
 
 
 @cli.command("change-bag")
-@click.argument("device_id")
+@click.argument("device_id", required=False)
+@_device_selectors
 @_region_option
-def change_bag(device_id: str, region: str | None) -> None:
+def change_bag(
+    device_id: str | None,
+    select_all: bool,
+    model: str | None,
+    name_glob: str | None,
+    concurrency: int,
+    region: str | None,
+) -> None:
     """Trigger garbage bag replacement (LitterBox only)."""
-    clients, multi = _load_clients(region)
+    if _selecting(device_id, select_all, model, name_glob):
+        _run_on_selection("change-bag", BAG_TYPES, None, model, name_glob, region, concurrency)
+        return
+    clients, multi = _load_device_clients(device_id, region)
     errors: list[tuple[str, str]] = []
     sent = 0
     try:
-        for region_name, client in clients:
-            try:
-                client.replace_garbage_bag(device_id, enable=True)
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
-            _echo_region_header(region_name, client.api_base, multi)
-            click.echo("Garbage bag change triggered.")
+        out = _output_writer()
+        for region_name, client, _ in _fan_out_device(
+            device_id,
+            region,
+            clients,
+            lambda c: c.replace_garbage_bag(device_id, enable=True),
+            errors,
+        ):
+            _write_sent(
+                out, region_name, client.api_base, multi, device_id, "Garbage bag change triggered."
+            )
             sent += 1
-        if sent == 0:
-            msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-            click.echo(f"Error: {msg}", err=True)
-            sys.exit(1)
-        if errors and sent > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+        out.close()
+        _report_outcome(errors, sent, clients)
+    finally:
+        for _, client in clients:
+            client.close()
+
+
+@cli.command()
+@click.argument("script", type=click.File("r"), default="-")
+@click.option(
+    "--concurrency",
+    default=DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Devices worked on at the same time.",
+)
+@_region_option
+def batch(script: TextIO, concurrency: int, region: str | None) -> None:
+    """Run device commands from SCRIPT (or stdin), one per line.
+
+    Lines look like 'clean DEV1', 'mode DEV2 auto', 'feed DEV3 --portions 2' or
+    'reset-litter DEV4'. Commands for different devices run in parallel; commands
+    for the same device run in order, and stop at its first failure.
+    """
+    try:
+        steps = parse_script(script)
+    except BatchError as exc:
+        click.echo(f"Error: {exc}", err=True)
+        sys.exit(2)
+    if not steps:
+        click.echo("No commands to run.", err=True)
+        return
+    clients, _ = _load_clients(region, concurrency)
+    out = _output_writer()
+    failed = 0
+    try:
+        for result in BatchRunner(clients, concurrency).run(steps):
+            step = result.step
+            failed += not result.ok
+            out.record(
+                {
+                    "line": step.line,
+                    "command": step.text,
+                    "deviceId": step.device_id,
+                    "region": result.region,
+                    "ok": result.ok,
+                    "message": result.message,
+                },
+                f"[line {step.line}] {step.text}: "
+                + (result.message if result.ok else f"failed: {result.message}"),
+            )
+            out.flush()
+        out.close()
     finally:
         for _, client in clients:
             client.close()
+    if failed:
+        click.echo(f"Error: {failed} of {len(steps)} commands failed.", err=True)
+        sys.exit(1)
 
 
 @cli.command("cats")
@@ -710,42 +1767,140 @@ def list_cats(region: str | None) -> None:
     """List all cats on the account."""
     clients, multi = _load_clients(region)
     errors: list[tuple[str, str]] = []
-    total_cats = 0
+    out = _output_writer()
     try:
-        for region_name, client in clients:
-            try:
-                cats = client.get_cats(timezone_id=get_system_timezone())
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
+        for region_name, client, cats in _fan_out(
+            clients, lambda c: c.get_cats(timezone_id=get_system_timezone()), errors
+        ):
             if not cats:
                 continue
-            _echo_region_header(region_name, client.api_base, multi)
-            for cat in cats:
-                name = cat.get("name") or cat.get("petName") or "unnamed"
-                pid = cat.get("id") or cat.get("petId") or "?"
-                weight = cat.get("weight", "?")
-                breed = cat.get("breedName") or cat.get("breed") or ""
-                line = f"  {name} (id={pid}, weight={weight}kg"
-                if breed:
-                    line += f", breed={breed}"
+            if multi:
+                out.header(f"Region: {region_name} ({client.api_base})")
+            for payload in cats:
+                cat = Cat.from_payload(payload)
+                weight = "?" if cat.weight is None else cat.weight
+                line = f"  {cat.name or 'unnamed'} (id={cat.id or '?'}, weight={weight}kg"
+                if cat.breed:
+                    line += f", breed={cat.breed}"
                 line += ")"
-                click.echo(line)
-                total_cats += 1
-        if total_cats == 0:
-            if errors and len(errors) == len(clients):
-                msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-                click.echo(f"Error: {msg}", err=True)
-                sys.exit(1)
-            click.echo("No cats found.")
-        if errors and total_cats > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+                out.record({**payload, "region": region_name}, line)
+            out.flush()
+        out.close()
+        _report_outcome(errors, out.count, clients, "No cats found.")
     finally:
         for _, client in clients:
             client.close()
 
 
+def _pet_regions(clients: list[tuple[str, CatLinkAPI]], pet_ids: list[str]) -> dict[str, set[str]]:
+    """
+    Find the regions whose cat list includes each cat.
+
+    Args:
+        clients: List of (region, client) tuples.
+        pet_ids: Cat identifiers.
+
+    Returns:
+        Mapping of pet ID to region names. A cat that no region lists (for
+        example because its region failed to answer) maps to every region.
+    """
+    everywhere = {region_name for region_name, _ in clients}
+    if len(clients) <= 1:
+        return {pet_id: everywhere for pet_id in pet_ids}
+    errors: list[tuple[str, str]] = []
+    owners: dict[str, set[str]] = {}
+    for region_name, _, cats in _fan_out(
+        clients, lambda c: c.get_cats(timezone_id=get_system_timezone()), errors
+    ):
+        for cat in cats:
+            pet_id = Cat.from_payload(cat).id
+            if pet_id in pet_ids:
+                owners.setdefault(pet_id, set()).add(region_name)
+    for region_name, err in errors:
+        logger.debug("Cat lookup failed (%s): %s", region_name, err)
+    return {pet_id: owners.get(pet_id, everywhere) for pet_id in pet_ids}
+
+
+def _fetch_summaries(
+    clients: list[tuple[str, CatLinkAPI]],
+    pet_ids: list[str],
+    days: list[str],
+    concurrency: int,
+    failures: dict[str, list[str]],
+) -> Iterator[tuple[str, CatLinkAPI, str, str, dict]]:
+    """
+    Fetch cats' summaries for many days concurrently, yielding them in order.
+
+    With several regions, each cat's summaries are only requested from the
+    region that lists the cat. Days before today are served from and added to
+    the permanent summary cache, which is saved as results come in.
+
+    Args:
+        clients: List of (region, client) tuples.
+        pet_ids: Cat identifiers.
+        days: Days in YYYY-MM-DD format, in order.
+        concurrency: Maximum number of summaries fetched at the same time.
+        failures: Dictionary that collects "day: message" strings per region.
+
+    Returns:
+        Iterator of (region, client, pet ID, day, summary) ordered by region,
+        cat and day. Empty summaries are skipped.
+    """
+    today = datetime.date.today().isoformat()
+    timezone_id = get_system_timezone()
+    cache = SummaryCache()
+    cache_reads = not _cli_setting("no_cache", False)
+    owners = _pet_regions(clients, pet_ids)
+
+    def fetch(region_name: str, client: CatLinkAPI, pet_id: str, day: str) -> dict:
+        account = getattr(client, "account", None)
+        key = account_key(account) if account and day < today else None
+        if key and cache_reads:
+            cached = cache.get(key, region_name, pet_id, day)
+            if cached is not None:
+                return cached
+        data = client.get_cat_summary(pet_id, day, timezone_id=timezone_id)
+        if key and data:
+            cache.put(key, region_name, pet_id, day, data)
+        return data
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            jobs = [
+                (
+                    region_name,
+                    client,
+                    pet_id,
+                    day,
+                    pool.submit(fetch, region_name, client, pet_id, day),
+                )
+                for region_name, client in clients
+                for pet_id in pet_ids
+                if region_name in owners[pet_id]
+                for day in days
+            ]
+            for region_name, client, pet_id, day, future in jobs:
+                try:
+                    data = future.result()
+                except (CatLinkAPIError, httpx.HTTPError) as exc:
+                    failures.setdefault(region_name, []).append(f"{day}: {exc}")
+                    continue
+                if data:
+                    yield region_name, client, pet_id, day, data
+    finally:
+        cache.save()
+
+
+def _date_range(date_from: datetime.datetime, date_to: datetime.datetime | None) -> list[str]:
+    first = date_from.date()
+    last = date_to.date() if date_to else datetime.date.today()
+    if last < first:
+        raise click.BadParameter("must not be before --from", param_hint="--to")
+    return [
+        (first + datetime.timedelta(days=n)).isoformat() for n in range((last - first).days + 1)
+    ]
+
+
 @cli.command("cat-summary")
 @click.argument("pet_id")
 @click.option(
@@ -753,36 +1908,478 @@ def list_cats(region: str | None) -> None:
     default=None,
     help="Date in YYYY-MM-DD format. Defaults to today.",
 )
+@click.option(
+    "--from",
+    "date_from",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="First day of a date range (YYYY-MM-DD).",
+)
+@click.option(
+    "--to",
+    "date_to",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Last day of the range (YYYY-MM-DD). Defaults to today.",
+)
+@click.option(
+    "--concurrency",
+    default=DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Days fetched at the same time for a range.",
+)
 @_region_option
-def cat_summary(pet_id: str, date: str | None, region: str | None) -> None:
-    """Show a cat's health summary for a given date."""
+def cat_summary(
+    pet_id: str,
+    date: str | None,
+    date_from: datetime.datetime | None,
+    date_to: datetime.datetime | None,
+    concurrency: int,
+    region: str | None,
+) -> None:
+    """Show a cat's health summary for a given date or a range of dates."""
+    if date_from is None and date_to is not None:
+        raise click.UsageError("--to requires --from.")
+    if date_from is not None and date is not None:
+        raise click.UsageError("--date cannot be combined with --from/--to.")
+    if date_from is not None:
+        days = _date_range(date_from, date_to)
+        clients, multi = _load_clients(region, concurrency)
+        out = _output_writer()
+        failures: dict[str, list[str]] = {}
+        try:
+            header = None
+            for region_name, client, _, day, data in _fetch_summaries(
+                clients, [pet_id], days, concurrency, failures
+            ):
+                if multi and header != region_name:
+                    out.header(f"Region: {region_name} ({client.api_base})")
+                    header = region_name
+                out.record(
+                    {**data, "region": region_name, "petId": pet_id, "date": day},
+                    f"Date: {day}",
+                    *(f"  {key}: {val}" for key, val in data.items()),
+                )
+                out.flush()
+            out.close()
+            errors = [(name, "; ".join(msgs)) for name, msgs in failures.items()]
+            _report_outcome(errors, out.count, clients, "No summary data returned.")
+        finally:
+            for _, client in clients:
+                client.close()
+        return
     if date is None:
         date = datetime.date.today().isoformat()
     clients, multi = _load_clients(region)
     errors: list[tuple[str, str]] = []
-    shown = 0
+    out = _output_writer()
     try:
-        for region_name, client in clients:
-            try:
-                data = client.get_cat_summary(pet_id, date, timezone_id=get_system_timezone())
-            except CatLinkAPIError as exc:
-                errors.append((region_name, str(exc)))
-                continue
+        for region_name, client, data in _fan_out(
+            clients,
+            lambda c: c.get_cat_summary(pet_id, date, timezone_id=get_system_timezone()),
+            errors,
+        ):
             if not data:
                 continue
-            _echo_region_header(region_name, client.api_base, multi)
-            for key, val in data.items():
-                click.echo(f"  {key}: {val}")
-            shown += 1
-        if shown == 0:
-            if errors and len(errors) == len(clients):
-                msg = "; ".join(f"{region_name}: {err}" for region_name, err in errors)
-                click.echo(f"Error: {msg}", err=True)
-                sys.exit(1)
-            click.echo("No summary data returned.")
-        if errors and shown > 0:
-            for region_name, err in errors:
-                click.echo(f"Warning ({region_name}): {err}", err=True)
+            if multi:
+                out.header(f"Region: {region_name} ({client.api_base})")
+            out.record(
+                {**data, "region": region_name, "petId": pet_id, "date": date},
+                *(f"  {key}: {val}" for key, val in data.items()),
+            )
+            out.flush()
+        out.close()
+        _report_outcome(errors, out.count, clients, "No summary data returned.")
+    finally:
+        for _, client in clients:
+            client.close()
+
+
+def _stat(value: float | None, spec: str = ".2f") -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def _cat_stats_lines(pet_id: str, result: dict, window: int) -> list[str]:
+    lines = [f"Cat {pet_id}: {_stat(result['visitsPerDay'], '.1f')} visits/day"]
+    lines.append(
+        f"  {'Date':<10}  {'Weight':>7}  {f'Avg({window})':>7}  {'Visits':>6}"
+        f"  {'Weight z':>8}  {'Visits z':>8}"
+    )
+    for day in result["days"]:
+        flag = "  !" if day["anomaly"] else ""
+        lines.append(
+            f"  {day['date']:<10}  {_stat(day['weight']):>7}  {_stat(day['weightAvg']):>7}"
+            f"  {_stat(day['visits'], 'g'):>6}  {_stat(day['weightZ']):>8}"
+            f"  {_stat(day['visitsZ']):>8}{flag}"
+        )
+    lines.append(
+        f"  {'Week of':<10}  {'Weight':>7}  {'Change':>7}  {'Visits/day':>10}  {'Change':>7}"
+    )
+    for week in result["weeks"]:
+        lines.append(
+            f"  {week['week']:<10}  {_stat(week['weight']):>7}"
+            f"  {_stat(week['weightDelta'], '+.2f'):>7}  {_stat(week['visitsPerDay'], '.1f'):>10}"
+            f"  {_stat(week['visitsDelta'], '+.1f'):>7}"
+        )
+    return lines
+
+
+@cli.command("cat-stats")
+@click.argument("pet_ids", nargs=-1, required=True, metavar="PET_ID...")
+@click.option(
+    "--from",
+    "date_from",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=True,
+    help="First day to analyse (YYYY-MM-DD).",
+)
+@click.option(
+    "--to",
+    "date_to",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Last day to analyse (YYYY-MM-DD). Defaults to today.",
+)
+@click.option(
+    "--window",
+    default=STATS_WINDOW,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Days in the rolling weight average.",
+)
+@click.option(
+    "--threshold",
+    default=STATS_Z_THRESHOLD,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Flag days whose weight or visit z-score reaches this magnitude.",
+)
+@click.option(
+    "--concurrency",
+    default=DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Days fetched at the same time.",
+)
+@_region_option
+def cat_stats(
+    pet_ids: tuple[str, ...],
+    date_from: datetime.datetime,
+    date_to: datetime.datetime | None,
+    window: int,
+    threshold: float,
+    concurrency: int,
+    region: str | None,
+) -> None:
+    """Analyse cats' weight and toilet visits over a range of days (requires NumPy)."""
+    if not numpy_available():
+        click.echo("Error: cat-stats requires NumPy. Install the 'stats' extra.", err=True)
+        sys.exit(1)
+    days = _date_range(date_from, date_to)
+    clients, _ = _load_clients(region, concurrency)
+    failures: dict[str, list[str]] = {}
+    summaries: dict[str, dict[str, dict]] = {pet_id: {} for pet_id in pet_ids}
+    out = _output_writer()
+    try:
+        for _, _, pet_id, day, data in _fetch_summaries(
+            clients, list(pet_ids), days, concurrency, failures
+        ):
+            summaries[pet_id].setdefault(day, data)
+        found = sum(len(by_day) for by_day in summaries.values())
+        if found:
+            for pet_id, result in analyse(days, summaries, window, threshold).items():
+                out.record({"petId": pet_id, **result}, *_cat_stats_lines(pet_id, result, window))
+        out.close()
+        errors = [(name, "; ".join(msgs)) for name, msgs in failures.items()]
+        _report_outcome(errors, found, clients, "No summary data returned.")
+    finally:
+        for _, client in clients:
+            client.close()
+
+
+def _select_devices(
+    clients: list[tuple[str, CatLinkAPI]], device_ids: tuple[str, ...], purpose: str
+) -> list[WatchedDevice]:
+    """
+    List devices in every region and pick the ones a polling command should follow.
+
+    Uncached reads are switched on for the clients, since pollers need current data.
+
+    Args:
+        clients: List of (region, client) tuples.
+        device_ids: Requested device IDs, or empty for all devices.
+        purpose: Verb used in the error when nothing matches (e.g. "watch").
+
+    Returns:
+        Selected devices ordered by region, then ID.
+    """
+    errors: list[tuple[str, str]] = []
+    selected: list[WatchedDevice] = []
+    for region_name, client, devices in _fan_out(clients, lambda c: c.get_devices(), errors):
+        for dev in devices:
+            device = Device.from_payload(dev)
+            if device.id and (not device_ids or device.id in device_ids):
+                selected.append(
+                    WatchedDevice(
+                        region_name,
+                        client,
+                        device.id,
+                        device.type or "SCOOPER",
+                        device.name or "unnamed",
+                    )
+                )
+    _report_outcome(errors, len(clients) - len(errors), clients)
+    found = {device.device_id for device in selected}
+    for dev_id in device_ids:
+        if dev_id not in found:
+            click.echo(f"Warning: device {dev_id} not found.", err=True)
+    if not selected:
+        click.echo(f"Error: no devices to {purpose}.", err=True)
+        sys.exit(1)
+    order = {name: index for index, (name, _) in enumerate(clients)}
+    selected.sort(key=lambda device: (order[device.region], device.device_id))
+    for _, client in clients:
+        client.cache_reads = False
+    return selected
+
+
+@cli.command()
+@click.argument("device_ids", nargs=-1, metavar="[DEVICE_ID]...")
+@click.option(
+    "--min-interval",
+    default=WATCH_MIN_INTERVAL,
+    show_default=True,
+    type=click.FloatRange(min=1),
+    help="Seconds between polls while a device is running.",
+)
+@click.option(
+    "--max-interval",
+    default=WATCH_MAX_INTERVAL,
+    show_default=True,
+    type=click.FloatRange(min=1),
+    help="Longest delay between polls while idle; the delay doubles after each idle poll.",
+)
+@click.option(
+    "--count",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Stop after polling each device this many times.",
+)
+@click.option(
+    "--concurrency",
+    default=DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Devices polled at the same time.",
+)
+@_region_option
+def watch(
+    device_ids: tuple[str, ...],
+    min_interval: float,
+    max_interval: float,
+    count: int | None,
+    concurrency: int,
+    region: str | None,
+) -> None:
+    """Poll devices (all by default) and print fields as they change."""
+    if max_interval < min_interval:
+        raise click.BadParameter("must not be below --min-interval", param_hint="--max-interval")
+    clients, _ = _load_clients(region, concurrency)
+    try:
+        watched = _select_devices(clients, device_ids, "watch")
+        watcher = DeviceWatcher(watched, click.echo, min_interval, max_interval, concurrency)
+        stop = threading.Event()
+        _keep_tokens_fresh(clients, stop)
+        try:
+            watcher.run(count)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
+    finally:
+        for _, client in clients:
+            client.close()
+
+
+@cli.command()
+@click.argument("device_ids", nargs=-1, metavar="[DEVICE_ID]...")
+@click.option(
+    "--interval",
+    default=RECORD_INTERVAL,
+    show_default=True,
+    type=click.FloatRange(min=1),
+    help="Seconds between polls.",
+)
+@click.option(
+    "--count",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Stop after this many polls.",
+)
+@click.option(
+    "--db",
+    "db_path",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    default=None,
+    help="SQLite database. Defaults to $CATLINK_DB or ~/.local/share/catlink-cli/history.db.",
+)
+@click.option(
+    "--concurrency",
+    default=DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Devices polled at the same time.",
+)
+@_region_option
+def record(
+    device_ids: tuple[str, ...],
+    interval: float,
+    count: int | None,
+    db_path: pathlib.Path | None,
+    concurrency: int,
+    region: str | None,
+) -> None:
+    """Poll device status and logs (all devices by default) into a local database."""
+    clients, _ = _load_clients(region, concurrency)
+    try:
+        devices = _select_devices(clients, device_ids, "record")
+        store = HistoryStore(db_path)
+        recorder = Recorder(
+            devices, store, lambda line: click.echo(line, err=True), interval, concurrency
+        )
+        stop = threading.Event()
+        _keep_tokens_fresh(clients, stop)
+        try:
+            recorder.run(count)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
+            store.close()
+    finally:
+        for _, client in clients:
+            client.close()
+
+
+def _history_line(row: dict, fields: list[str]) -> str:
+    label = f"{row.get('name') or 'unnamed'} ({row['device_id']})"
+    values = " ".join(f"{field}={row[field]:g}" for field in fields if row.get(field) is not None)
+    return f"  {label}  {values}".rstrip()
+
+
+@cli.command()
+@click.argument("device_id", required=False)
+@click.option(
+    "--since",
+    type=click.DateTime(formats=_TIME_FORMATS),
+    default=None,
+    help="First local time to include.",
+)
+@click.option(
+    "--until",
+    type=click.DateTime(formats=_TIME_FORMATS),
+    default=None,
+    help="Last local time to include.",
+)
+@click.option(
+    "--daily",
+    is_flag=True,
+    default=False,
+    help="One row per device and day: average weights and the number of cleans.",
+)
+@click.option("--logs", "show_logs", is_flag=True, default=False, help="Show log events.")
+@click.option(
+    "--db",
+    "db_path",
+    type=click.Path(dir_okay=False, exists=True, path_type=pathlib.Path),
+    default=None,
+    help="SQLite database written by 'catlink record'.",
+)
+def history(
+    device_id: str | None,
+    since: datetime.datetime | None,
+    until: datetime.datetime | None,
+    daily: bool,
+    show_logs: bool,
+    db_path: pathlib.Path | None,
+) -> None:
+    """Query status and logs stored by 'catlink record', without calling the API."""
+    if daily and show_logs:
+        raise click.UsageError("--daily and --logs cannot be combined.")
+    path = db_path or default_db_path()
+    if not path.exists():
+        click.echo(f"Error: no recorded history at {path}. Run 'catlink record' first.", err=True)
+        sys.exit(1)
+    store = HistoryStore(path)
+    out = _output_writer()
+    try:
+        if show_logs:
+            rows = store.logs(
+                device_id,
+                since.strftime("%Y-%m-%d %H:%M:%S") if since else None,
+                until.strftime("%Y-%m-%d %H:%M:%S") if until else None,
+            )
+            for row in rows:
+                parts = [row["event"], row["first_section"] or "", row["second_section"] or ""]
+                text = " ".join(part for part in parts if part)
+                out.record(row, f"[{row['time']}] {row['name'] or row['device_id']}: {text}")
+        else:
+            since_ts = since.timestamp() if since else None
+            until_ts = until.timestamp() if until else None
+            if daily:
+                fields = ["samples", "litter_weight", "food_weight", "cleans"]
+                for row in store.daily(device_id, since_ts, until_ts):
+                    out.record(row, f"{row['day']}{_history_line(row, fields)}")
+            else:
+                fields = ["online", *STATUS_COLUMNS.values()]
+                for row in store.status(device_id, since_ts, until_ts):
+                    stamp = format_timestamp(row["ts"])
+                    out.record(row, f"{stamp}{_history_line(row, fields)}")
+        out.close()
+        if out.count == 0:
+            click.echo("No recorded history in this range.", err=out.structured)
+    finally:
+        store.close()
+
+
+@cli.command()
+@click.option(
+    "--min-interval",
+    default=WATCH_MIN_INTERVAL,
+    show_default=True,
+    type=click.FloatRange(min=1),
+    help="Seconds between polls of a device while it is running.",
+)
+@click.option(
+    "--max-interval",
+    default=WATCH_MAX_INTERVAL,
+    show_default=True,
+    type=click.FloatRange(min=1),
+    help="Longest delay between polls of an idle device.",
+)
+@_region_option
+def top(min_interval: float, max_interval: float, region: str | None) -> None:
+    """Full-screen dashboard of every device; press q to quit."""
+    if max_interval < min_interval:
+        raise click.BadParameter("must not be below --min-interval", param_hint="--max-interval")
+    if not curses_available():
+        click.echo("Error: 'catlink top' needs the curses module.", err=True)
+        sys.exit(1)
+    if not terminal_attached():
+        click.echo("Error: 'catlink top' needs a terminal; use 'catlink watch' instead.", err=True)
+        sys.exit(1)
+    clients, _ = _load_clients(region)
+    try:
+        devices = _select_devices(clients, (), "show")
+        stop = threading.Event()
+        _keep_tokens_fresh(clients, stop)
+        try:
+            run_dashboard(devices, min_interval, max_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
     finally:
         for _, client in clients:
             client.close()
@@ -9,6 +9,54 @@ API_SERVERS: dict[str, str] = {
     "singapore": "https://app-sgp.catlinks.cn/api/",
 }
 
+FAN_OUT_TIMEOUT = 90.0
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+WATCH_MIN_INTERVAL = 5.0
+WATCH_MAX_INTERVAL = 300.0
+
+OUTPUT_FORMATS = ["text", "json", "ndjson"]
+OUTPUT_BUFFER_SIZE = 64 * 1024
+
+LOG_PAGE_SIZE = 100
+
+RECORD_INTERVAL = 300.0
+
+STATS_WINDOW = 7
+STATS_Z_THRESHOLD = 2.0
+
+CACHE_DIR_ENV = "CATLINK_CACHE_DIR"
+DAEMON_SOCKET_ENV = "CATLINK_DAEMON_SOCKET"
+DB_PATH_ENV = "CATLINK_DB"
+CAPABILITY_CACHE_TTL = 7 * 24 * 3600
+
+BACKGROUND_REFRESH_GRACE = 10.0
+# Longest time a cached response waits in memory before it is written to disk.
+RESPONSE_CACHE_FLUSH_INTERVAL = 30.0
+# Longest time a fetched cat summary waits in memory before it is written to disk.
+SUMMARY_CACHE_FLUSH_INTERVAL = 5.0
+
+TOKEN_VALIDATE_INTERVAL = 15 * 60
+TOKEN_REFRESH_AGE = 24 * 3600
+TOKEN_CHECK_PERIOD = 60.0
+
+# Response cache lifetimes per read endpoint: (fresh seconds, stale seconds).
+# Fresh entries are returned as-is; stale entries are returned immediately and
+# refreshed in the background; older entries are refetched.
+RESPONSE_CACHE_TTLS: dict[str, tuple[float, float]] = {
+    "token/device/union/list/sorted": (300, 3600),
+    "token/device/feeder/list": (300, 3600),
+    "token/device/feeder/list/sorted": (300, 3600),
+    "token/device/list": (300, 3600),
+    "token/device/info": (15, 300),
+    "token/litterbox/info": (15, 300),
+    "token/litterbox/info/c08": (15, 300),
+    "token/device/feeder/detail": (15, 300),
+    "token/device/purepro/detail": (15, 300),
+    "token/pet/health/v3/cats": (3600, 24 * 3600),
+}
+
 SIGN_KEY = "00109190907746a7ad0e2139b6d09ce47551770157fe4ac5922f3a5454c82712"
 
 RSA_PUBLIC_KEY = (
@@ -42,6 +90,12 @@ DEVICE_ACTIONS: dict[str, dict[str, str]] = {
     },
 }
 
+# Device types accepted by the device commands: clean, pause, mode, action and
+# the resets; feed; change-bag.
+ACTION_TYPES: tuple[str, ...] = ("SCOOPER", "LITTER_BOX_599")
+FEED_TYPES: tuple[str, ...] = ("FEEDER",)
+BAG_TYPES: tuple[str, ...] = ("LITTER_BOX_599",)
+
 WORK_STATUSES: dict[str, str] = {
     "00": "idle",
     "01": "running",
@@ -54,3 +108,5 @@ KEYRING_PHONE_KEY = "phone"
 KEYRING_IAC_KEY = "phone_iac"
 KEYRING_API_BASE_KEY = "api_base"
 KEYRING_VERIFY_KEY = "verify_ssl"
+KEYRING_TOKEN_TIME_KEY = "token_issued_at"
+KEYRING_PROFILES_KEY = "profiles"
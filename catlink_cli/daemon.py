@@ -0,0 +1,375 @@
+"""Background daemon that keeps authenticated CatLink clients warm.
+
+The daemon listens on a Unix domain socket and speaks newline-delimited JSON.
+Each request is an object with an ``op`` field; each response is an object with
+``ok`` and either ``result`` or ``error`` (plus ``code`` for API errors).
+"""
+
+import json
+import logging
+import os
+import pathlib
+import socket
+import socketserver
+import threading
+from typing import BinaryIO
+
+import httpx
+
+from .api import (
+    CatLinkAPI,
+    CatLinkAPIError,
+    get_authenticated_clients,
+    invalidate_credential_cache,
+    keep_tokens_fresh,
+)
+from .cache import cache_dir
+from .const import DAEMON_SOCKET_ENV
+
+logger = logging.getLogger(__name__)
+
+DAEMON_METHODS = frozenset(
+    {
+        "get_devices",
+        "get_device_detail",
+        "get_device_logs",
+        "get_device_log_page",
+        "get_cats",
+        "get_cat_summary",
+        "change_mode",
+        "send_action",
+        "replace_garbage_bag",
+        "reset_consumable",
+        "food_out",
+    }
+)
+
+# Read methods that take fresh=True to skip the response cache for one call.
+FRESH_METHODS = frozenset({"get_devices", "get_device_detail", "get_cats"})
+
+
+def socket_path() -> pathlib.Path:
+    """
+    Return the Unix socket path used by the daemon.
+
+    Returns:
+        Socket path.
+    """
+    override = os.environ.get(DAEMON_SOCKET_ENV)
+    if override:
+        return pathlib.Path(override)
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    base = pathlib.Path(runtime) / "catlink-cli" if runtime else cache_dir()
+    return base / "daemon.sock"
+
+
+def _encode(payload: dict) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode() + b"\n"
+
+
+def _error(exc: Exception) -> dict:
+    return {"ok": False, "error": str(exc), "code": getattr(exc, "code", 0)}
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                request = None
+            if not isinstance(request, dict):
+                self._reply({"ok": False, "error": "Malformed request", "code": 0})
+                continue
+            try:
+                self._reply(self.server.dispatch(request))
+            except OSError:
+                # The client gave up (e.g. its timeout passed) and closed the socket.
+                return
+            if request.get("op") == "shutdown":
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+    def _reply(self, response: dict) -> None:
+        self.wfile.write(_encode(response))
+        self.wfile.flush()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server holding one authenticated client per stored region."""
+
+    daemon_threads = True
+
+    def __init__(self, path: pathlib.Path | None = None) -> None:
+        self.path = path or socket_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        if self.path.exists():
+            self.path.unlink()
+        self._lock = threading.Lock()
+        self._clients: dict[str, CatLinkAPI] | None = None
+        super().__init__(str(self.path), _DaemonHandler)
+        os.chmod(self.path, 0o600)
+        self._stop = threading.Event()
+        keep_tokens_fresh(self._loaded_clients, self._stop)
+
+    def _loaded_clients(self) -> list[CatLinkAPI]:
+        with self._lock:
+            return list((self._clients or {}).values())
+
+    def clients(self) -> dict[str, CatLinkAPI]:
+        """
+        Return the warm clients, loading stored credentials on first use.
+
+        Returns:
+            Mapping of region name to client.
+        """
+        with self._lock:
+            if self._clients is None:
+                self._clients = dict(get_authenticated_clients())
+            return self._clients
+
+    def reload(self) -> None:
+        """
+        Drop the warm clients so stored credentials are read again on next use.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            clients, self._clients = self._clients, None
+            invalidate_credential_cache()
+        for client in (clients or {}).values():
+            client.close()
+
+    def dispatch(self, request: dict) -> dict:
+        """
+        Handle one decoded request.
+
+        Args:
+            request: Request object.
+
+        Returns:
+            Response object.
+        """
+        op = request.get("op")
+        try:
+            if op in ("ping", "shutdown"):
+                return {"ok": True, "result": op}
+            if op == "reload":
+                self.reload()
+                return {"ok": True, "result": None}
+            if op == "clients":
+                return {"ok": True, "result": self._list_clients(request.get("region"))}
+            if op == "call":
+                return {"ok": True, "result": self._call(request)}
+            return {"ok": False, "error": f"Unknown operation: {op}", "code": 0}
+        except (CatLinkAPIError, httpx.HTTPError) as exc:
+            return _error(exc)
+        except Exception as exc:
+            # Bad arguments or an unexpected failure must not kill the connection.
+            logger.exception("Daemon request %s failed", op)
+            return _error(exc)
+
+    def _list_clients(self, region: str | None) -> list[list[str]]:
+        clients = self.clients()
+        if region:
+            if region not in clients:
+                raise CatLinkAPIError("Not logged in. Run 'catlink login' first.")
+            return [[region, clients[region].api_base]]
+        return [[name, client.api_base] for name, client in clients.items()]
+
+    def _call(self, request: dict) -> object:
+        method = request.get("method")
+        if method not in DAEMON_METHODS:
+            raise CatLinkAPIError(f"Method not allowed: {method}")
+        region = request.get("region")
+        client = self.clients().get(region)
+        if client is None:
+            raise CatLinkAPIError(f"No client for region {region}")
+        kwargs = dict(request.get("kwargs", {}))
+        # Freshness is passed per call; the warm client is shared by every caller.
+        if request.get("fresh") and method in FRESH_METHODS:
+            kwargs["fresh"] = True
+        return getattr(client, method)(*request.get("args", []), **kwargs)
+
+    def server_close(self) -> None:
+        """Close the socket, the warm clients and remove the socket file."""
+        self._stop.set()
+        super().server_close()
+        self.reload()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class DaemonClient:
+    """
+    Forward CatLinkAPI calls for one region to the running daemon.
+
+    Each call borrows a connection from a small pool, so concurrent calls are
+    served by the daemon in parallel instead of queuing on a single socket.
+    """
+
+    def __init__(
+        self,
+        region: str,
+        api_base: str,
+        path: pathlib.Path,
+        timeout: float | None = None,
+    ) -> None:
+        self.region = region
+        self.api_base = api_base
+        self.path = path
+        self.timeout = timeout
+        self.cache_reads = True
+        self._idle: list[tuple[socket.socket, BinaryIO]] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> tuple[socket.socket, BinaryIO]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.path))
+        except OSError:
+            sock.close()
+            raise
+        return sock, sock.makefile("rb")
+
+    def _roundtrip(self, payload: dict) -> object:
+        try:
+            sock, reader = self._connect()
+        except OSError as exc:
+            raise CatLinkAPIError(f"Cannot reach the daemon: {exc}") from exc
+        try:
+            sock.sendall(_encode(payload))
+            line = reader.readline()
+        except OSError as exc:
+            # A late reply would be read by the next call, so drop the connection.
+            reader.close()
+            sock.close()
+            if isinstance(exc, TimeoutError):
+                raise CatLinkAPIError("Daemon did not answer in time") from exc
+            raise CatLinkAPIError(f"Daemon connection failed: {exc}") from exc
+        if not line:
+            reader.close()
+            sock.close()
+            raise CatLinkAPIError("Daemon closed the connection")
+        with self._lock:
+            self._idle.append((sock, reader))
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise CatLinkAPIError(
+                response.get("error", "Daemon error"), code=response.get("code", 0)
+            )
+        return response.get("result")
+
+    def __getattr__(self, name: str) -> object:
+        if name not in DAEMON_METHODS:
+            raise AttributeError(name)
+
+        def _remote(*args: object, **kwargs: object) -> object:
+            return self._roundtrip(
+                {
+                    "op": "call",
+                    "region": self.region,
+                    "method": name,
+                    "args": list(args),
+                    "kwargs": kwargs,
+                    "fresh": not self.cache_reads,
+                }
+            )
+
+        return _remote
+
+    def close(self) -> None:
+        """Close the pooled connections to the daemon."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for sock, reader in idle:
+            reader.close()
+            sock.close()
+
+
+def send_command(
+    op: str, path: pathlib.Path | None = None, timeout: float | None = None, **fields: object
+) -> object:
+    """
+    Send a single request to the daemon.
+
+    Args:
+        op: Operation name.
+        path: Socket path, defaults to socket_path().
+        timeout: Socket timeout in seconds, or None to wait forever.
+        **fields: Additional request fields.
+
+    Returns:
+        The response result.
+
+    Raises:
+        OSError: If the daemon is not running or does not answer within timeout.
+        CatLinkAPIError: If the daemon reports an error.
+    """
+    path = path or socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(_encode({"op": op, **fields}))
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise CatLinkAPIError("Daemon closed the connection")
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise CatLinkAPIError(response.get("error", "Daemon error"), code=response.get("code", 0))
+    return response.get("result")
+
+
+def daemon_clients(
+    region: str | None = None, timeout: float | None = None
+) -> list[tuple[str, DaemonClient]] | None:
+    """
+    Return proxies for the daemon's clients, or None when no daemon is running.
+
+    Args:
+        region: Optional region identifier to select a single region.
+        timeout: Socket timeout in seconds for each request, or None to wait
+            forever.
+
+    Returns:
+        List of (region, DaemonClient) tuples, or None.
+
+    Raises:
+        CatLinkAPIError: If the daemon has no credentials for the requested region.
+    """
+    path = socket_path()
+    if not path.exists():
+        return None
+    try:
+        listed = send_command("clients", path, timeout, region=region)
+    except OSError:
+        return None
+    return [(name, DaemonClient(name, api_base, path, timeout)) for name, api_base in listed]
+
+
+def notify_reload() -> None:
+    """
+    Ask a running daemon to reload stored credentials; no-op if none is running.
+
+    Returns:
+        None.
+    """
+    path = socket_path()
+    if not path.exists():
+        return
+    try:
+        send_command("reload", path)
+    except (OSError, CatLinkAPIError) as exc:
+        logger.debug("Could not notify daemon: %s", exc)
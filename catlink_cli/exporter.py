@@ -0,0 +1,242 @@
+"""Prometheus metrics exporter for CatLink devices."""
+
+import http.server
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from .api import CatLinkAPI, CatLinkAPIError, fan_out
+from .const import DEFAULT_MAX_CONCURRENCY
+from .models import Device, FeederDetail, LitterBoxDetail, parse_detail
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (detail model attribute, metric name, help text)
+DEVICE_METRICS: list[tuple[str, str, str]] = [
+    ("litter_weight", "catlink_litter_weight_kg", "Cat litter weight in kilograms."),
+    ("litter_days", "catlink_litter_countdown_days", "Days of litter remaining."),
+    ("deodorant_days", "catlink_deodorant_countdown_days", "Days of deodorant remaining."),
+    ("induction_cleans", "catlink_induction_cleans", "Automatic cleans reported by the device."),
+    ("manual_cleans", "catlink_manual_cleans", "Manual cleans reported by the device."),
+    ("temperature", "catlink_temperature_celsius", "Temperature in degrees Celsius."),
+    ("humidity", "catlink_humidity_percent", "Relative humidity in percent."),
+    ("weight", "catlink_feeder_food_weight_grams", "Food weight in the feeder in grams."),
+]
+
+
+def parse_listen(value: str) -> tuple[str, int]:
+    """
+    Parse a listen address of the form [HOST]:PORT.
+
+    Args:
+        value: Address string, e.g. ":9877" or "127.0.0.1:9877".
+
+    Returns:
+        Tuple of (host, port). An empty host binds all interfaces.
+
+    Raises:
+        ValueError: If the address is malformed.
+    """
+    host, sep, port = value.rpartition(":")
+    if not sep or not port.isdigit() or not 0 < int(port) < 65536:
+        raise ValueError(f"Invalid listen address: {value!r} (expected [HOST]:PORT)")
+    return host.strip("[]"), int(port)
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(values: dict[str, object]) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in values.items())
+
+
+def _format(value: float) -> str:
+    return repr(int(value)) if value.is_integer() else repr(value)
+
+
+class FleetPoller:
+    """Poll every device in every region and keep the rendered metrics snapshot."""
+
+    def __init__(
+        self,
+        clients: list[tuple[str, CatLinkAPI]],
+        interval: float,
+        timeout: float | None = None,
+        concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self.clients = clients
+        self.interval = interval
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self._snapshot = self._render([], {}, None, 0.0)
+
+    @property
+    def snapshot(self) -> bytes:
+        """The metrics text from the last completed poll."""
+        return self._snapshot
+
+    def _poll_region(
+        self, client: CatLinkAPI, region: str
+    ) -> list[tuple[Device, LitterBoxDetail | FeederDetail | None]]:
+        devices = [
+            Device.from_payload(dev) for dev in client.get_devices() if isinstance(dev, dict)
+        ]
+
+        def detail(device: Device) -> LitterBoxDetail | FeederDetail | None:
+            device_type = device.type or "SCOOPER"
+            try:
+                data = client.get_device_detail(device.id, device_type)
+            except (CatLinkAPIError, httpx.HTTPError) as exc:
+                logger.warning("Detail for device %s (%s) failed: %s", device.id, region, exc)
+                return None
+            return parse_detail(data, device_type)
+
+        if not devices:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(devices))) as pool:
+            return list(zip(devices, pool.map(detail, devices), strict=True))
+
+    def poll_once(self) -> None:
+        """
+        Poll all regions and replace the snapshot.
+
+        Returns:
+            None.
+        """
+        started = time.monotonic()
+        rows: list[tuple[str, Device, LitterBoxDetail | FeederDetail | None]] = []
+        errors: dict[str, str] = {}
+        order = {name: index for index, (name, _) in enumerate(self.clients)}
+        calls = [
+            (name, lambda c=client, n=name: self._poll_region(c, n))
+            for name, client in self.clients
+        ]
+        for name, result, exc in fan_out(calls, timeout=self.timeout):
+            if exc is not None:
+                logger.warning("Polling %s failed: %s", name, exc)
+                errors[name] = str(exc)
+                continue
+            rows.extend((name, dev, detail) for dev, detail in result)
+        rows.sort(key=lambda row: (order[row[0]], row[1].id))
+        self._snapshot = self._render(rows, errors, time.time(), time.monotonic() - started)
+
+    def run(self, stop: threading.Event) -> None:
+        """
+        Poll until the stop event is set.
+
+        Args:
+            stop: Event that ends the loop.
+
+        Returns:
+            None.
+        """
+        while not stop.is_set():
+            started = time.monotonic()
+            try:
+                self.poll_once()
+            except Exception:
+                logger.exception("Poll failed")
+            stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def _render(
+        self,
+        rows: list[tuple[str, Device, LitterBoxDetail | FeederDetail | None]],
+        errors: dict[str, str],
+        polled_at: float | None,
+        duration: float,
+    ) -> bytes:
+        lines: list[str] = []
+
+        def family(name: str, help_text: str, samples: list[tuple[str, float]]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in samples:
+                lines.append(
+                    f"{name}{{{labels}}} {_format(value)}" if labels else f"{name} {_format(value)}"
+                )
+
+        devices: list[tuple[str, LitterBoxDetail | FeederDetail | None]] = []
+        for region, device, detail in rows:
+            labels = {
+                "region": region,
+                "device_id": device.id,
+                "device_name": device.name,
+                "device_type": device.type,
+                "model": device.model,
+            }
+            devices.append((_labels(labels), detail))
+
+        family(
+            "catlink_device_up",
+            "Whether the last poll fetched the device detail.",
+            [(labels, float(detail is not None)) for labels, detail in devices],
+        )
+        family(
+            "catlink_device_online",
+            "Whether the device reports itself online.",
+            [
+                (labels, float(detail.online))
+                for labels, detail in devices
+                if detail is not None and detail.online is not None
+            ],
+        )
+        for field, name, help_text in DEVICE_METRICS:
+            samples = [(labels, getattr(detail, field, None)) for labels, detail in devices]
+            present = [(labels, float(value)) for labels, value in samples if value is not None]
+            if present:
+                family(name, help_text, present)
+
+        if polled_at is not None:
+            family(
+                "catlink_exporter_region_up",
+                "Whether the last poll of the region succeeded.",
+                [
+                    (_labels({"region": name}), float(name not in errors))
+                    for name, _ in self.clients
+                ],
+            )
+            family(
+                "catlink_exporter_last_poll_timestamp_seconds",
+                "Unix time the last poll finished.",
+                [("", polled_at)],
+            )
+            family(
+                "catlink_exporter_poll_duration_seconds",
+                "Duration of the last poll in seconds.",
+                [("", duration)],
+            )
+        return ("\n".join(lines) + "\n").encode()
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    server: "MetricsServer"
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.poller.snapshot
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class MetricsServer(http.server.ThreadingHTTPServer):
+    """HTTP server answering /metrics from the poller's last snapshot."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], poller: FleetPoller) -> None:
+        self.poller = poller
+        super().__init__(address, _MetricsHandler)
@@ -0,0 +1,238 @@
+"""Local JSON HTTP gateway that shares one set of CatLink clients between callers."""
+
+import datetime
+import http.server
+import json
+import logging
+import re
+import threading
+import urllib.parse
+from collections.abc import Callable
+
+import httpx
+
+from .api import CatLinkAPI, CatLinkAPIError, fan_out, get_system_timezone
+from .batch import BatchError, code_for
+from .cache import DeviceRegistry
+from .const import DEFAULT_MAX_CONCURRENCY, DEVICE_ACTIONS, DEVICE_MODES
+from .models import Device
+
+logger = logging.getLogger(__name__)
+
+
+class GatewayError(Exception):
+    """Request error carrying the HTTP status to return."""
+
+    def __init__(self, status: int, message: str, code: int = 0) -> None:
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+
+def _code_for(names: dict[str, str], name: str, kind: str) -> str:
+    try:
+        return code_for(names, name, kind)
+    except BatchError as exc:
+        raise GatewayError(400, str(exc)) from exc
+
+
+class Gateway:
+    """Serve CatLink API calls for many local callers through shared clients."""
+
+    def __init__(
+        self,
+        clients: list[tuple[str, CatLinkAPI]],
+        max_upstream: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float | None = None,
+    ) -> None:
+        self.clients = clients
+        self.timeout = timeout
+        self.registry = DeviceRegistry()
+        self._upstream = threading.BoundedSemaphore(max_upstream)
+
+    def _call[T](self, func: Callable[[], T]) -> T:
+        with self._upstream:
+            return func()
+
+    def _select(self, region: str | None) -> list[tuple[str, CatLinkAPI]]:
+        if region is None:
+            return self.clients
+        selected = [(name, client) for name, client in self.clients if name == region]
+        if not selected:
+            raise GatewayError(404, f"No credentials for region {region}")
+        return selected
+
+    def _per_region[T](
+        self, region: str | None, call: Callable[[CatLinkAPI], T]
+    ) -> tuple[dict[str, T], dict[str, str]]:
+        clients = self._select(region)
+        calls = [(name, lambda c=client: self._call(lambda: call(c))) for name, client in clients]
+        results: dict[str, T] = {}
+        errors: dict[str, str] = {}
+        for name, result, exc in fan_out(calls, timeout=self.timeout):
+            if exc is None:
+                results[name] = result
+            elif isinstance(exc, (CatLinkAPIError, httpx.HTTPError, TimeoutError)):
+                errors[name] = str(exc)
+            else:
+                raise exc
+        if errors and not results:
+            raise GatewayError(502, "; ".join(f"{name}: {err}" for name, err in errors.items()))
+        ordered = {name: results[name] for name, _ in clients if name in results}
+        return ordered, errors
+
+    def _upstream_call[T](self, func: Callable[[], T]) -> T:
+        try:
+            return self._call(func)
+        except CatLinkAPIError as exc:
+            raise GatewayError(502, str(exc), exc.code) from exc
+        except httpx.HTTPError as exc:
+            raise GatewayError(502, str(exc)) from exc
+
+    def _locate(self, device_id: str, device_type: str | None) -> tuple[str, CatLinkAPI, str]:
+        by_region = dict(self.clients)
+        entry = self.registry.lookup(device_id)
+        if entry is None or entry["region"] not in by_region:
+            for region, devices in self._per_region(None, lambda c: c.get_devices())[0].items():
+                for dev in devices:
+                    device = Device.from_payload(dev)
+                    if device.id == device_id:
+                        entry = {"region": region, "deviceType": device.type or None}
+                        break
+        if entry is None or entry["region"] not in by_region:
+            raise GatewayError(404, f"Device {device_id} not found")
+        region = entry["region"]
+        return region, by_region[region], device_type or entry.get("deviceType") or "SCOOPER"
+
+    def devices(self, query: dict[str, str]) -> dict:
+        """List devices in every region (or one region with ?region=)."""
+        results, errors = self._per_region(query.get("region"), lambda c: c.get_devices())
+        devices = [{**dev, "region": region} for region, devs in results.items() for dev in devs]
+        return {"devices": devices, "errors": errors}
+
+    def status(self, device_id: str, query: dict[str, str]) -> dict:
+        """Return the detail of one device."""
+        region, client, device_type = self._locate(device_id, query.get("type"))
+        detail = self._upstream_call(lambda: client.get_device_detail(device_id, device_type))
+        return {
+            "region": region,
+            "deviceId": device_id,
+            "deviceType": device_type,
+            "detail": detail,
+        }
+
+    def logs(self, device_id: str, query: dict[str, str]) -> dict:
+        """Return the recent logs of one device."""
+        region, client, device_type = self._locate(device_id, query.get("type"))
+        logs = self._upstream_call(lambda: client.get_device_logs(device_id, device_type))
+        return {"region": region, "deviceId": device_id, "deviceType": device_type, "logs": logs}
+
+    def change_mode(self, device_id: str, query: dict[str, str], body: dict) -> dict:
+        """Change the working mode of one device."""
+        region, client, device_type = self._locate(device_id, query.get("type"))
+        code = _code_for(DEVICE_MODES.get(device_type, {}), str(body.get("mode")), "mode")
+        result = self._upstream_call(lambda: client.change_mode(device_id, code, device_type))
+        return {"region": region, "deviceId": device_id, "result": result}
+
+    def send_action(self, device_id: str, query: dict[str, str], body: dict) -> dict:
+        """Send an action to one device."""
+        region, client, device_type = self._locate(device_id, query.get("type"))
+        code = _code_for(DEVICE_ACTIONS.get(device_type, {}), str(body.get("action")), "action")
+        result = self._upstream_call(lambda: client.send_action(device_id, code, device_type))
+        return {"region": region, "deviceId": device_id, "result": result}
+
+    def cats(self, query: dict[str, str]) -> dict:
+        """List cats in every region (or one region with ?region=)."""
+        timezone_id = get_system_timezone()
+        results, errors = self._per_region(
+            query.get("region"), lambda c: c.get_cats(timezone_id=timezone_id)
+        )
+        cats = [{**cat, "region": region} for region, items in results.items() for cat in items]
+        return {"cats": cats, "errors": errors}
+
+    def cat_summary(self, pet_id: str, query: dict[str, str]) -> dict:
+        """Return a cat's health summary for ?date= (default today) per region."""
+        date = query.get("date") or datetime.date.today().isoformat()
+        timezone_id = get_system_timezone()
+        results, errors = self._per_region(
+            query.get("region"), lambda c: c.get_cat_summary(pet_id, date, timezone_id=timezone_id)
+        )
+        return {"summaries": results, "errors": errors}
+
+
+_ROUTES: list[tuple[str, re.Pattern[str], str]] = [
+    ("GET", re.compile(r"/devices"), "devices"),
+    ("GET", re.compile(r"/devices/(?P<device_id>[^/]+)"), "status"),
+    ("GET", re.compile(r"/devices/(?P<device_id>[^/]+)/logs"), "logs"),
+    ("POST", re.compile(r"/devices/(?P<device_id>[^/]+)/mode"), "change_mode"),
+    ("POST", re.compile(r"/devices/(?P<device_id>[^/]+)/action"), "send_action"),
+    ("GET", re.compile(r"/cats"), "cats"),
+    ("GET", re.compile(r"/cats/(?P<pet_id>[^/]+)/summary"), "cat_summary"),
+]
+
+
+class _GatewayHandler(http.server.BaseHTTPRequestHandler):
+    server: "GatewayServer"
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError as exc:
+            raise GatewayError(400, "Request body is not valid JSON") from exc
+        if not isinstance(body, dict):
+            raise GatewayError(400, "Request body must be a JSON object")
+        return body
+
+    def _dispatch(self, method: str) -> None:
+        url = urllib.parse.urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        query = dict(urllib.parse.parse_qsl(url.query))
+        try:
+            for route_method, pattern, name in _ROUTES:
+                match = pattern.fullmatch(path)
+                if not match:
+                    continue
+                if route_method != method:
+                    raise GatewayError(405, f"{method} not allowed on {path}")
+                args = [urllib.parse.unquote(value) for value in match.groupdict().values()]
+                args.append(query)
+                if method == "POST":
+                    args.append(self._read_body())
+                self._send_json(200, getattr(self.server.gateway, name)(*args))
+                return
+            raise GatewayError(404, f"Unknown path {path}")
+        except GatewayError as exc:
+            self._send_json(exc.status, {"error": str(exc), "code": exc.code})
+        except Exception:
+            logger.exception("Gateway request %s %s failed", method, self.path)
+            self._send_json(500, {"error": "Internal error", "code": 0})
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def log_message(self, format: str, *args: object) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class GatewayServer(http.server.ThreadingHTTPServer):
+    """HTTP server exposing a Gateway as a local JSON API."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], gateway: Gateway) -> None:
+        self.gateway = gateway
+        super().__init__(address, _GatewayHandler)
@@ -0,0 +1,146 @@
+"""Full log history export for 'catlink logs --all'."""
+
+import csv
+import hashlib
+import io
+import json
+import pathlib
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .api import CatLinkAPI
+from .cache import cache_dir, read_json, write_json
+from .const import DEFAULT_MAX_CONCURRENCY
+from .models import LogEntry
+
+LOG_CSV_FIELDS = ["region", "deviceId", "time", "event", "firstSection", "secondSection"]
+
+
+def log_csv_row(record: dict) -> str:
+    """
+    Render an exported log record as one CSV line.
+
+    Args:
+        record: Log entry tagged with region and deviceId.
+
+    Returns:
+        CSV line without a line terminator.
+    """
+    entry = LogEntry.from_payload(record)
+    values = {
+        **record,
+        "time": entry.time,
+        "event": entry.event,
+        "firstSection": entry.first_section,
+        "secondSection": entry.second_section,
+    }
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="").writerow(
+        [values.get(field) or "" for field in LOG_CSV_FIELDS]
+    )
+    return buf.getvalue()
+
+
+def log_csv_header() -> str:
+    """
+    Return the CSV header line for exported logs.
+
+    Returns:
+        CSV line without a line terminator.
+    """
+    return ",".join(LOG_CSV_FIELDS)
+
+
+class ExportCursor:
+    """Resume position of one log export, kept under the cache directory."""
+
+    def __init__(
+        self,
+        region: str,
+        device_id: str,
+        device_type: str,
+        since_ms: int,
+        until_ms: int | None,
+        path: pathlib.Path | None = None,
+    ) -> None:
+        parts = json.dumps([region, device_id, device_type, since_ms, until_ms])
+        digest = hashlib.sha256(parts.encode()).hexdigest()[:16]
+        self.path = path or cache_dir() / "log-exports" / f"{digest}.json"
+
+    def load(self) -> dict:
+        """Return the saved position ("until", "page"), or an empty dict."""
+        return read_json(self.path)
+
+    def save(self, until_ms: int, page: int) -> None:
+        """Record that every page before page has been written."""
+        write_json(self.path, {"until": until_ms, "page": page})
+
+    def clear(self) -> None:
+        """Forget the position once the export has finished."""
+        self.path.unlink(missing_ok=True)
+
+
+class LogExport:
+    """Page through a device's log history, fetching pages in parallel."""
+
+    def __init__(
+        self,
+        client: CatLinkAPI,
+        device_id: str,
+        device_type: str,
+        since_ms: int,
+        until_ms: int | None,
+        cursor: ExportCursor | None = None,
+        workers: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self.client = client
+        self.device_id = device_id
+        self.device_type = device_type
+        self.since_ms = since_ms
+        self.cursor = cursor
+        self.workers = max(1, workers)
+        state = cursor.load() if cursor else {}
+        self.resumed = bool(state)
+        # An open-ended export is pinned to the time it started so that new
+        # events do not shift page boundaries between runs.
+        self.until_ms = int(state.get("until") or until_ms or time.time() * 1000)
+        self.start_page = int(state.get("page") or 1)
+
+    def _fetch(self, page: int) -> tuple[list[dict], int]:
+        return self.client.get_device_log_page(
+            self.device_id, self.device_type, page, self.since_ms, self.until_ms
+        )
+
+    def pages(self) -> Iterator[list[dict]]:
+        """
+        Yield pages of log entries in order.
+
+        The cursor moves past a page only when the caller asks for the next
+        one, so an interrupted export resumes at the first page that was not
+        fully written.
+
+        Returns:
+            Iterator of log entry lists, one per page.
+        """
+        page = self.start_page
+        entries, last_page = self._fetch(page)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            window: deque[tuple[int, Future[tuple[list[dict], int]]]] = deque()
+            next_page = page + 1
+            while True:
+                while next_page <= last_page and len(window) < self.workers * 2:
+                    window.append((next_page, pool.submit(self._fetch, next_page)))
+                    next_page += 1
+                if entries:
+                    yield entries
+                if self.cursor:
+                    self.cursor.save(self.until_ms, page + 1)
+                if not window:
+                    break
+                page, future = window.popleft()
+                entries, pages = future.result()
+                last_page = max(last_page, pages)
+        if self.cursor:
+            self.cursor.clear()
@@ -0,0 +1,329 @@
+"""Typed, normalized views of CatLink API payloads."""
+
+from dataclasses import dataclass, field
+from typing import Self
+
+# Summary fields holding the cat's weight and its number of toilet visits. The
+# summarySimple payload is not documented, so several spellings are accepted.
+WEIGHT_KEYS = ("weight", "catWeight", "avgWeight", "petWeight")
+VISIT_KEYS = ("toiletTimes", "toiletCount", "visitTimes", "times", "count")
+VISIT_PARTS = ("peeTimes", "poopTimes")
+
+_MISSING = (None, "", "-")
+
+
+def _first(data: dict, *keys: str) -> object | None:
+    for key in keys:
+        value = data.get(key)
+        if value not in _MISSING:
+            return value
+    return None
+
+
+def _text(value: object | None) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def _number(value: object | None) -> int | float | None:
+    if value in _MISSING or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    text = str(value).strip()
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _count(value: object | None) -> int | None:
+    number = _number(value)
+    return None if number is None else int(number)
+
+
+def _flag(value: object | None) -> bool | None:
+    if value in _MISSING:
+        return None
+    return str(value).strip().lower() in ("1", "true")
+
+
+@dataclass(slots=True, frozen=True)
+class Device:
+    """A device as listed by get_devices."""
+
+    id: str
+    name: str
+    type: str
+    model: str
+    raw: dict | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_payload(cls, data: dict, keep_raw: bool = False) -> Self:
+        """
+        Normalize a device-list entry.
+
+        Args:
+            data: Device dictionary from the API.
+            keep_raw: Keep a reference to data in the raw attribute.
+
+        Returns:
+            Device. Missing fields are empty strings.
+        """
+        return cls(
+            id=_text(_first(data, "id", "deviceId")),
+            name=_text(data.get("deviceName")),
+            type=_text(data.get("deviceType")),
+            model=_text(data.get("model")),
+            raw=data if keep_raw else None,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class LitterBoxDetail:
+    """
+    Status of a litter box (every device type except FEEDER).
+
+    Fields ending in _text hold the value as the API reported it, for display;
+    they are not compared.
+    """
+
+    online: bool | None
+    work_status: str
+    work_model: str
+    litter_weight: float | None
+    litter_days: int | float | None
+    deodorant_days: int | float | None
+    induction_cleans: int | None
+    manual_cleans: int | None
+    temperature: float | None
+    humidity: float | None
+    error: str
+    online_text: str = field(default="", compare=False)
+    litter_weight_text: str = field(default="", compare=False)
+    litter_days_text: str = field(default="", compare=False)
+    deodorant_days_text: str = field(default="", compare=False)
+    temperature_text: str = field(default="", compare=False)
+    humidity_text: str = field(default="", compare=False)
+    raw: dict | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def total_cleans(self) -> int:
+        """Automatic and manual cleans together; a missing count counts as 0."""
+        return (self.induction_cleans or 0) + (self.manual_cleans or 0)
+
+    @classmethod
+    def from_payload(cls, data: dict, keep_raw: bool = False) -> Self:
+        """
+        Normalize a litter box detail.
+
+        Args:
+            data: Detail dictionary from get_device_detail.
+            keep_raw: Keep a reference to data in the raw attribute.
+
+        Returns:
+            LitterBoxDetail. Numbers that are missing or reported as "-" are None.
+        """
+        return cls(
+            online=_flag(data.get("online")),
+            work_status=_text(data.get("workStatus")),
+            work_model=_text(data.get("workModel")),
+            litter_weight=_number(data.get("catLitterWeight")),
+            litter_days=_number(data.get("litterCountdown")),
+            deodorant_days=_number(data.get("deodorantCountdown")),
+            induction_cleans=_count(data.get("inductionTimes")),
+            manual_cleans=_count(data.get("manualTimes")),
+            temperature=_number(data.get("temperature")),
+            humidity=_number(data.get("humidity")),
+            error=_text(_first(data, "currentMessage", "currentError")),
+            online_text=_text(data.get("online")),
+            litter_weight_text=_text(data.get("catLitterWeight")),
+            litter_days_text=_text(data.get("litterCountdown")),
+            deodorant_days_text=_text(data.get("deodorantCountdown")),
+            temperature_text=_text(data.get("temperature")),
+            humidity_text=_text(data.get("humidity")),
+            raw=data if keep_raw else None,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class FeederDetail:
+    """
+    Status of a FEEDER.
+
+    Fields ending in _text hold the value as the API reported it, for display;
+    they are not compared.
+    """
+
+    online: bool | None
+    food_out_status: str
+    weight: float | None
+    auto_fill: str
+    power_supply: str
+    key_lock: str
+    indicator_light: str
+    breath_light: str
+    firmware: str
+    error: str
+    online_text: str = field(default="", compare=False)
+    weight_text: str = field(default="", compare=False)
+    raw: dict | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_payload(cls, data: dict, keep_raw: bool = False) -> Self:
+        """
+        Normalize a feeder detail.
+
+        Args:
+            data: Detail dictionary from get_device_detail.
+            keep_raw: Keep a reference to data in the raw attribute.
+
+        Returns:
+            FeederDetail. Missing text fields are empty strings.
+        """
+        return cls(
+            online=_flag(data.get("online")),
+            food_out_status=_text(data.get("foodOutStatus")),
+            weight=_number(data.get("weight")),
+            auto_fill=_text(data.get("autoFillStatus")),
+            power_supply=_text(data.get("powerSupplyStatus")),
+            key_lock=_text(data.get("keyLockStatus")),
+            indicator_light=_text(data.get("indicatorLightStatus")),
+            breath_light=_text(data.get("breathLightStatus")),
+            firmware=_text(data.get("firmwareVersion")),
+            error=_text(_first(data, "currentErrorMessage", "error", "currentMessage")),
+            online_text=_text(data.get("online")),
+            weight_text=_text(data.get("weight")),
+            raw=data if keep_raw else None,
+        )
+
+
+def parse_detail(
+    data: dict, device_type: str, keep_raw: bool = False
+) -> LitterBoxDetail | FeederDetail:
+    """
+    Normalize a device detail with the model matching its device type.
+
+    Args:
+        data: Detail dictionary from get_device_detail.
+        device_type: Device type the detail was fetched for.
+        keep_raw: Keep a reference to data in the raw attribute.
+
+    Returns:
+        FeederDetail for FEEDER, otherwise LitterBoxDetail.
+    """
+    if device_type == "FEEDER":
+        return FeederDetail.from_payload(data, keep_raw)
+    return LitterBoxDetail.from_payload(data, keep_raw)
+
+
+@dataclass(slots=True, frozen=True)
+class LogEntry:
+    """One device log event."""
+
+    time: str
+    event: str
+    first_section: str
+    second_section: str
+    raw: dict | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def text(self) -> str:
+        """The event followed by its non-empty sections."""
+        return " ".join(
+            part for part in (self.event, self.first_section, self.second_section) if part
+        )
+
+    @classmethod
+    def from_payload(cls, data: dict, keep_raw: bool = False) -> Self:
+        """
+        Normalize a log entry from the top-5 or paged log endpoints.
+
+        Args:
+            data: Log entry dictionary.
+            keep_raw: Keep a reference to data in the raw attribute.
+
+        Returns:
+            LogEntry. The time is kept as reported (a clock time, a date and time,
+            or epoch milliseconds as a string).
+        """
+        time = _first(data, "time", "createTime")
+        return cls(
+            time=str(int(time)) if isinstance(time, float) else _text(time),
+            event=_text(_first(data, "event", "msg")),
+            first_section=_text(data.get("firstSection")),
+            second_section=_text(data.get("secondSection")),
+            raw=data if keep_raw else None,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Cat:
+    """A cat as listed by get_cats."""
+
+    id: str
+    name: str
+    weight: float | None
+    breed: str
+    raw: dict | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_payload(cls, data: dict, keep_raw: bool = False) -> Self:
+        """
+        Normalize a cat entry.
+
+        Args:
+            data: Cat dictionary from the API.
+            keep_raw: Keep a reference to data in the raw attribute.
+
+        Returns:
+            Cat. Missing text fields are empty strings.
+        """
+        return cls(
+            id=_text(_first(data, "id", "petId")),
+            name=_text(_first(data, "name", "petName")),
+            weight=_number(data.get("weight")),
+            breed=_text(_first(data, "breedName", "breed")),
+            raw=data if keep_raw else None,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class CatSummary:
+    """A cat's daily health summary."""
+
+    date: str
+    weight: float | None
+    visits: float | None
+    raw: dict | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_payload(cls, data: dict, date: str, keep_raw: bool = False) -> Self:
+        """
+        Normalize a daily summary.
+
+        The weight is the first of WEIGHT_KEYS present. Visits are the first of
+        VISIT_KEYS present, or the sum of VISIT_PARTS when none is.
+
+        Args:
+            data: Summary dictionary from get_cat_summary.
+            date: Day of the summary (YYYY-MM-DD).
+            keep_raw: Keep a reference to data in the raw attribute.
+
+        Returns:
+            CatSummary. Values that are missing or not numeric are None.
+        """
+        visits = _number(_first(data, *VISIT_KEYS))
+        if visits is None:
+            parts = [_number(data.get(key)) for key in VISIT_PARTS]
+            if any(part is not None for part in parts):
+                visits = sum(part for part in parts if part is not None)
+        return cls(
+            date=date,
+            weight=_number(_first(data, *WEIGHT_KEYS)),
+            visits=visits,
+            raw=data if keep_raw else None,
+        )
@@ -0,0 +1,123 @@
+"""Buffered text, JSON and NDJSON output for CLI commands."""
+
+import json
+import sys
+from typing import BinaryIO
+
+from .const import OUTPUT_BUFFER_SIZE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value: object) -> bytes:
+    """
+    Serialize a value as compact UTF-8 JSON.
+
+    Uses orjson when it is installed and the standard library otherwise.
+
+    Args:
+        value: JSON-compatible value.
+
+    Returns:
+        Encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class OutputWriter:
+    """Write command results to stdout in the selected format."""
+
+    def __init__(
+        self,
+        output_format: str = "text",
+        stream: BinaryIO | None = None,
+        buffer_size: int = OUTPUT_BUFFER_SIZE,
+    ) -> None:
+        self.format = output_format
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._chunks: list[bytes] = []
+        self._pending = 0
+        self._records: list[bytes] = []
+        self.count = 0
+
+    @property
+    def structured(self) -> bool:
+        """Whether records are written as JSON instead of text."""
+        return self.format != "text"
+
+    def _write(self, chunk: bytes) -> None:
+        self._chunks.append(chunk)
+        self._pending += len(chunk)
+        if self._pending >= self._buffer_size:
+            self.flush()
+
+    def header(self, text: str) -> None:
+        """
+        Write a line that only belongs in text output, such as a region header.
+
+        Args:
+            text: Line to write.
+
+        Returns:
+            None.
+        """
+        if not self.structured:
+            self._write(text.encode() + b"\n")
+
+    def record(self, data: dict, *lines: str) -> None:
+        """
+        Write one result.
+
+        Args:
+            data: Record written in JSON and NDJSON output.
+            lines: Lines written in text output.
+
+        Returns:
+            None.
+        """
+        self.count += 1
+        if self.format == "json":
+            self._records.append(dumps(data))
+        elif self.format == "ndjson":
+            self._write(dumps(data) + b"\n")
+        elif lines:
+            self._write("\n".join(lines).encode() + b"\n")
+
+    def flush(self) -> None:
+        """
+        Write buffered output to stdout.
+
+        Commands call this after each region so NDJSON records reach the
+        reader as soon as their region has answered.
+
+        Returns:
+            None.
+        """
+        if not self._chunks:
+            return
+        stream = self._stream
+        if stream is None:
+            sys.stdout.flush()
+            stream = sys.stdout.buffer
+        stream.write(b"".join(self._chunks))
+        stream.flush()
+        self._chunks.clear()
+        self._pending = 0
+
+    def close(self) -> None:
+        """
+        Finish the output, writing the collected array in JSON mode.
+
+        Returns:
+            None.
+        """
+        if self.format == "json":
+            self._write(b"[" + b",".join(self._records) + b"]\n")
+            self._records.clear()
+        self.flush()
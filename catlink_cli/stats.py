@@ -0,0 +1,211 @@
+"""Cat health analytics over ranges of daily summaries for 'catlink cat-stats'."""
+
+from typing import Any
+
+from .models import CatSummary
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def numpy_available() -> bool:
+    """Whether the optional NumPy dependency is installed."""
+    return np is not None
+
+
+def summary_series(days: list[str], summaries: dict[str, dict[str, dict]]) -> tuple[Any, Any]:
+    """
+    Arrange summaries of several cats as (cats x days) weight and visit arrays.
+
+    Args:
+        days: Days in order.
+        summaries: Mapping of pet ID to a mapping of day to summary.
+
+    Returns:
+        Tuple of (weights, visits) float arrays with NaN for missing days.
+    """
+    shape = (len(summaries), len(days))
+    weights = np.full(shape, np.nan)
+    visits = np.full(shape, np.nan)
+    index = {day: column for column, day in enumerate(days)}
+    for row, by_day in enumerate(summaries.values()):
+        for day, data in by_day.items():
+            summary = CatSummary.from_payload(data, day)
+            column = index[day]
+            if summary.weight is not None:
+                weights[row, column] = summary.weight
+            if summary.visits is not None:
+                visits[row, column] = summary.visits
+    return weights, visits
+
+
+def _masked(values: Any) -> tuple[Any, Any]:
+    valid = ~np.isnan(values)
+    return np.where(valid, values, 0.0), valid
+
+
+def rolling_mean(values: Any, window: int) -> Any:
+    """
+    Average the last window days along the last axis, ignoring missing days.
+
+    Args:
+        values: Array of daily values with NaN for missing days.
+        window: Number of days per average; the first days use what is available.
+
+    Returns:
+        Array of the same shape, NaN where the window holds no values.
+    """
+    filled, valid = _masked(values)
+    pad = [(0, 0)] * (values.ndim - 1) + [(1, 0)]
+    sums = np.pad(np.cumsum(filled, axis=-1), pad)
+    counts = np.pad(np.cumsum(valid, axis=-1), pad)
+    end = np.arange(values.shape[-1]) + 1
+    start = np.maximum(end - window, 0)
+    total = sums[..., end] - sums[..., start]
+    count = counts[..., end] - counts[..., start]
+    return np.divide(total, count, out=np.full(total.shape, np.nan), where=count > 0)
+
+
+def zscores(values: Any) -> Any:
+    """
+    Standardize values along the last axis, ignoring missing days.
+
+    Args:
+        values: Array of daily values with NaN for missing days.
+
+    Returns:
+        Array of z-scores, NaN for missing days and 0 for constant series.
+    """
+    filled, valid = _masked(values)
+    count = np.maximum(valid.sum(axis=-1, keepdims=True), 1)
+    mean = filled.sum(axis=-1, keepdims=True) / count
+    spread = np.sqrt((np.where(valid, values - mean, 0.0) ** 2).sum(axis=-1, keepdims=True) / count)
+    scores = np.divide(
+        values - mean,
+        spread,
+        out=np.zeros(values.shape),
+        where=np.broadcast_to(spread > 0, values.shape),
+    )
+    return np.where(valid, scores, np.nan)
+
+
+def weekly_means(values: Any) -> Any:
+    """
+    Average consecutive 7-day blocks along the last axis, ignoring missing days.
+
+    Args:
+        values: Array of daily values with NaN for missing days. The first
+            block starts on the first day; the last block may be partial.
+
+    Returns:
+        Array with the last axis replaced by one value per week.
+    """
+    days = values.shape[-1]
+    weeks = -(-days // 7)
+    pad = [(0, 0)] * (values.ndim - 1) + [(0, weeks * 7 - days)]
+    blocks = np.pad(values, pad, constant_values=np.nan).reshape(*values.shape[:-1], weeks, 7)
+    filled, valid = _masked(blocks)
+    count = valid.sum(axis=-1)
+    return np.divide(filled.sum(axis=-1), count, out=np.full(count.shape, np.nan), where=count > 0)
+
+
+def week_over_week(values: Any) -> tuple[Any, Any]:
+    """
+    Compute weekly averages and their change from the week before.
+
+    Args:
+        values: Array of daily values with NaN for missing days.
+
+    Returns:
+        Tuple of (weekly means, deltas); the first week's delta is NaN.
+    """
+    weekly = weekly_means(values)
+    deltas = np.full(weekly.shape, np.nan)
+    deltas[..., 1:] = np.diff(weekly, axis=-1)
+    return weekly, deltas
+
+
+def analyse(
+    days: list[str], summaries: dict[str, dict[str, dict]], window: int, threshold: float
+) -> dict[str, dict]:
+    """
+    Compute rolling weights, visit frequency, anomalies and weekly changes per cat.
+
+    Args:
+        days: Days in order.
+        summaries: Mapping of pet ID to a mapping of day to summary.
+        window: Days in the rolling weight average.
+        threshold: Absolute z-score from which a day is flagged.
+
+    Returns:
+        Mapping of pet ID to a dictionary of plain lists and numbers:
+        "days" (per-day rows), "weeks" (per-week rows) and "visitsPerDay".
+    """
+    weights, visits = summary_series(days, summaries)
+    rolling = rolling_mean(weights, window)
+    weight_z = zscores(weights)
+    visit_z = zscores(visits)
+    anomalies = (np.abs(np.nan_to_num(weight_z)) >= threshold) | (
+        np.abs(np.nan_to_num(visit_z)) >= threshold
+    )
+    weekly_weight, weight_delta = week_over_week(weights)
+    weekly_visits, visit_delta = week_over_week(visits)
+    visit_days = (~np.isnan(visits)).sum(axis=-1)
+    visits_per_day = np.divide(
+        np.nansum(visits, axis=-1),
+        visit_days,
+        out=np.full(visit_days.shape, np.nan),
+        where=visit_days > 0,
+    )
+
+    def clean(values: Any) -> list[float | None]:
+        return [None if np.isnan(value) else round(float(value), 3) for value in values]
+
+    results: dict[str, dict] = {}
+    for row, pet_id in enumerate(summaries):
+        day_columns = zip(
+            days,
+            clean(weights[row]),
+            clean(rolling[row]),
+            clean(visits[row]),
+            clean(weight_z[row]),
+            clean(visit_z[row]),
+            anomalies[row].tolist(),
+            strict=True,
+        )
+        week_columns = zip(
+            days[::7],
+            clean(weekly_weight[row]),
+            clean(weight_delta[row]),
+            clean(weekly_visits[row]),
+            clean(visit_delta[row]),
+            strict=True,
+        )
+        results[pet_id] = {
+            "visitsPerDay": clean(visits_per_day[row : row + 1])[0],
+            "days": [
+                {
+                    "date": day,
+                    "weight": weight,
+                    "weightAvg": avg,
+                    "visits": count,
+                    "weightZ": wz,
+                    "visitsZ": vz,
+                    "anomaly": flag,
+                }
+                for day, weight, avg, count, wz, vz, flag in day_columns
+            ],
+            "weeks": [
+                {
+                    "week": start,
+                    "weight": weight,
+                    "weightDelta": weight_change,
+                    "visitsPerDay": count,
+                    "visitsDelta": visit_change,
+                }
+                for start, weight, weight_change, count, visit_change in week_columns
+            ],
+        }
+    return results
@@ -0,0 +1,379 @@
+"""Local SQLite store of polled device status and logs for 'catlink record'."""
+
+import datetime
+import json
+import os
+import pathlib
+import re
+import sqlite3
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from .api import CatLinkAPIError
+from .const import DB_PATH_ENV, DEFAULT_MAX_CONCURRENCY
+from .models import LogEntry, parse_detail
+from .watch import WatchedDevice
+
+# Detail model attributes recorded as numeric columns of the status table.
+STATUS_COLUMNS: dict[str, str] = {
+    "litter_weight": "litter_weight",
+    "litter_days": "litter_countdown",
+    "deodorant_days": "deodorant_countdown",
+    "induction_cleans": "induction_cleans",
+    "manual_cleans": "manual_cleans",
+    "temperature": "temperature",
+    "humidity": "humidity",
+    "weight": "food_weight",
+}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS devices (
+    device_id TEXT PRIMARY KEY,
+    region TEXT NOT NULL,
+    device_type TEXT NOT NULL,
+    name TEXT
+);
+CREATE TABLE IF NOT EXISTS status (
+    device_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    online INTEGER,
+    work_status TEXT,
+    work_model TEXT,
+    {", ".join(f"{column} REAL" for column in STATUS_COLUMNS.values())},
+    detail TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS status_device_ts ON status (device_id, ts);
+CREATE INDEX IF NOT EXISTS status_ts ON status (ts);
+CREATE TABLE IF NOT EXISTS logs (
+    device_id TEXT NOT NULL,
+    time TEXT NOT NULL,
+    event TEXT NOT NULL,
+    first_section TEXT,
+    second_section TEXT,
+    recorded_at REAL NOT NULL,
+    entry TEXT NOT NULL,
+    PRIMARY KEY (device_id, time, event)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS logs_time ON logs (time);
+"""
+
+_CLOCK_TIME = re.compile(r"\d{1,2}:\d{2}(:\d{2})?")
+
+
+def default_db_path() -> pathlib.Path:
+    """
+    Return the database used by 'catlink record' and 'catlink history'.
+
+    Returns:
+        $CATLINK_DB if set, otherwise history.db in the XDG data directory.
+    """
+    override = os.environ.get(DB_PATH_ENV)
+    if override:
+        return pathlib.Path(override)
+    xdg = os.environ.get("XDG_DATA_HOME")
+    base = pathlib.Path(xdg) if xdg else pathlib.Path.home() / ".local" / "share"
+    return base / "catlink-cli" / "history.db"
+
+
+def format_timestamp(ts: float) -> str:
+    """
+    Format an epoch timestamp in local time the way log times are stored.
+
+    Args:
+        ts: Seconds since the epoch.
+
+    Returns:
+        "YYYY-MM-DD HH:MM:SS".
+    """
+    return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def log_time(entry: LogEntry | dict, seen_at: float) -> str:
+    """
+    Return a sortable local time for a log entry.
+
+    The top-5 endpoints report clock times such as "14:05" without a date. Those
+    are dated on the day they were seen, or the day before if that would put
+    them in the future.
+
+    Args:
+        entry: Log entry, parsed or as returned by the API.
+        seen_at: Epoch seconds when the entry was fetched.
+
+    Returns:
+        Time string, "YYYY-MM-DD HH:MM[:SS]" when it could be derived.
+    """
+    if isinstance(entry, dict):
+        entry = LogEntry.from_payload(entry)
+    text = entry.time
+    if text.isdigit():
+        stamp = float(text)
+        return format_timestamp(stamp / 1000 if stamp > 1e11 else stamp)
+    if _CLOCK_TIME.fullmatch(text):
+        clock = ":".join(part.zfill(2) for part in text.split(":"))
+        seen = datetime.datetime.fromtimestamp(seen_at)
+        day = seen.date()
+        if clock > seen.strftime("%H:%M:%S")[: len(clock)]:
+            day -= datetime.timedelta(days=1)
+        return f"{day.isoformat()} {clock}"
+    return text
+
+
+class HistoryStore:
+    """SQLite database of status samples and log events."""
+
+    def __init__(self, path: pathlib.Path | None = None) -> None:
+        self.path = path or default_db_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def write(
+        self,
+        devices: list[WatchedDevice],
+        details: list[tuple[str, float, dict]],
+        logs: list[tuple[str, float, list[dict]]],
+    ) -> int:
+        """
+        Store one poll of many devices in a single transaction.
+
+        Args:
+            devices: Devices that were polled.
+            details: List of (device_id, timestamp, detail).
+            logs: List of (device_id, timestamp, log entries).
+
+        Returns:
+            Number of log events that were not stored before.
+        """
+        columns = ["device_id", "ts", "online", "work_status", "work_model"]
+        columns += [*STATUS_COLUMNS.values(), "detail"]
+        types = {device.device_id: device.device_type for device in devices}
+        samples = [
+            (device_id, ts, parse_detail(detail, types.get(device_id, ""), keep_raw=True))
+            for device_id, ts, detail in details
+        ]
+        status_rows = [
+            (
+                device_id,
+                ts,
+                None if sample.online is None else int(sample.online),
+                getattr(sample, "work_status", "") or None,
+                getattr(sample, "work_model", "") or None,
+                *(getattr(sample, field, None) for field in STATUS_COLUMNS),
+                json.dumps(sample.raw, ensure_ascii=False),
+            )
+            for device_id, ts, sample in samples
+        ]
+        parsed = [
+            (device_id, ts, LogEntry.from_payload(entry, keep_raw=True))
+            for device_id, ts, entries in logs
+            for entry in entries
+        ]
+        log_rows = [
+            (
+                device_id,
+                log_time(entry, ts),
+                entry.event,
+                entry.first_section or None,
+                entry.second_section or None,
+                ts,
+                json.dumps(entry.raw, ensure_ascii=False),
+            )
+            for device_id, ts, entry in parsed
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO devices VALUES (?, ?, ?, ?) ON CONFLICT (device_id) DO UPDATE SET "
+                "region = excluded.region, device_type = excluded.device_type, "
+                "name = excluded.name",
+                [(d.device_id, d.region, d.device_type, d.name) for d in devices],
+            )
+            self._conn.executemany(
+                f"INSERT INTO status ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})",
+                status_rows,
+            )
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO logs VALUES (?, ?, ?, ?, ?, ?, ?)", log_rows
+            )
+            return self._conn.total_changes - before
+
+    @staticmethod
+    def _range(
+        column: str, device_id: str | None, since: float | str | None, until: float | str | None
+    ) -> tuple[str, list]:
+        clauses: list[str] = []
+        params: list = []
+        if device_id is not None:
+            clauses.append("device_id = ?")
+            params.append(device_id)
+        if since is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append(f"{column} <= ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def status(
+        self, device_id: str | None = None, since: float | None = None, until: float | None = None
+    ) -> list[dict]:
+        """
+        Return status samples in time order.
+
+        Args:
+            device_id: Optional device to restrict to.
+            since: Optional first epoch timestamp.
+            until: Optional last epoch timestamp.
+
+        Returns:
+            List of rows with the device's name, without the raw detail.
+        """
+        where, params = self._range("ts", device_id, since, until)
+        columns = ", ".join(["online", "work_status", "work_model", *STATUS_COLUMNS.values()])
+        rows = self._conn.execute(
+            f"SELECT device_id, name, ts, {columns} FROM status "
+            f"LEFT JOIN devices USING (device_id){where} ORDER BY ts, device_id",
+            params,
+        )
+        return [dict(row) for row in rows]
+
+    def daily(
+        self, device_id: str | None = None, since: float | None = None, until: float | None = None
+    ) -> list[dict]:
+        """
+        Return one row per device and local day.
+
+        Rows hold the average litter and food weight, and the number of
+        cleans counted during the day (growth of the clean counters).
+
+        Args:
+            device_id: Optional device to restrict to.
+            since: Optional first epoch timestamp.
+            until: Optional last epoch timestamp.
+
+        Returns:
+            List of rows ordered by day and device.
+        """
+        where, params = self._range("ts", device_id, since, until)
+        rows = self._conn.execute(
+            "SELECT date(ts, 'unixepoch', 'localtime') AS day, device_id, name, "
+            "COUNT(*) AS samples, AVG(litter_weight) AS litter_weight, "
+            "AVG(food_weight) AS food_weight, "
+            "MAX(induction_cleans + manual_cleans) - MIN(induction_cleans + manual_cleans) "
+            "AS cleans "
+            f"FROM status LEFT JOIN devices USING (device_id){where} "
+            "GROUP BY day, device_id ORDER BY day, device_id",
+            params,
+        )
+        return [dict(row) for row in rows]
+
+    def logs(
+        self, device_id: str | None = None, since: str | None = None, until: str | None = None
+    ) -> list[dict]:
+        """
+        Return recorded log events in time order.
+
+        Args:
+            device_id: Optional device to restrict to.
+            since: Optional first local time ("YYYY-MM-DD HH:MM:SS").
+            until: Optional last local time.
+
+        Returns:
+            List of rows with the device's name.
+        """
+        where, params = self._range("time", device_id, since, until)
+        rows = self._conn.execute(
+            "SELECT device_id, name, time, event, first_section, second_section FROM logs "
+            f"LEFT JOIN devices USING (device_id){where} ORDER BY time, device_id",
+            params,
+        )
+        return [dict(row) for row in rows]
+
+
+class Recorder:
+    """Poll device detail and logs on an interval and store them."""
+
+    def __init__(
+        self,
+        devices: list[WatchedDevice],
+        store: HistoryStore,
+        emit: Callable[[str], None],
+        interval: float,
+        concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.devices = devices
+        self.store = store
+        self.emit = emit
+        self.interval = interval
+        self.concurrency = concurrency
+        self.clock = clock
+        self.sleep = sleep
+
+    @staticmethod
+    def _fetch(device: WatchedDevice) -> tuple[dict | Exception, list[dict] | Exception]:
+        results: list = []
+        for call in (device.client.get_device_detail, device.client.get_device_logs):
+            try:
+                results.append(call(device.device_id, device.device_type))
+            except (CatLinkAPIError, httpx.HTTPError) as exc:
+                results.append(exc)
+        return results[0], results[1]
+
+    def poll_once(self) -> tuple[int, int]:
+        """
+        Poll every device concurrently and store the results in one transaction.
+
+        Returns:
+            Tuple of (status samples stored, new log events stored).
+        """
+        now = self.clock()
+        workers = min(self.concurrency, len(self.devices)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(self._fetch, self.devices))
+        details: list[tuple[str, float, dict]] = []
+        logs: list[tuple[str, float, list[dict]]] = []
+        for device, (detail, entries) in zip(self.devices, results, strict=True):
+            for result in (detail, entries):
+                if isinstance(result, Exception):
+                    self.emit(f"{device.name} ({device.device_id}) error: {result}")
+            if isinstance(detail, dict) and detail:
+                details.append((device.device_id, now, detail))
+            if isinstance(entries, list):
+                logs.append((device.device_id, now, entries))
+        new_logs = self.store.write(self.devices, details, logs)
+        return len(details), new_logs
+
+    def run(self, count: int | None = None) -> None:
+        """
+        Poll until interrupted, or count times.
+
+        Args:
+            count: Number of polls, or None to run forever.
+
+        Returns:
+            None.
+        """
+        polls = 0
+        while count is None or polls < count:
+            started = self.clock()
+            samples, new_logs = self.poll_once()
+            polls += 1
+            stamp = datetime.datetime.now().strftime("%H:%M:%S")
+            self.emit(f"[{stamp}] stored {samples} status samples, {new_logs} new log events")
+            if count is not None and polls >= count:
+                break
+            self.sleep(max(0.0, started + self.interval - self.clock()))
@@ -0,0 +1,224 @@
+"""Full-screen fleet dashboard for 'catlink top'."""
+
+import datetime
+import sys
+import time
+from collections.abc import Callable
+
+from .models import FeederDetail, LitterBoxDetail
+from .watch import DeviceWatcher, WatchedDevice, format_value
+
+try:
+    import curses
+except ImportError:
+    curses = None
+
+# Column titles and widths; the last column takes the remaining width.
+COLUMNS: list[tuple[str, int]] = [
+    ("DEVICE", 22),
+    ("TYPE", 14),
+    ("STATE", 10),
+    ("MODE", 7),
+    ("LITTER", 8),
+    ("LITTER D", 8),
+    ("DEODOR D", 8),
+    ("FOOD", 7),
+    ("ERROR", 0),
+]
+
+HEADER_LINES = 2
+
+
+def curses_available() -> bool:
+    """Whether the curses module is available on this platform."""
+    return curses is not None
+
+
+def terminal_attached() -> bool:
+    """Whether stdin and stdout are a terminal the dashboard can take over."""
+    return sys.stdin.isatty() and sys.stdout.isatty()
+
+
+class QuitDashboard(Exception):
+    """Raised from the screen's wait when the user asks to quit."""
+
+
+def _fit(text: str, width: int) -> str:
+    if width <= 0:
+        return text
+    return text[: width - 1].ljust(width)
+
+
+def format_row(cells: list[str]) -> str:
+    """
+    Lay out one dashboard row in fixed-width columns.
+
+    Args:
+        cells: One string per column in COLUMNS.
+
+    Returns:
+        Row text; callers clip it to the terminal width.
+    """
+    return "".join(_fit(cell, width) for cell, (_, width) in zip(cells, COLUMNS, strict=True))
+
+
+def row_cells(
+    device: WatchedDevice, detail: LitterBoxDetail | FeederDetail | Exception | None
+) -> list[str]:
+    """
+    Summarize a device the way 'catlink status' shows it, one cell per column.
+
+    Args:
+        device: Device the row describes.
+        detail: Latest detail, the error of the last poll, or None before it.
+
+    Returns:
+        List of cell strings.
+    """
+    cells = [f"{device.name} ({device.device_id})", device.device_type]
+    if detail is None:
+        return [*cells, "...", "", "", "", "", "", ""]
+    if isinstance(detail, Exception):
+        return [*cells, "?", "", "", "", "", "", str(detail)]
+
+    def value(number: float | None, unit: str = "") -> str:
+        return "" if number is None else f"{number}{unit}"
+
+    if isinstance(detail, FeederDetail):
+        state = "offline" if detail.online is False else "online"
+        return [*cells, state, "", "", "", "", value(detail.weight, " g"), detail.error]
+    return [
+        *cells,
+        format_value("workStatus", detail.work_status, device.device_type),
+        format_value("workModel", detail.work_model, device.device_type),
+        value(detail.litter_weight, " kg"),
+        value(detail.litter_days),
+        value(detail.deodorant_days),
+        "",
+        detail.error,
+    ]
+
+
+class CursesScreen:
+    """Draw dashboard lines with curses, touching only the lines that changed."""
+
+    def __init__(self, window: "curses.window") -> None:
+        self.window = window
+        self.window.timeout(250)
+        self.lines: dict[int, str] = {}
+        self.redraw_all: Callable[[], None] = lambda: None
+        curses.curs_set(0)
+
+    def draw(self, line: int, text: str) -> None:
+        """Write one screen line if its text changed."""
+        if self.lines.get(line) == text:
+            return
+        self.lines[line] = text
+        height, width = self.window.getmaxyx()
+        if line >= height:
+            return
+        self.window.move(line, 0)
+        self.window.clrtoeol()
+        self.window.addnstr(line, 0, text, max(width - 1, 0))
+        self.window.noutrefresh()
+
+    def refresh(self) -> None:
+        """Push the pending line updates to the terminal."""
+        curses.doupdate()
+
+    def wait(self, seconds: float) -> None:
+        """
+        Wait for the next poll while handling keys.
+
+        Raises:
+            QuitDashboard: When "q" is pressed.
+        """
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            key = self.window.getch()
+            if key in (ord("q"), ord("Q")):
+                raise QuitDashboard
+            if key == curses.KEY_RESIZE:
+                self.window.erase()
+                self.lines.clear()
+                self.redraw_all()
+                self.refresh()
+
+
+class FleetDashboard(DeviceWatcher):
+    """Poll devices on their own schedules and redraw only rows that changed."""
+
+    def __init__(
+        self,
+        devices: list[WatchedDevice],
+        screen: CursesScreen,
+        min_interval: float,
+        max_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(
+            devices, lambda _: None, min_interval, max_interval, clock=clock, sleep=screen.wait
+        )
+        self.screen = screen
+        self.rows: list[str] = [format_row(row_cells(device, None)) for device in devices]
+        self._index = {id(device): index for index, device in enumerate(devices)}
+        screen.redraw_all = self.redraw_all
+
+    def _status_line(self) -> str:
+        stamp = datetime.datetime.now().strftime("%H:%M:%S")
+        return f"catlink top - {len(self.devices)} devices - updated {stamp} - q to quit"
+
+    def redraw_all(self) -> None:
+        """Draw the header and every row, e.g. at start or after a resize."""
+        self.screen.draw(0, self._status_line())
+        self.screen.draw(1, format_row([title for title, _ in COLUMNS]))
+        for index, row in enumerate(self.rows):
+            self.screen.draw(HEADER_LINES + index, row)
+
+    def _report(
+        self, device: WatchedDevice, result: LitterBoxDetail | FeederDetail | Exception
+    ) -> None:
+        if not isinstance(result, Exception):
+            unchanged = result == device.detail
+            device.detail = result
+            if unchanged:
+                return
+        index = self._index[id(device)]
+        row = format_row(row_cells(device, result))
+        if row != self.rows[index]:
+            self.rows[index] = row
+            self.screen.draw(HEADER_LINES + index, row)
+
+    def poll(self, devices: list[WatchedDevice]) -> None:
+        """Poll due devices, then update changed rows and the status line."""
+        super().poll(devices)
+        self.screen.draw(0, self._status_line())
+        self.screen.refresh()
+
+    def run(self, count: int | None = None) -> None:
+        """Show the dashboard until "q" is pressed or every device was polled count times."""
+        self.redraw_all()
+        self.screen.refresh()
+        try:
+            super().run(count)
+        except QuitDashboard:
+            pass
+
+
+def run_dashboard(devices: list[WatchedDevice], min_interval: float, max_interval: float) -> None:
+    """
+    Take over the terminal and show the fleet dashboard until the user quits.
+
+    Args:
+        devices: Devices to show, in display order.
+        min_interval: Poll interval while a device is running.
+        max_interval: Longest poll interval while idle.
+
+    Returns:
+        None.
+    """
+
+    def main(window: "curses.window") -> None:
+        FleetDashboard(devices, CursesScreen(window), min_interval, max_interval).run()
+
+    curses.wrapper(main)
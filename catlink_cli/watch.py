@@ -0,0 +1,219 @@
+"""Adaptive polling of device detail for 'catlink watch'."""
+
+import datetime
+import heapq
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from .api import CatLinkAPI, CatLinkAPIError
+from .const import DEFAULT_MAX_CONCURRENCY, DEVICE_MODES, WORK_STATUSES
+from .models import FeederDetail, LitterBoxDetail, parse_detail
+
+logger = logging.getLogger(__name__)
+
+# Detail model attributes watched for changes, in display order, with the API
+# field name each one is reported under.
+WATCH_FIELDS: dict[str, str] = {
+    "online": "online",
+    "work_status": "workStatus",
+    "work_model": "workModel",
+    "litter_weight": "catLitterWeight",
+    "litter_days": "litterCountdown",
+    "deodorant_days": "deodorantCountdown",
+    "induction_cleans": "inductionTimes",
+    "manual_cleans": "manualTimes",
+    "temperature": "temperature",
+    "humidity": "humidity",
+    "food_out_status": "foodOutStatus",
+    "weight": "weight",
+    "auto_fill": "autoFillStatus",
+    "power_supply": "powerSupplyStatus",
+    "key_lock": "keyLockStatus",
+    "indicator_light": "indicatorLightStatus",
+    "breath_light": "breathLightStatus",
+    "firmware": "firmwareVersion",
+    "error": "error",
+}
+
+RUNNING_STATUS = "01"
+
+
+def changed_fields(
+    previous: LitterBoxDetail | FeederDetail | None, current: LitterBoxDetail | FeederDetail
+) -> list[tuple[str, object | None, object | None]]:
+    """
+    Compare two detail snapshots.
+
+    Args:
+        previous: Detail from the previous poll, or None for the first poll.
+        current: Detail from this poll.
+
+    Returns:
+        List of (field, old, new) for watched fields whose value changed, named as
+        in WATCH_FIELDS. On the first poll every field that is set is returned
+        with an old value of None.
+    """
+    baseline = type(current).from_payload({}) if previous is None else previous
+    return [
+        (field, None if previous is None else getattr(previous, name), getattr(current, name))
+        for name, field in WATCH_FIELDS.items()
+        if hasattr(current, name) and getattr(current, name) != getattr(baseline, name)
+    ]
+
+
+def next_interval(
+    interval: float, running: bool, min_interval: float, max_interval: float
+) -> float:
+    """
+    Choose the delay before the next poll of a device.
+
+    Args:
+        interval: Delay used before this poll.
+        running: Whether the device reported workStatus "01".
+        min_interval: Delay while the device is running.
+        max_interval: Upper bound for the idle back-off.
+
+    Returns:
+        The minimum interval while running, otherwise double the current interval
+        capped at the maximum.
+    """
+    if running:
+        return min_interval
+    return min(max(interval, min_interval) * 2, max_interval)
+
+
+def format_value(field: str, value: object, device_type: str) -> str:
+    """
+    Render a detail value the way 'catlink status' names it.
+
+    Args:
+        field: Detail field name.
+        value: Field value.
+        device_type: Device type, used to name working modes.
+
+    Returns:
+        Display string.
+    """
+    if value is None or value == "":
+        return "-"
+    if field == "workStatus":
+        return WORK_STATUSES.get(str(value).strip(), str(value))
+    if field == "workModel":
+        return DEVICE_MODES.get(device_type, {}).get(str(value), str(value))
+    return str(value)
+
+
+class WatchedDevice:
+    """Polling state for one device."""
+
+    def __init__(
+        self, region: str, client: CatLinkAPI, device_id: str, device_type: str, name: str
+    ) -> None:
+        self.region = region
+        self.client = client
+        self.device_id = device_id
+        self.device_type = device_type
+        self.name = name
+        self.interval = 0.0
+        self.detail: LitterBoxDetail | FeederDetail | None = None
+        self.polls = 0
+
+
+class DeviceWatcher:
+    """Poll devices on individual schedules and report changed fields."""
+
+    def __init__(
+        self,
+        devices: list[WatchedDevice],
+        emit: Callable[[str], None],
+        min_interval: float,
+        max_interval: float,
+        concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.devices = devices
+        self.emit = emit
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.concurrency = concurrency
+        self.clock = clock
+        self.sleep = sleep
+
+    def _fetch(self, device: WatchedDevice) -> LitterBoxDetail | FeederDetail | Exception:
+        try:
+            detail = device.client.get_device_detail(device.device_id, device.device_type)
+        except (CatLinkAPIError, httpx.HTTPError) as exc:
+            return exc
+        return parse_detail(detail, device.device_type)
+
+    def _report(
+        self, device: WatchedDevice, result: LitterBoxDetail | FeederDetail | Exception
+    ) -> None:
+        stamp = datetime.datetime.now().strftime("%H:%M:%S")
+        label = f"{device.name} ({device.device_id})"
+        if isinstance(result, Exception):
+            self.emit(f"[{stamp}] {label} error: {result}")
+            return
+        for field, old, new in changed_fields(device.detail, result):
+            new_text = format_value(field, new, device.device_type)
+            if device.detail is None:
+                self.emit(f"[{stamp}] {label} {field}: {new_text}")
+            else:
+                old_text = format_value(field, old, device.device_type)
+                self.emit(f"[{stamp}] {label} {field}: {old_text} -> {new_text}")
+        device.detail = result
+
+    def poll(self, devices: list[WatchedDevice]) -> None:
+        """
+        Poll a batch of devices concurrently and report their changes in order.
+
+        Args:
+            devices: Devices that are due.
+
+        Returns:
+            None.
+        """
+        workers = min(self.concurrency, len(devices))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(self._fetch, devices))
+        for device, result in zip(devices, results, strict=True):
+            self._report(device, result)
+            device.polls += 1
+            running = isinstance(result, LitterBoxDetail) and result.work_status == RUNNING_STATUS
+            device.interval = next_interval(
+                device.interval, running, self.min_interval, self.max_interval
+            )
+
+    def run(self, count: int | None = None) -> None:
+        """
+        Poll until interrupted, or until every device was polled count times.
+
+        Args:
+            count: Number of polls per device, or None to run forever.
+
+        Returns:
+            None.
+        """
+        now = self.clock()
+        queue = [(now, index) for index in range(len(self.devices))]
+        heapq.heapify(queue)
+        while queue:
+            due_at = queue[0][0]
+            delay = due_at - self.clock()
+            if delay > 0:
+                self.sleep(delay)
+            due: list[int] = []
+            while queue and queue[0][0] <= due_at:
+                due.append(heapq.heappop(queue)[1])
+            batch = [self.devices[index] for index in sorted(due)]
+            self.poll(batch)
+            now = self.clock()
+            for index in sorted(due):
+                device = self.devices[index]
+                if count is None or device.polls < count:
+                    heapq.heappush(queue, (now + device.interval, index))
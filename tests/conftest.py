@@ -0,0 +1,36 @@
+"""Shared fixtures for the CatLink CLI tests."""
+
+import pathlib
+from collections.abc import Iterator
+
+import pytest
+
+from catlink_cli.api import invalidate_credential_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("CATLINK_CACHE_DIR", str(cache))
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_daemon_socket(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    sock = tmp_path / "daemon.sock"
+    monkeypatch.setenv("CATLINK_DAEMON_SOCKET", str(sock))
+    return sock
+
+
+@pytest.fixture(autouse=True)
+def isolated_history_db(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    db = tmp_path / "history.db"
+    monkeypatch.setenv("CATLINK_DB", str(db))
+    return db
+
+
+@pytest.fixture(autouse=True)
+def fresh_credential_cache() -> Iterator[None]:
+    invalidate_credential_cache()
+    yield
+    invalidate_credential_cache()
@@ -1,12 +1,31 @@
 """Tests for the CatLink API client."""
 
+import asyncio
 import hashlib
-from unittest.mock import MagicMock, patch
+import pathlib
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
-from catlink_cli.api import CatLinkAPI, CatLinkAPIError, get_authenticated_client
-from catlink_cli.const import SIGN_KEY
+from catlink_cli.api import (
+    AsyncCatLinkAPI,
+    CatLinkAPI,
+    CatLinkAPIError,
+    _load_all_credentials,
+    _load_credentials,
+    clear_credentials,
+    clear_credentials_for_region,
+    fan_out,
+    get_authenticated_client,
+    invalidate_credential_cache,
+    keep_tokens_fresh,
+    save_credentials,
+)
+from catlink_cli.cache import CapabilityCache, DeviceRegistry, ResponseCache, account_key
+from catlink_cli.const import API_SERVERS, SIGN_KEY
 
 
 class TestParamsSign:
@@ -100,6 +119,23 @@ class TestCatLinkAPI:
         assert len(devices) == 1
         assert devices[0]["deviceName"] == "Scooper"
 
+    def test_get_devices_fills_registry(self, tmp_path: pathlib.Path) -> None:
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {
+            "returnCode": 0,
+            "data": {"devices": [{"id": "1", "deviceType": "FEEDER", "model": "F1"}]},
+        }
+        registry = DeviceRegistry(tmp_path / "devices.json")
+        client = CatLinkAPI(api_base=API_SERVERS["china"], token="tok", registry=registry)
+        client._client = MagicMock()
+        client._client.get.return_value = mock_resp
+
+        client.get_devices()
+        entry = registry.lookup("1")
+        assert entry is not None
+        assert entry["region"] == "china"
+        assert entry["model"] == "F1"
+
     @patch("catlink_cli.api.httpx.Client")
     def test_check_response_error(self, mock_client_cls: MagicMock) -> None:
         client = CatLinkAPI()
@@ -113,6 +149,351 @@ class TestCatLinkAPI:
         assert result == {"returnCode": 0, "data": {}}
 
 
+class TestRegionLogin:
+    def test_login_all_regions_reports_in_region_order(self) -> None:
+        def fake_login(self: CatLinkAPI, phone_iac: str, phone: str, password: str) -> str:
+            if self.api_base == API_SERVERS["china"]:
+                raise CatLinkAPIError("Login failed: bad creds")
+            return f"tok-{self.api_base}"
+
+        with patch.object(CatLinkAPI, "login", autospec=True, side_effect=fake_login):
+            client = CatLinkAPI()
+            successes, errors = client.login_all_regions("86", "123", "pass")
+            client.close()
+
+        assert [region for region, _, _ in successes] == ["global", "usa", "singapore"]
+        assert successes[1] == ("usa", API_SERVERS["usa"], f"tok-{API_SERVERS['usa']}")
+        assert errors == [("china", "Login failed: bad creds")]
+
+    def test_login_auto_region_returns_first_success(self) -> None:
+        release = threading.Event()
+
+        def fake_login(self: CatLinkAPI, phone_iac: str, phone: str, password: str) -> str:
+            if self.api_base != API_SERVERS["singapore"]:
+                release.wait(5)
+                raise CatLinkAPIError("Login failed: timeout")
+            return "sgp-token"
+
+        with patch.object(CatLinkAPI, "login", autospec=True, side_effect=fake_login):
+            client = CatLinkAPI()
+            token, api_base = client.login_auto_region("86", "123", "pass")
+            release.set()
+            client.close()
+
+        assert token == "sgp-token"
+        assert api_base == API_SERVERS["singapore"]
+        assert client.token == "sgp-token"
+
+    def test_login_auto_region_all_fail(self) -> None:
+        def fake_login(self: CatLinkAPI, phone_iac: str, phone: str, password: str) -> str:
+            raise CatLinkAPIError("nope")
+
+        with patch.object(CatLinkAPI, "login", autospec=True, side_effect=fake_login):
+            client = CatLinkAPI()
+            with pytest.raises(CatLinkAPIError, match="global: nope; china: nope"):
+                client.login_auto_region("86", "123", "pass")
+            client.close()
+
+
+class TestExpandDevices:
+    def test_candidates_and_ids_fetched_concurrently_in_order(self) -> None:
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def fake_get(url: str, params: dict, headers: dict) -> MagicMock:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            resp = MagicMock()
+            if url.endswith("token/device/info"):
+                dev_id = params["deviceId"]
+                resp.json.return_value = {
+                    "returnCode": 0,
+                    "data": {"deviceInfo": {"id": dev_id, "deviceType": "FEEDER"}},
+                }
+            elif url.endswith("token/device/feeder/list"):
+                resp.json.return_value = {"returnCode": 0, "data": {"list": ["f1", "f2", "f3"]}}
+            elif params.get("type") == "NONE" and "current" not in params:
+                resp.json.return_value = {
+                    "returnCode": 0,
+                    "data": {"devices": [{"id": "s1", "deviceType": "SCOOPER"}]},
+                }
+            else:
+                resp.json.return_value = {"returnCode": 0, "data": {}}
+            return resp
+
+        client = CatLinkAPI(token="tok", max_concurrency=2)
+        client._client = MagicMock()
+        client._client.get.side_effect = fake_get
+
+        devices = client.get_devices()
+        assert [dev["id"] for dev in devices] == ["s1", "f1", "f2", "f3"]
+        assert peak == 2
+
+
+class TestCapabilityDiscovery:
+    @staticmethod
+    def _client(
+        tmp_path: pathlib.Path, failures: dict[str, object] | None = None
+    ) -> tuple[CatLinkAPI, list[str]]:
+        calls: list[str] = []
+
+        def fake_get(url: str, params: dict, headers: dict) -> MagicMock:
+            api = url.split("/api/", 1)[1]
+            calls.append(f"{api}:{params.get('type', '')}")
+            failure = (failures or {}).get(api)
+            if isinstance(failure, Exception):
+                raise failure
+            resp = MagicMock()
+            if failure is not None:
+                resp.status_code = failure
+                resp.json.side_effect = ValueError("not JSON")
+                return resp
+            if api == "token/device/feeder/list":
+                resp.json.return_value = {
+                    "returnCode": 0,
+                    "data": {"devices": [{"id": "f1", "deviceType": "FEEDER"}]},
+                }
+            else:
+                resp.json.return_value = {"returnCode": 0, "data": {}}
+            return resp
+
+        client = CatLinkAPI(
+            api_base=API_SERVERS["usa"],
+            token="tok",
+            account="86:123",
+            capabilities=CapabilityCache(tmp_path / "caps.json"),
+        )
+        client._client = MagicMock()
+        client._client.get.side_effect = fake_get
+        return client, calls
+
+    def test_dead_endpoints_skipped_after_probe(self, tmp_path: pathlib.Path) -> None:
+        client, calls = self._client(tmp_path)
+        assert [d["id"] for d in client.get_devices()] == ["f1"]
+        assert len(calls) == 6
+
+        calls.clear()
+        assert [d["id"] for d in client.get_devices()] == ["f1"]
+        assert sorted(calls) == ["token/device/feeder/list:", "token/device/union/list/sorted:NONE"]
+
+    def test_rediscover_probes_everything(self, tmp_path: pathlib.Path) -> None:
+        client, calls = self._client(tmp_path)
+        client.get_devices()
+        calls.clear()
+        client.get_devices(rediscover=True)
+        assert len(calls) == 6
+
+    def test_failed_probe_is_not_recorded(self, tmp_path: pathlib.Path) -> None:
+        client, calls = self._client(
+            tmp_path, {"token/device/list": httpx.ReadTimeout("timed out")}
+        )
+        assert [d["id"] for d in client.get_devices()] == ["f1"]
+        assert client.capabilities.get(account_key("86:123"), "usa") is None
+
+        calls.clear()
+        client.get_devices()
+        assert len(calls) == 6
+
+    def test_missing_endpoint_is_recorded_as_empty(self, tmp_path: pathlib.Path) -> None:
+        client, calls = self._client(tmp_path, {"token/device/list": 404})
+        assert [d["id"] for d in client.get_devices()] == ["f1"]
+
+        calls.clear()
+        client.get_devices()
+        assert sorted(calls) == ["token/device/feeder/list:", "token/device/union/list/sorted:NONE"]
+
+
+class TestResponseCaching:
+    @staticmethod
+    def _client(tmp_path: pathlib.Path, ttls: dict) -> CatLinkAPI:
+        detail = {"returnCode": 0, "data": {"deviceInfo": {"workStatus": "00"}}}
+
+        def fake_get(url: str, params: dict, headers: dict) -> MagicMock:
+            resp = MagicMock()
+            resp.json.return_value = detail
+            return resp
+
+        client = CatLinkAPI(
+            token="tok",
+            response_cache=ResponseCache(tmp_path / "responses.json", ttls=ttls),
+        )
+        client._client = MagicMock()
+        client._client.get.side_effect = fake_get
+        client._client.post.return_value.json.return_value = {"returnCode": 0}
+        return client
+
+    def test_fresh_read_served_from_cache(self, tmp_path: pathlib.Path) -> None:
+        client = self._client(tmp_path, {"token/device/info": (60, 600)})
+        first = client.get_device_detail("dev1", "SCOOPER")
+        second = client.get_device_detail("dev1", "SCOOPER")
+        assert first == second == {"workStatus": "00"}
+        assert client._client.get.call_count == 1
+
+    def test_stale_read_refreshed_in_background(self, tmp_path: pathlib.Path) -> None:
+        client = self._client(tmp_path, {"token/device/info": (0, 600)})
+        client.get_device_detail("dev1", "SCOOPER")
+        assert client.get_device_detail("dev1", "SCOOPER") == {"workStatus": "00"}
+        client.close()
+        assert client._client.get.call_count == 2
+
+    def test_failed_background_refresh_is_logged(self, tmp_path: pathlib.Path) -> None:
+        client = self._client(tmp_path, {"token/device/info": (0, 600)})
+        client.get_device_detail("dev1", "SCOOPER")
+        with (
+            patch.object(client, "_send", side_effect=CatLinkAPIError("gone", code=404)) as send,
+            patch("threading.excepthook") as excepthook,
+        ):
+            assert client.get_device_detail("dev1", "SCOOPER") == {"workStatus": "00"}
+            client.close()
+        send.assert_called_once()
+        excepthook.assert_not_called()
+
+    def test_write_invalidates_device(self, tmp_path: pathlib.Path) -> None:
+        client = self._client(tmp_path, {"token/device/info": (60, 600)})
+        client.get_device_detail("dev1", "SCOOPER")
+        client.send_action("dev1", "01", "SCOOPER")
+        client.get_device_detail("dev1", "SCOOPER")
+        assert client._client.get.call_count == 2
+
+    def test_cache_reads_disabled(self, tmp_path: pathlib.Path) -> None:
+        client = self._client(tmp_path, {"token/device/info": (60, 600)})
+        client.cache_reads = False
+        client.get_device_detail("dev1", "SCOOPER")
+        client.get_device_detail("dev1", "SCOOPER")
+        assert client._client.get.call_count == 2
+        client.close()
+        assert not (tmp_path / "responses.json").exists()
+
+    def test_fresh_call_skips_cache_for_that_call_only(self, tmp_path: pathlib.Path) -> None:
+        client = self._client(tmp_path, {"token/device/info": (60, 600)})
+        client.get_device_detail("dev1", "SCOOPER")
+        client.get_device_detail("dev1", "SCOOPER", fresh=True)
+        assert client._client.get.call_count == 2
+        assert client.cache_reads is True
+        client.get_device_detail("dev1", "SCOOPER")
+        assert client._client.get.call_count == 2
+
+    def test_close_saves_responses(self, tmp_path: pathlib.Path) -> None:
+        client = self._client(tmp_path, {"token/device/info": (60, 600)})
+        client.get_device_detail("dev1", "SCOOPER")
+        assert not (tmp_path / "responses.json").exists()
+        client.close()
+        cache = ResponseCache(tmp_path / "responses.json", ttls={"token/device/info": (60, 600)})
+        assert len(cache._entries()) == 1
+
+
+class TestSingleFlight:
+    @staticmethod
+    def _client(release: threading.Event) -> CatLinkAPI:
+        def slow_get(url: str, params: dict, headers: dict) -> MagicMock:
+            release.wait(5)
+            resp = MagicMock()
+            resp.json.return_value = {
+                "returnCode": 0,
+                "data": {"deviceInfo": {"id": params["deviceId"]}},
+            }
+            return resp
+
+        client = CatLinkAPI(token="tok")
+        client._client = MagicMock()
+        client._client.get.side_effect = slow_get
+        return client
+
+    @staticmethod
+    def _run_concurrently(calls: list) -> tuple[list[threading.Thread], list]:
+        results: list = [None] * len(calls)
+
+        def run(index: int) -> None:
+            try:
+                results[index] = calls[index]()
+            except (CatLinkAPIError, httpx.HTTPError) as exc:
+                results[index] = exc
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(calls))]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def test_identical_reads_share_one_request(self) -> None:
+        release = threading.Event()
+        client = self._client(release)
+        threads, results = self._run_concurrently(
+            [lambda: client.get_device_detail("dev1", "SCOOPER")] * 5
+            + [lambda: client.get_device_detail("dev2", "SCOOPER")]
+        )
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert results == [{"id": "dev1"}] * 5 + [{"id": "dev2"}]
+        assert client._client.get.call_count == 2
+
+    def test_errors_reach_every_waiter(self) -> None:
+        release = threading.Event()
+        client = self._client(release)
+
+        def failing_get(url: str, params: dict, headers: dict) -> MagicMock:
+            release.wait(5)
+            raise httpx.ConnectError("down")
+
+        client._client.get.side_effect = failing_get
+        threads, results = self._run_concurrently(
+            [lambda: client.get_device_detail("dev1", "SCOOPER")] * 3
+        )
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert all(isinstance(result, httpx.ConnectError) for result in results)
+        assert client._client.get.call_count == 1
+
+    def test_sequential_and_write_requests_are_not_coalesced(self) -> None:
+        release = threading.Event()
+        release.set()
+        client = self._client(release)
+        client._client.post.return_value.json.return_value = {"returnCode": 0}
+        client.get_device_detail("dev1", "SCOOPER")
+        client.get_device_detail("dev1", "SCOOPER")
+        threads, _ = self._run_concurrently(
+            [lambda: client.send_action("dev1", "01", "SCOOPER")] * 3
+        )
+        for thread in threads:
+            thread.join()
+        assert client._client.get.call_count == 2
+        assert client._client.post.call_count == 3
+
+    def test_async_identical_reads_share_one_request(self) -> None:
+        calls = 0
+
+        async def slow_get(url: str, params: dict, headers: dict) -> MagicMock:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            resp = MagicMock()
+            resp.json.return_value = {"returnCode": 0, "data": {"deviceInfo": {"id": "dev1"}}}
+            return resp
+
+        async def scenario() -> list:
+            client = AsyncCatLinkAPI(token="tok")
+            client._client = AsyncMock()
+            client._client.get.side_effect = slow_get
+            first = asyncio.ensure_future(client.get_device_detail("dev1", "SCOOPER"))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await asyncio.gather(
+                *(client.get_device_detail("dev1", "SCOOPER") for _ in range(4))
+            )
+
+        assert asyncio.run(scenario()) == [{"id": "dev1"}] * 4
+        assert calls == 1
+
+
 class TestFoodOut:
     @patch("catlink_cli.api.httpx.Client")
     def test_food_out_sends_post(self, mock_client_cls: MagicMock) -> None:
@@ -165,6 +546,84 @@ class TestGetDeviceLogs:
         assert logs[0]["event"] == "fed"
 
 
+class TestAsyncCatLinkAPI:
+    def test_shares_signing_with_sync_client(self) -> None:
+        pms = {"b": "2", "a": "1"}
+        assert AsyncCatLinkAPI._params_sign(pms) == CatLinkAPI._params_sign(pms)
+
+    def test_login_success(self) -> None:
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"data": {"token": "abc123"}}
+        client = AsyncCatLinkAPI()
+        client._client = AsyncMock()
+        client._client.post.return_value = mock_resp
+
+        token = asyncio.run(client.login("86", "1234567890", "longencryptedpasswordvalue"))
+        assert token == "abc123"
+        assert client.token == "abc123"
+
+    def test_get_device_detail_checks_response(self) -> None:
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"returnCode": 3, "msg": "no such device"}
+        client = AsyncCatLinkAPI(token="tok")
+        client._client = AsyncMock()
+        client._client.get.return_value = mock_resp
+
+        with pytest.raises(CatLinkAPIError, match="no such device"):
+            asyncio.run(client.get_device_detail("dev1", "SCOOPER"))
+
+    def test_send_action_posts_signed_data(self) -> None:
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"returnCode": 0}
+        client = AsyncCatLinkAPI(token="tok")
+        client._client = AsyncMock()
+        client._client.post.return_value = mock_resp
+
+        asyncio.run(client.send_action("dev1", "01", "LITTER_BOX_599"))
+        url = client._client.post.call_args[0][0]
+        data = client._client.post.call_args[1]["data"]
+        assert url.endswith("token/litterbox/actionCmd")
+        assert data["cmd"] == "01"
+        assert data["token"] == "tok"
+        assert "sign" in data
+
+    def test_login_all_regions_concurrently(self) -> None:
+        async def fake_login(
+            self: AsyncCatLinkAPI, phone_iac: str, phone: str, password: str
+        ) -> str:
+            if self.api_base == API_SERVERS["usa"]:
+                return "usa-token"
+            raise CatLinkAPIError("bad creds")
+
+        with patch.object(AsyncCatLinkAPI, "login", autospec=True, side_effect=fake_login):
+            successes, errors = asyncio.run(
+                AsyncCatLinkAPI().login_all_regions("86", "123", "pass")
+            )
+
+        assert successes == [("usa", API_SERVERS["usa"], "usa-token")]
+        assert [region for region, _ in errors] == ["global", "china", "singapore"]
+
+
+class TestFanOut:
+    def test_yields_results_and_errors(self) -> None:
+        def fail() -> None:
+            raise CatLinkAPIError("boom")
+
+        outcomes = {key: (res, exc) for key, res, exc in fan_out([("a", lambda: 1), ("b", fail)])}
+        assert outcomes["a"] == (1, None)
+        assert isinstance(outcomes["b"][1], CatLinkAPIError)
+
+    def test_deadline_reports_pending_calls(self) -> None:
+        release = threading.Event()
+        outcomes = list(fan_out([("fast", lambda: 1), ("slow", release.wait)], timeout=0.05))
+        release.set()
+        assert outcomes[0] == ("fast", 1, None)
+        key, result, exc = outcomes[1]
+        assert key == "slow"
+        assert result is None
+        assert isinstance(exc, TimeoutError)
+
+
 class TestGetAuthenticatedClient:
     @patch("catlink_cli.api.keyring")
     def test_raises_when_no_credentials(self, mock_keyring: MagicMock) -> None:
@@ -188,3 +647,210 @@ class TestGetAuthenticatedClient:
         assert client.token == "stored_tok"
         assert "example.com" in client.api_base
         client.close()
+
+    @patch("catlink_cli.api.keyring")
+    def test_max_concurrency_is_passed_to_client(self, mock_keyring: MagicMock) -> None:
+        stored = {"token": "tok", "api_base": "https://example.com/api/"}
+        mock_keyring.get_password.side_effect = lambda service, key: stored.get(key)
+        client = get_authenticated_client(max_concurrency=20)
+        assert client.max_concurrency == 20
+        slots = [client._request_slots.acquire(blocking=False) for _ in range(21)]
+        assert slots.count(True) == 20
+        client.close()
+
+    @patch("catlink_cli.api.keyring")
+    def test_token_age_round_trips(self, mock_keyring: MagicMock) -> None:
+        store: dict[str, str] = {}
+        mock_keyring.set_password.side_effect = lambda _s, key, value: store.__setitem__(key, value)
+        mock_keyring.get_password.side_effect = lambda _s, key: store.get(key)
+
+        before = time.time()
+        save_credentials("tok", "123", "86", API_SERVERS["usa"])
+        client = get_authenticated_client(region="usa")
+        assert client.token_issued_at is not None
+        assert before <= client.token_issued_at <= time.time()
+        client.close()
+
+
+class TestCredentialStore:
+    @staticmethod
+    def _keyring(mock_keyring: MagicMock, store: dict[str, str]) -> None:
+        mock_keyring.get_password.side_effect = lambda _s, key: store.get(key)
+        mock_keyring.set_password.side_effect = lambda _s, key, value: store.__setitem__(key, value)
+        mock_keyring.delete_password.side_effect = lambda _s, key: store.pop(key, None)
+
+    @patch("catlink_cli.api.keyring")
+    def test_profiles_are_one_secret_read_once(self, mock_keyring: MagicMock) -> None:
+        store: dict[str, str] = {}
+        self._keyring(mock_keyring, store)
+        save_credentials("tok-usa", "123", "1", API_SERVERS["usa"])
+        save_credentials("tok-cn", "456", "86", API_SERVERS["china"])
+        assert list(store) == ["profiles"]
+        assert mock_keyring.set_password.call_count == 2
+
+        invalidate_credential_cache()
+        mock_keyring.get_password.reset_mock()
+        assert _load_credentials()["token"] == "tok-cn"
+        assert [region for region, _ in _load_all_credentials()] == ["china", "usa"]
+        assert _load_credentials(region="usa")["phone"] == "123"
+        assert mock_keyring.get_password.call_count == 1
+
+    @patch("catlink_cli.api.keyring")
+    def test_migrates_per_key_layout(self, mock_keyring: MagicMock) -> None:
+        store = {
+            "token": "tok-usa",
+            "phone": "123",
+            "phone_iac": "1",
+            "api_base": API_SERVERS["usa"],
+            "token:usa": "tok-usa",
+            "api_base:usa": API_SERVERS["usa"],
+            "token:china": "tok-cn",
+            "verify_ssl:china": "False",
+        }
+        self._keyring(mock_keyring, store)
+
+        assert _load_credentials()["token"] == "tok-usa"
+        assert list(store) == ["profiles"]
+        invalidate_credential_cache()
+        china = _load_credentials(region="china")
+        assert china["token"] == "tok-cn"
+        assert china["verify"] is False
+        assert china["phone"] == "123"
+
+    @patch("catlink_cli.api.keyring")
+    def test_clear_region_moves_default(self, mock_keyring: MagicMock) -> None:
+        store: dict[str, str] = {}
+        self._keyring(mock_keyring, store)
+        save_credentials("tok-usa", "123", "1", API_SERVERS["usa"])
+        save_credentials("tok-cn", "456", "86", API_SERVERS["china"])
+
+        clear_credentials_for_region("china")
+        assert _load_credentials()["token"] == "tok-usa"
+        clear_credentials()
+        assert store == {}
+        assert _load_credentials() is None
+
+
+STORED_CREDS = {"phone_iac": "86", "phone": "123", "token": "stored", "verify": True}
+
+
+class TestTokenRefresh:
+    @staticmethod
+    def _client() -> CatLinkAPI:
+        def fake_get(url: str, params: dict, headers: dict) -> MagicMock:
+            time.sleep(0.05)
+            resp = MagicMock()
+            if params.get("token") == "new":
+                resp.json.return_value = {"returnCode": 0, "data": {"deviceInfo": {"ok": 1}}}
+            else:
+                resp.json.return_value = {"returnCode": 1002, "msg": "expired"}
+            return resp
+
+        client = CatLinkAPI(api_base=API_SERVERS["usa"], token="old")
+        client._client = MagicMock()
+        client._client.get.side_effect = fake_get
+        client._client.post.return_value.json.return_value = {"data": {"token": "new"}}
+        return client
+
+    @patch("catlink_cli.api._store_refreshed_token")
+    @patch("catlink_cli.api._load_credentials", return_value=STORED_CREDS)
+    def test_concurrent_rejections_share_one_login(
+        self, mock_load: MagicMock, mock_store: MagicMock
+    ) -> None:
+        client = self._client()
+        results: list[dict] = []
+        threads = [
+            threading.Thread(
+                target=lambda dev=f"dev{i}": results.append(
+                    client.get_device_detail(dev, "SCOOPER")
+                )
+            )
+            for i in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [{"ok": 1}] * 5
+        assert client._client.post.call_count == 1
+        mock_load.assert_called_once_with(region="usa")
+        mock_store.assert_called_once_with(API_SERVERS["usa"], "new")
+        assert client.token_issued_at is not None
+
+    @patch("catlink_cli.api._load_credentials", return_value=None)
+    def test_rejection_without_credentials(self, mock_load: MagicMock) -> None:
+        client = self._client()
+        with pytest.raises(CatLinkAPIError, match="expired"):
+            client.get_device_detail("dev1", "SCOOPER")
+        client._client.post.assert_not_called()
+
+    def test_ensure_token_refreshes_old_tokens(self) -> None:
+        client = self._client()
+        client.token_issued_at = time.time() - 2 * 24 * 3600
+        with patch.object(client, "_reauthenticate") as mock_reauth:
+            client.ensure_token()
+        mock_reauth.assert_called_once_with("old")
+        client._client.get.assert_not_called()
+
+    @patch("catlink_cli.api._store_refreshed_token")
+    @patch("catlink_cli.api._load_credentials", return_value=STORED_CREDS)
+    def test_ensure_token_probes_unconfirmed_tokens(
+        self, mock_load: MagicMock, mock_store: MagicMock
+    ) -> None:
+        client = self._client()
+        client.ensure_token()
+        assert client.token == "new"
+        assert client._client.get.call_count == 1
+
+        client.ensure_token()
+        assert client._client.get.call_count == 1
+
+    def test_successful_requests_confirm_the_token(self) -> None:
+        client = self._client()
+        client.token = "new"
+        client.get_device_detail("dev1", "SCOOPER")
+        with patch.object(client, "validate_token") as mock_validate:
+            client.ensure_token()
+        mock_validate.assert_not_called()
+
+    def test_keep_tokens_fresh(self) -> None:
+        client = MagicMock()
+        stop = threading.Event()
+        thread = keep_tokens_fresh(lambda: [client], stop, period=0.01)
+        time.sleep(0.05)
+        stop.set()
+        thread.join(timeout=1)
+        assert client.ensure_token.called
+        assert not thread.is_alive()
+
+    @patch("catlink_cli.api._store_refreshed_token")
+    @patch("catlink_cli.api._load_credentials", return_value=STORED_CREDS)
+    def test_async_concurrent_rejections_share_one_login(
+        self, mock_load: MagicMock, mock_store: MagicMock
+    ) -> None:
+        async def fake_get(url: str, params: dict, headers: dict) -> MagicMock:
+            await asyncio.sleep(0.01)
+            resp = MagicMock()
+            ok = params.get("token") == "new"
+            resp.json.return_value = (
+                {"returnCode": 0, "data": {"deviceInfo": {"ok": 1}}}
+                if ok
+                else {"returnCode": 1002, "msg": "expired"}
+            )
+            return resp
+
+        async def scenario() -> list[dict]:
+            client = AsyncCatLinkAPI(api_base=API_SERVERS["usa"], token="old")
+            client._client = AsyncMock()
+            client._client.get.side_effect = fake_get
+            client._client.post.return_value = MagicMock()
+            client._client.post.return_value.json.return_value = {"data": {"token": "new"}}
+            results = await asyncio.gather(
+                *(client.get_device_detail(f"dev{i}", "SCOOPER") for i in range(4))
+            )
+            assert client._client.post.call_count == 1
+            return results
+
+        assert asyncio.run(scenario()) == [{"ok": 1}] * 4
+        mock_store.assert_called_once_with(API_SERVERS["usa"], "new")
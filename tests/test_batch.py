@@ -0,0 +1,190 @@
+"""Tests for 'catlink batch'."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from catlink_cli.api import CatLinkAPIError
+from catlink_cli.batch import (
+    BatchError,
+    BatchRunner,
+    device_operation,
+    parse_script,
+    parse_step,
+)
+from catlink_cli.cache import DeviceRegistry
+from catlink_cli.cli import cli
+
+
+def _client(devices: list[dict]) -> MagicMock:
+    client = MagicMock()
+    client.cache_reads = True
+    client.get_devices.return_value = devices
+    return client
+
+
+class TestParse:
+    def test_commands_and_options(self) -> None:
+        steps = parse_script(
+            [
+                "# nightly maintenance\n",
+                "clean DEV1\n",
+                "\n",
+                "mode DEV2 auto --type LITTER_BOX_599\n",
+                "feed DEV3 --portions=2  # small meal\n",
+                "reset-litter DEV4\n",
+            ]
+        )
+        assert [(s.line, s.command, s.device_id) for s in steps] == [
+            (2, "clean", "DEV1"),
+            (4, "mode", "DEV2"),
+            (5, "feed", "DEV3"),
+            (6, "reset-litter", "DEV4"),
+        ]
+        assert steps[1].args == ("auto",)
+        assert steps[1].device_type == "LITTER_BOX_599"
+        assert steps[2].portions == 2
+        assert steps[2].text == "feed DEV3 --portions=2"
+
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ("scrub DEV1", "unknown command 'scrub'"),
+            ("mode DEV1", "usage: mode DEVICE_ID MODE"),
+            ("clean DEV1 --portions 2", "clean does not accept --portions"),
+            ("feed DEV1 --portions 11", "between 1 and 10"),
+            ("feed DEV1 --portions", "--portions requires a value"),
+        ],
+    )
+    def test_invalid_lines(self, text: str, message: str) -> None:
+        with pytest.raises(BatchError, match=message):
+            parse_step(3, text)
+
+    def test_reports_every_invalid_line(self) -> None:
+        with pytest.raises(BatchError) as exc_info:
+            parse_script(["scrub A", "clean B", "mode C"])
+        lines = str(exc_info.value).splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith("line 1: unknown command 'scrub'. Valid commands: clean,")
+        assert lines[1] == "line 3: usage: mode DEVICE_ID MODE"
+
+
+class TestBatchRunner:
+    def test_resolves_devices_with_one_listing_per_region(self) -> None:
+        DeviceRegistry().record("usa", [{"id": "1", "deviceType": "SCOOPER"}])
+        usa = _client([])
+        china = _client([{"id": "2", "deviceType": "LITTER_BOX_599"}])
+        steps = parse_script(["clean 1", "mode 2 time", "reset-litter 2", "feed 9"])
+
+        results = list(BatchRunner([("usa", usa), ("china", china)]).run(steps))
+
+        by_line = {r.step.line: r for r in results}
+        assert by_line[1].ok and by_line[1].region == "usa"
+        assert by_line[2].message == "Mode set to 'time'."
+        assert by_line[3].ok and by_line[3].region == "china"
+        assert (by_line[4].ok, by_line[4].message) == (False, "device not found")
+        usa.send_action.assert_called_once_with("1", "01", "SCOOPER")
+        china.change_mode.assert_called_once_with("2", "02", "LITTER_BOX_599")
+        china.reset_consumable.assert_called_once_with("2", "LITTER_BOX_599", "CAT_LITTER")
+        usa.get_devices.assert_called_once()
+        china.get_devices.assert_called_once()
+        assert usa.cache_reads is True
+
+    def test_same_device_in_order_other_devices_in_parallel(self) -> None:
+        client = _client(
+            [{"id": "1", "deviceType": "SCOOPER"}, {"id": "2", "deviceType": "SCOOPER"}]
+        )
+        calls: list[tuple[str, str]] = []
+        active: set[str] = set()
+        overlap = threading.Event()
+        lock = threading.Lock()
+
+        def send_action(device_id: str, code: str, device_type: str) -> dict:
+            with lock:
+                active.add(device_id)
+                if len(active) > 1:
+                    overlap.set()
+            time.sleep(0.02)
+            with lock:
+                active.discard(device_id)
+                calls.append((device_id, code))
+            return {}
+
+        client.send_action.side_effect = send_action
+        steps = parse_script(["clean 1", "clean 2", "pause 1", "pause 2"])
+        list(BatchRunner([("usa", client)]).run(steps))
+
+        assert [code for dev, code in calls if dev == "1"] == ["01", "00"]
+        assert [code for dev, code in calls if dev == "2"] == ["01", "00"]
+        assert overlap.is_set()
+
+    def test_failure_skips_later_steps_for_that_device(self) -> None:
+        client = _client([{"id": "1", "deviceType": "SCOOPER"}])
+        client.reset_consumable.side_effect = CatLinkAPIError("offline")
+        steps = parse_script(["reset-litter 1", "clean 1", "mode 1 sideways"])
+
+        results = list(BatchRunner([("usa", client)]).run(steps))
+
+        assert [(r.ok, r.message) for r in results] == [
+            (False, "offline"),
+            (False, "skipped after an earlier failure"),
+            (False, "skipped after an earlier failure"),
+        ]
+        client.send_action.assert_not_called()
+
+    def test_unsupported_device_type(self) -> None:
+        client = _client([{"id": "1", "deviceType": "FEEDER"}])
+        results = list(BatchRunner([("usa", client)]).run(parse_script(["clean 1"])))
+        assert results[0].message == "device is a FEEDER; clean supports SCOOPER, LITTER_BOX_599"
+
+    def test_feed_and_change_bag_check_the_device_type(self) -> None:
+        client = _client([{"id": "1", "deviceType": "SCOOPER"}])
+        script = parse_script(["feed 1", "change-bag 2"])
+        results = list(BatchRunner([("usa", client)]).run(script))
+        assert [result.message for result in results] == [
+            "device is a SCOOPER; feed supports FEEDER",
+            "device not found",
+        ]
+        with pytest.raises(BatchError, match="change-bag supports LITTER_BOX_599"):
+            device_operation("change-bag", "2", "SCOOPER")
+        client.food_out.assert_not_called()
+
+
+class TestBatchCommand:
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_reads_stdin_and_loads_credentials_once(self, mock_get_clients: MagicMock) -> None:
+        client = _client(
+            [{"id": "1", "deviceType": "SCOOPER"}, {"id": "3", "deviceType": "FEEDER"}]
+        )
+        mock_get_clients.return_value = [("usa", client)]
+
+        result = CliRunner().invoke(cli, ["batch"], input="clean 1\nfeed 3 --portions 2\n")
+
+        assert result.exit_code == 0, result.output
+        assert "[line 1] clean 1: Cleaning started." in result.output
+        assert "[line 2] feed 3 --portions 2: Dispensing 2 portion(s)." in result.output
+        mock_get_clients.assert_called_once()
+        client.food_out.assert_called_once_with("3", 2)
+        client.close.assert_called_once()
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_failures_set_exit_code(self, mock_get_clients: MagicMock) -> None:
+        client = _client([{"id": "1", "deviceType": "SCOOPER"}])
+        client.send_action.side_effect = CatLinkAPIError("offline")
+        mock_get_clients.return_value = [("usa", client)]
+
+        result = CliRunner().invoke(cli, ["--output", "ndjson", "batch"], input="clean 1\n")
+
+        assert result.exit_code == 1
+        assert '"ok":false' in result.output.replace(" ", "")
+        assert "1 of 1 commands failed" in result.output
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_invalid_script_runs_nothing(self, mock_get_clients: MagicMock) -> None:
+        result = CliRunner().invoke(cli, ["batch"], input="clean 1\nscrub 2\n")
+        assert result.exit_code == 2
+        assert "line 2: unknown command 'scrub'" in result.output
+        mock_get_clients.assert_not_called()
@@ -0,0 +1,156 @@
+"""Tests for the on-disk caches."""
+
+import json
+import pathlib
+import time
+from unittest.mock import patch
+
+from catlink_cli.cache import (
+    CapabilityCache,
+    DeviceRegistry,
+    ResponseCache,
+    SummaryCache,
+    cache_dir,
+    endpoint_key,
+    read_json,
+)
+
+
+class TestCacheDir:
+    def test_env_override(self, isolated_cache_dir: pathlib.Path) -> None:
+        assert cache_dir() == isolated_cache_dir
+
+
+class TestEndpointKey:
+    def test_params_sorted(self) -> None:
+        assert endpoint_key("a/b", {"z": 1, "a": 2}) == "a/b?a=2&z=1"
+
+    def test_no_params(self) -> None:
+        assert endpoint_key("a/b", None) == "a/b"
+
+
+class TestCapabilityCache:
+    def test_round_trip(self, tmp_path: pathlib.Path) -> None:
+        cache = CapabilityCache(tmp_path / "caps.json")
+        assert cache.get("acct", "usa") is None
+        cache.put("acct", "usa", ["token/device/feeder/list"])
+        assert cache.get("acct", "usa") == ["token/device/feeder/list"]
+        assert cache.get("acct", "china") is None
+
+    def test_entries_expire(self, tmp_path: pathlib.Path) -> None:
+        cache = CapabilityCache(tmp_path / "caps.json", ttl=60)
+        cache.put("acct", "usa", [])
+        with patch("catlink_cli.cache.time.time", return_value=time.time() + 120):
+            assert cache.get("acct", "usa") is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "caps.json"
+        path.write_text("{not json")
+        assert read_json(path) == {}
+        assert CapabilityCache(path).get("acct", "usa") is None
+
+
+class TestDeviceRegistry:
+    def test_record_and_lookup(self, tmp_path: pathlib.Path) -> None:
+        registry = DeviceRegistry(tmp_path / "devices.json")
+        registry.record("usa", [{"id": 7, "deviceType": "SCOOPER", "model": "SE"}])
+        entry = registry.lookup("7")
+        assert entry is not None
+        assert entry["region"] == "usa"
+        assert entry["deviceType"] == "SCOOPER"
+        assert registry.lookup("8") is None
+
+    def test_record_prunes_devices_no_longer_listed(self, tmp_path: pathlib.Path) -> None:
+        registry = DeviceRegistry(tmp_path / "devices.json")
+        registry.record("usa", [{"id": "a"}, {"id": "b"}])
+        registry.record("china", [{"id": "c"}])
+        registry.record("usa", [{"id": "b"}])
+        assert registry.lookup("a") is None
+        assert registry.lookup("b") is not None
+        assert registry.lookup("c") is not None
+
+    def test_forget_and_clear(self, tmp_path: pathlib.Path) -> None:
+        registry = DeviceRegistry(tmp_path / "devices.json")
+        registry.record("usa", [{"id": "a"}, {"id": "b"}])
+        registry.record("china", [{"id": "c"}])
+        registry.forget("a")
+        assert registry.lookup("a") is None
+        assert registry.lookup("b") is not None
+        registry.clear("usa")
+        assert set(registry.entries()) == {"c"}
+        registry.clear()
+        assert registry.entries() == {}
+
+
+class TestResponseCache:
+    def test_fresh_then_stale_then_expired(self, tmp_path: pathlib.Path) -> None:
+        cache = ResponseCache(tmp_path / "responses.json", ttls={"a/b": (10, 100)})
+        cache.put("k", "a/b", "dev1", {"returnCode": 0, "data": {"x": 1}})
+        now = time.time()
+        assert cache.get("k", "a/b") == ({"returnCode": 0, "data": {"x": 1}}, False)
+        with patch("catlink_cli.cache.time.time", return_value=now + 50):
+            assert cache.get("k", "a/b") == ({"returnCode": 0, "data": {"x": 1}}, True)
+        with patch("catlink_cli.cache.time.time", return_value=now + 500):
+            assert cache.get("k", "a/b") is None
+
+    def test_persists_across_instances(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "responses.json"
+        cache = ResponseCache(path, ttls={"a/b": (10, 100)})
+        cache.put("k", "a/b", None, {"returnCode": 0})
+        assert not path.exists()
+        cache.save()
+        assert ResponseCache(path, ttls={"a/b": (10, 100)}).get("k", "a/b") is not None
+
+    def test_saves_after_flush_interval(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "responses.json"
+        cache = ResponseCache(path, ttls={"a/b": (10, 100)}, flush_interval=30)
+        cache.put("k1", "a/b", None, {"returnCode": 0})
+        assert not path.exists()
+        later = time.monotonic() + 31
+        with patch("catlink_cli.cache.time.monotonic", return_value=later):
+            cache.put("k2", "a/b", None, {"returnCode": 0})
+        assert sorted(json.loads(path.read_text())) == ["k1", "k2"]
+
+    def test_save_merges_other_processes(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "responses.json"
+        ttls = {"a/b": (10, 100)}
+        first = ResponseCache(path, ttls=ttls)
+        second = ResponseCache(path, ttls=ttls)
+        first.get("k1", "a/b")
+        second.put("k2", "a/b", "dev2", {"returnCode": 0})
+        second.save()
+        first.put("k1", "a/b", "dev1", {"returnCode": 0})
+        first.save()
+        assert sorted(json.loads(path.read_text())) == ["k1", "k2"]
+        assert first.get("k2", "a/b") is not None
+
+        second.invalidate_device("dev1")
+        first.put("k3", "a/b", None, {"returnCode": 0})
+        first.save()
+        assert sorted(json.loads(path.read_text())) == ["k2", "k3"]
+
+    def test_invalidate_device(self, tmp_path: pathlib.Path) -> None:
+        cache = ResponseCache(tmp_path / "responses.json", ttls={"a/b": (10, 100)})
+        cache.put("k1", "a/b", "dev1", {"returnCode": 0})
+        cache.put("k2", "a/b", "dev2", {"returnCode": 0})
+        cache.invalidate_device("dev1")
+        assert cache.get("k1", "a/b") is None
+        assert cache.get("k2", "a/b") is not None
+
+
+class TestSummaryCache:
+    def test_written_on_save(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "summaries.json"
+        cache = SummaryCache(path)
+        cache.put("acct", "usa", "p1", "2024-05-01", {"weight": 4})
+        assert cache.get("acct", "usa", "p1", "2024-05-01") == {"weight": 4}
+        assert not path.exists()
+        cache.save()
+        assert SummaryCache(path).get("acct", "usa", "p1", "2024-05-01") == {"weight": 4}
+        assert SummaryCache(path).get("acct", "usa", "p1", "2024-05-02") is None
+
+    def test_saves_after_flush_interval(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "summaries.json"
+        cache = SummaryCache(path, flush_interval=0)
+        cache.put("acct", "usa", "p1", "2024-05-01", {"weight": 4})
+        assert SummaryCache(path).get("acct", "usa", "p1", "2024-05-01") == {"weight": 4}
@@ -1,11 +1,18 @@
 """Tests for the CatLink CLI commands."""
 
+import datetime
+import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
+from catlink_cli.api import CatLinkAPIError
+from catlink_cli.cache import DeviceRegistry
 from catlink_cli.cli import cli
+from catlink_cli.const import DEFAULT_MAX_CONCURRENCY
 
 
 @pytest.fixture
@@ -62,6 +69,16 @@ class TestDevicesCommand:
         assert "MyScooper" in result.output
         assert "SCOOPER" in result.output
 
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_rediscover_flag(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
+        mock_client = MagicMock()
+        mock_client.get_devices.return_value = []
+        mock_get_client.return_value = [("usa", mock_client)]
+
+        result = runner.invoke(cli, ["devices", "--rediscover"])
+        assert result.exit_code == 0
+        mock_client.get_devices.assert_called_once_with(rediscover=True)
+
     @patch("catlink_cli.cli.get_authenticated_clients")
     def test_no_devices(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
         mock_client = MagicMock()
@@ -73,6 +90,84 @@ class TestDevicesCommand:
         assert "No devices" in result.output
 
 
+class TestRegionFanOut:
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_failed_region_reported_as_warning(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        from catlink_cli.api import CatLinkAPIError
+
+        ok_client = MagicMock()
+        ok_client.get_cats.return_value = [{"name": "Whiskers", "id": "42"}]
+        bad_client = MagicMock()
+        bad_client.get_cats.side_effect = CatLinkAPIError("unreachable")
+        mock_get_client.return_value = [("usa", ok_client), ("china", bad_client)]
+
+        result = runner.invoke(cli, ["cats"])
+        assert result.exit_code == 0
+        assert "Whiskers" in result.output
+        assert "Warning (china): unreachable" in result.output
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_slow_region_does_not_block_others(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        release = threading.Event()
+        fast_client = MagicMock()
+        fast_client.send_action.return_value = {"returnCode": 0}
+        slow_client = MagicMock()
+        slow_client.send_action.side_effect = lambda *args: release.wait()
+        mock_get_client.return_value = [("usa", fast_client), ("china", slow_client)]
+
+        result = runner.invoke(cli, ["--timeout", "0.1", "clean", "123"])
+        release.set()
+        assert result.exit_code == 0
+        assert "Cleaning started" in result.output
+        assert "Warning (china): Timed out" in result.output
+
+
+class TestOutputOption:
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_ndjson_records_carry_region(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        usa = MagicMock()
+        usa.get_devices.return_value = [{"id": "1", "deviceType": "SCOOPER"}]
+        china = MagicMock()
+        china.get_devices.return_value = [{"id": "2", "deviceType": "FEEDER"}]
+        mock_get_client.return_value = [("usa", usa), ("china", china)]
+
+        result = runner.invoke(cli, ["--output", "ndjson", "devices"])
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert sorted(records, key=lambda r: r["id"]) == [
+            {"id": "1", "deviceType": "SCOOPER", "region": "usa"},
+            {"id": "2", "deviceType": "FEEDER", "region": "china"},
+        ]
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_json_empty_result(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
+        mock_client = MagicMock()
+        mock_client.get_cats.return_value = []
+        mock_get_client.return_value = [("usa", mock_client)]
+
+        result = runner.invoke(cli, ["--output", "json", "cats"])
+        assert result.exit_code == 0
+        assert result.stdout == "[]\n"
+
+
+class TestNoCacheOption:
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_disables_cached_reads(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
+        mock_client = MagicMock()
+        mock_client.get_cats.return_value = []
+        mock_get_client.return_value = [("usa", mock_client)]
+
+        result = runner.invoke(cli, ["--no-cache", "cats"])
+        assert result.exit_code == 0
+        assert mock_client.cache_reads is False
+
+
 class TestStatusCommand:
     @patch("catlink_cli.cli.get_authenticated_clients")
     def test_shows_status(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
@@ -98,6 +193,141 @@ class TestStatusCommand:
         assert "3.5" in result.output
         assert "15" in result.output
 
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_shows_reported_values(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
+        mock_client = MagicMock()
+        mock_client.get_device_detail.return_value = {
+            "online": "false",
+            "catLitterWeight": "1.50",
+            "inductionTimes": "10",
+            "manualTimes": None,
+            "temperature": "-",
+            "currentError": "E04",
+        }
+        mock_get_client.return_value = [("usa", mock_client)]
+
+        result = runner.invoke(cli, ["status", "123", "--type", "SCOOPER"])
+        assert result.exit_code == 0, result.output
+        assert "Online:            false" in result.output
+        assert "Litter weight:     1.50 kg" in result.output
+        assert "Total cleans:      10" in result.output
+        assert "Temperature" not in result.output
+        assert "Error:             E04" in result.output
+
+
+class TestStatusAll:
+    @pytest.fixture
+    def fleet(self) -> list[tuple[str, MagicMock]]:
+        details = {
+            "1": {"workStatus": "01", "online": True},
+            "2": {"weight": 120, "online": False},
+            "3": {"workStatus": "00", "online": True},
+        }
+
+        def detail(device_id: str, device_type: str) -> dict:
+            # The first device answers last; output order must not change.
+            time.sleep(0.05 if device_id == "1" else 0)
+            return details[device_id]
+
+        usa = MagicMock()
+        usa.api_base = "https://usa/"
+        usa.get_devices.return_value = [
+            {"id": "1", "deviceName": "Box", "deviceType": "LITTER_BOX_599"},
+            {"id": "2", "deviceName": "Feeder", "deviceType": "FEEDER"},
+        ]
+        usa.get_device_detail.side_effect = detail
+        china = MagicMock()
+        china.api_base = "https://china/"
+        china.get_devices.return_value = [{"id": "3", "deviceName": "Scoop", "deviceType": "C08"}]
+        china.get_device_detail.side_effect = detail
+        return [("usa", usa), ("china", china)]
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_fetches_each_type_in_stable_order(
+        self, mock_get_client: MagicMock, runner: CliRunner, fleet: list
+    ) -> None:
+        mock_get_client.return_value = fleet
+        usa, china = fleet[0][1], fleet[1][1]
+
+        result = runner.invoke(cli, ["status", "--all"])
+
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert lines[:3] == [
+            "Region: usa (https://usa/)",
+            "Box (1) [LITTER_BOX_599]",
+            "  Online:            True",
+        ]
+        assert "  State:             running" in lines
+        assert lines.index("Feeder (2) [FEEDER]") < lines.index("Region: china (https://china/)")
+        assert "  Food weight:       120 g" in lines
+        assert lines.index("Scoop (3) [C08]") > lines.index("Region: china (https://china/)")
+        assert sorted(c.args for c in usa.get_device_detail.call_args_list) == [
+            ("1", "LITTER_BOX_599"),
+            ("2", "FEEDER"),
+        ]
+        china.get_device_detail.assert_called_once_with("3", "C08")
+        usa.get_devices.assert_called_once()
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_type_filter_and_failures(
+        self, mock_get_client: MagicMock, runner: CliRunner, fleet: list
+    ) -> None:
+        mock_get_client.return_value = fleet
+        fleet[0][1].get_device_detail.side_effect = CatLinkAPIError("offline")
+
+        result = runner.invoke(
+            cli, ["--output", "ndjson", "status", "--all", "--type", "LITTER_BOX_599"]
+        )
+
+        assert result.exit_code == 1
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert records == [
+            {
+                "region": "usa",
+                "deviceId": "1",
+                "deviceType": "LITTER_BOX_599",
+                "deviceName": "Box",
+                "error": "offline",
+            }
+        ]
+        assert "no detail for 1 device(s)" in result.stderr
+        fleet[1][1].get_device_detail.assert_not_called()
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_concurrency_cap(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def detail(device_id: str, device_type: str) -> dict:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {"workStatus": "00"}
+
+        client = MagicMock()
+        client.get_devices.return_value = [
+            {"id": str(n), "deviceType": "SCOOPER"} for n in range(8)
+        ]
+        client.get_device_detail.side_effect = detail
+        mock_get_client.return_value = [("usa", client)]
+
+        result = runner.invoke(cli, ["status", "--all", "--concurrency", "3"])
+
+        assert result.exit_code == 0, result.output
+        assert client.get_device_detail.call_count == 8
+        assert peak == 3
+        mock_get_client.assert_called_once_with(region=None, max_concurrency=3)
+
+    def test_usage(self, runner: CliRunner) -> None:
+        assert runner.invoke(cli, ["status"]).exit_code == 2
+        assert runner.invoke(cli, ["status", "1", "--all"]).exit_code == 2
+
 
 class TestFeederStatusCommand:
     @patch("catlink_cli.cli.get_authenticated_clients")
@@ -182,6 +412,269 @@ class TestCleanCommand:
         mock_client.send_action.assert_called_once_with("123", "01", "SCOOPER")
 
 
+class TestDeviceSelectors:
+    @pytest.fixture
+    def fleet(self) -> list[tuple[str, MagicMock]]:
+        usa = MagicMock()
+        usa.get_devices.return_value = [
+            {"id": "1", "deviceName": "Kitchen Box", "deviceType": "LITTER_BOX_599", "model": "X1"},
+            {"id": "2", "deviceName": "Hall Box", "deviceType": "SCOOPER", "model": "SE"},
+            {"id": "3", "deviceName": "Kitchen Feeder", "deviceType": "FEEDER", "model": "F1"},
+        ]
+        china = MagicMock()
+        china.get_devices.return_value = [
+            {"id": "4", "deviceName": "Kitchen Scooper", "deviceType": "SCOOPER", "model": "se"},
+        ]
+        return [("usa", usa), ("china", china)]
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_all_skips_unsupported_types(
+        self, mock_get_client: MagicMock, runner: CliRunner, fleet: list
+    ) -> None:
+        mock_get_client.return_value = fleet
+        usa, china = fleet[0][1], fleet[1][1]
+
+        result = runner.invoke(cli, ["clean", "--all"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output.splitlines() == [
+            "[usa] Kitchen Box (1): Cleaning started.",
+            "[usa] Hall Box (2): Cleaning started.",
+            "[china] Kitchen Scooper (4): Cleaning started.",
+        ]
+        assert sorted(c.args for c in usa.send_action.call_args_list) == [
+            ("1", "01", "LITTER_BOX_599"),
+            ("2", "01", "SCOOPER"),
+        ]
+        china.send_action.assert_called_once_with("4", "01", "SCOOPER")
+        usa.get_devices.assert_called_once()
+        china.get_devices.assert_called_once()
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_structured_output_and_concurrency(
+        self, mock_get_client: MagicMock, runner: CliRunner, fleet: list
+    ) -> None:
+        mock_get_client.return_value = fleet
+        fleet[1][1].send_action.side_effect = CatLinkAPIError("offline")
+
+        result = runner.invoke(
+            cli, ["--output", "ndjson", "pause", "--name", "kitchen*", "--concurrency", "2"]
+        )
+
+        assert result.exit_code == 1
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert records == [
+            {
+                "region": "usa",
+                "deviceId": "1",
+                "deviceName": "Kitchen Box",
+                "ok": True,
+                "message": "Device paused.",
+            },
+            {
+                "region": "china",
+                "deviceId": "4",
+                "deviceName": "Kitchen Scooper",
+                "ok": False,
+                "message": "offline",
+            },
+        ]
+        mock_get_client.assert_called_once_with(region=None, max_concurrency=2)
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_filters_combine(
+        self, mock_get_client: MagicMock, runner: CliRunner, fleet: list
+    ) -> None:
+        mock_get_client.return_value = fleet
+
+        result = runner.invoke(cli, ["reset-litter", "--model", "SE", "--name", "kitchen*"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output.splitlines() == ["[china] Kitchen Scooper (4): Litter counter reset."]
+        fleet[1][1].reset_consumable.assert_called_once_with("4", "SCOOPER", "CAT_LITTER")
+        fleet[0][1].reset_consumable.assert_not_called()
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_type_narrows_all_and_mode_is_per_device(
+        self, mock_get_client: MagicMock, runner: CliRunner, fleet: list
+    ) -> None:
+        mock_get_client.return_value = fleet
+
+        result = runner.invoke(cli, ["mode", "empty", "--all", "--type", "LITTER_BOX_599"])
+
+        assert result.exit_code == 1
+        assert "Kitchen Box (1): failed: invalid mode 'empty'" in result.output
+        assert "1 of 1 devices failed" in result.output
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_feed_selects_feeders(
+        self, mock_get_client: MagicMock, runner: CliRunner, fleet: list
+    ) -> None:
+        mock_get_client.return_value = fleet
+
+        result = runner.invoke(cli, ["feed", "--all", "--portions", "2"])
+
+        assert result.exit_code == 0, result.output
+        fleet[0][1].food_out.assert_called_once_with("3", 2)
+        fleet[1][1].food_out.assert_not_called()
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_no_match(self, mock_get_client: MagicMock, runner: CliRunner, fleet: list) -> None:
+        mock_get_client.return_value = fleet
+        result = runner.invoke(cli, ["change-bag", "--name", "Garage*"])
+        assert result.exit_code == 1
+        assert "no matching devices" in result.output
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_type_alone_does_not_select(
+        self, mock_get_client: MagicMock, runner: CliRunner, fleet: list
+    ) -> None:
+        mock_get_client.return_value = fleet
+
+        for args in (["clean", "--type", "SCOOPER"], ["mode", "auto", "--type", "SCOOPER"]):
+            result = runner.invoke(cli, args)
+            assert result.exit_code == 2
+            assert "select devices with --all, --model or --name" in result.output
+        mock_get_client.assert_not_called()
+
+    def test_usage_errors(self, runner: CliRunner) -> None:
+        assert runner.invoke(cli, ["clean"]).exit_code == 2
+        assert runner.invoke(cli, ["clean", "1", "--all"]).exit_code == 2
+        assert runner.invoke(cli, ["mode", "--all"]).exit_code == 2
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_mode_names_missing_argument(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        result = runner.invoke(cli, ["mode", "1"])
+        assert result.exit_code == 2
+        assert "Missing argument 'MODE'" in result.output
+        assert "Invalid mode" not in result.output
+
+        result = runner.invoke(cli, ["mode"])
+        assert result.exit_code == 2
+        assert "Missing arguments 'DEVICE_ID' and 'MODE'" in result.output
+
+        result = runner.invoke(cli, ["mode", "--all"])
+        assert "Missing argument 'MODE'." in result.output
+
+        result = runner.invoke(cli, ["mode", "1", "auto", "--all"])
+        assert result.exit_code == 2
+        assert "DEVICE_ID cannot be combined" in result.output
+        mock_get_client.assert_not_called()
+
+
+class TestDeviceRouting:
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_known_device_goes_to_owning_region(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        DeviceRegistry().record("china", [{"id": "123", "deviceType": "SCOOPER"}])
+        mock_client = MagicMock()
+        mock_client.send_action.return_value = {"returnCode": 0}
+        mock_get_client.return_value = [("china", mock_client)]
+
+        result = runner.invoke(cli, ["clean", "123"])
+        assert result.exit_code == 0
+        mock_get_client.assert_called_once_with(
+            region="china", max_concurrency=DEFAULT_MAX_CONCURRENCY
+        )
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_unknown_device_goes_to_all_regions(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        mock_client = MagicMock()
+        mock_client.send_action.return_value = {"returnCode": 0}
+        mock_get_client.return_value = [("usa", mock_client)]
+
+        result = runner.invoke(cli, ["clean", "999"])
+        assert result.exit_code == 0
+        mock_get_client.assert_called_once_with(
+            region=None, max_concurrency=DEFAULT_MAX_CONCURRENCY
+        )
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_stale_entry_is_dropped_and_other_regions_retried(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        DeviceRegistry().record("china", [{"id": "123", "deviceType": "SCOOPER"}])
+        china_client = MagicMock()
+        china_client.send_action.side_effect = CatLinkAPIError("device not found")
+        china_client.get_devices.return_value = []
+        usa_client = MagicMock()
+        usa_client.send_action.return_value = {"returnCode": 0}
+        mock_get_client.side_effect = [
+            [("china", china_client)],
+            [("china", MagicMock()), ("usa", usa_client)],
+        ]
+
+        result = runner.invoke(cli, ["clean", "123"])
+        assert result.exit_code == 0, result.output
+        assert "Cleaning started." in result.output
+        usa_client.send_action.assert_called_once_with("123", "01", "SCOOPER")
+        assert DeviceRegistry().lookup("123") is None
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_error_for_listed_device_is_not_retried(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        DeviceRegistry().record("china", [{"id": "123", "deviceType": "SCOOPER"}])
+        china_client = MagicMock()
+        china_client.send_action.side_effect = CatLinkAPIError("device busy")
+        china_client.get_devices.return_value = [{"id": "123", "deviceType": "SCOOPER"}]
+        mock_get_client.return_value = [("china", china_client)]
+
+        result = runner.invoke(cli, ["clean", "123"])
+        assert result.exit_code != 0
+        assert "device busy" in result.output
+        mock_get_client.assert_called_once()
+        assert DeviceRegistry().lookup("123") is not None
+
+
+class TestDeviceTypeResolution:
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_type_from_registry(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
+        DeviceRegistry().record("usa", [{"id": "dev1", "deviceType": "FEEDER"}])
+        mock_client = MagicMock()
+        mock_client.get_device_detail.return_value = {"online": True, "weight": 250}
+        mock_get_client.return_value = [("usa", mock_client)]
+
+        result = runner.invoke(cli, ["status", "dev1"])
+        assert result.exit_code == 0
+        assert "250 g" in result.output
+        mock_client.get_device_detail.assert_called_once_with("dev1", "FEEDER")
+        mock_client.get_devices.assert_not_called()
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_unknown_device_refreshes_list_once(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        usa_client = MagicMock()
+        usa_client.get_devices.return_value = []
+        china_client = MagicMock()
+        china_client.get_devices.return_value = [{"id": "7", "deviceType": "LITTER_BOX_599"}]
+        china_client.send_action.return_value = {"returnCode": 0}
+        mock_get_client.return_value = [("usa", usa_client), ("china", china_client)]
+
+        result = runner.invoke(cli, ["clean", "7"])
+        assert result.exit_code == 0
+        china_client.send_action.assert_called_once_with("7", "01", "LITTER_BOX_599")
+        usa_client.send_action.assert_not_called()
+        china_client.get_devices.assert_called_once()
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_unsupported_type_rejected(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
+        DeviceRegistry().record("usa", [{"id": "dev1", "deviceType": "FEEDER"}])
+        mock_client = MagicMock()
+        mock_get_client.return_value = [("usa", mock_client)]
+
+        result = runner.invoke(cli, ["clean", "dev1"])
+        assert result.exit_code != 0
+        assert "is a FEEDER" in result.output
+        mock_client.send_action.assert_not_called()
+
+
 class TestPauseCommand:
     @patch("catlink_cli.cli.get_authenticated_clients")
     def test_pause(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
@@ -193,6 +686,97 @@ class TestPauseCommand:
         assert result.exit_code == 0
         assert "paused" in result.output
 
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_pause_json(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
+        mock_client = MagicMock()
+        mock_client.send_action.return_value = {"returnCode": 0}
+        mock_get_client.return_value = [("usa", mock_client)]
+
+        result = runner.invoke(cli, ["--output", "json", "pause", "123"])
+        assert result.exit_code == 0
+        assert json.loads(result.output) == [
+            {"region": "usa", "deviceId": "123", "ok": True, "message": "Device paused."}
+        ]
+
+
+class TestCatSummaryRange:
+    @staticmethod
+    def _client() -> MagicMock:
+        def summary(pet_id: str, date: str, timezone_id: str | None = None) -> dict:
+            # Earlier days answer last, so date order has to come from the command.
+            time.sleep(0.02 * (4 - int(date[-1])))
+            return {"weight": date[-1]}
+
+        client = MagicMock()
+        client.account = "86:123"
+        client.get_cat_summary.side_effect = summary
+        return client
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_streams_in_date_order(self, mock_get_client: MagicMock, runner: CliRunner) -> None:
+        mock_get_client.return_value = [("usa", self._client())]
+        result = runner.invoke(
+            cli,
+            [
+                "--output",
+                "ndjson",
+                "cat-summary",
+                "p1",
+                "--from",
+                "2024-05-01",
+                "--to",
+                "2024-05-03",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r["date"] for r in records] == ["2024-05-01", "2024-05-02", "2024-05-03"]
+        assert records[0] == {"weight": "1", "region": "usa", "petId": "p1", "date": "2024-05-01"}
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_past_days_are_cached_today_is_not(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        today = datetime.date.today()
+        start = (today - datetime.timedelta(days=2)).isoformat()
+        args = ["cat-summary", "p1", "--from", start]
+        first = self._client()
+        first.get_cat_summary.side_effect = lambda pet_id, date, timezone_id=None: {"d": date}
+        mock_get_client.return_value = [("usa", first)]
+        assert runner.invoke(cli, args).exit_code == 0
+        assert first.get_cat_summary.call_count == 3
+
+        second = self._client()
+        second.get_cat_summary.side_effect = lambda pet_id, date, timezone_id=None: {"d": date}
+        mock_get_client.return_value = [("usa", second)]
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+        assert [c.args[1] for c in second.get_cat_summary.call_args_list] == [today.isoformat()]
+        assert result.output.count("Date: ") == 3
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_range_only_queries_the_cats_region(
+        self, mock_get_client: MagicMock, runner: CliRunner
+    ) -> None:
+        usa = self._client()
+        usa.get_cats.return_value = [{"id": "p1", "name": "Tom"}]
+        china = self._client()
+        china.get_cats.return_value = [{"id": "p2", "name": "Mimi"}]
+        mock_get_client.return_value = [("usa", usa), ("china", china)]
+
+        result = runner.invoke(
+            cli, ["cat-summary", "p1", "--from", "2024-05-01", "--to", "2024-05-03"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert usa.get_cat_summary.call_count == 3
+        china.get_cat_summary.assert_not_called()
+        assert "Warning" not in result.output
+
+    def test_to_requires_from(self, runner: CliRunner) -> None:
+        result = runner.invoke(cli, ["cat-summary", "p1", "--to", "2024-05-01"])
+        assert result.exit_code == 2
+
 
 class TestCatsCommand:
     @patch("catlink_cli.cli.get_authenticated_clients")
@@ -221,9 +805,29 @@ class TestLogoutCommand:
         mock_clear_region.assert_called_once_with("china")
         mock_clear_all.assert_not_called()
 
+    @patch("catlink_cli.cli.clear_credentials")
+    @patch("catlink_cli.cli.clear_credentials_for_region")
+    def test_logout_clears_device_registry(
+        self, mock_clear_region: MagicMock, mock_clear_all: MagicMock, runner: CliRunner
+    ) -> None:
+        DeviceRegistry().record("china", [{"id": "a"}])
+        DeviceRegistry().record("usa", [{"id": "b"}])
+        assert runner.invoke(cli, ["logout", "--region", "china"]).exit_code == 0
+        assert DeviceRegistry().lookup("a") is None
+        assert DeviceRegistry().lookup("b") is not None
+        assert runner.invoke(cli, ["logout"]).exit_code == 0
+        assert DeviceRegistry().entries() == {}
+
     @patch("catlink_cli.cli.clear_credentials")
     def test_logout_all(self, mock_clear_all: MagicMock, runner: CliRunner) -> None:
         result = runner.invoke(cli, ["logout"])
         assert result.exit_code == 0
         assert "Credentials cleared." in result.output
         mock_clear_all.assert_called_once()
+
+
+class TestExporterCommand:
+    def test_rejects_bad_listen_address(self, runner: CliRunner) -> None:
+        result = runner.invoke(cli, ["exporter", "--listen", "nowhere"])
+        assert result.exit_code == 2
+        assert "Invalid listen address" in result.output
@@ -0,0 +1,195 @@
+"""Tests for the CatLink background daemon."""
+
+import json
+import pathlib
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from catlink_cli.api import CatLinkAPIError
+from catlink_cli.cli import cli
+from catlink_cli.daemon import DaemonClient, DaemonServer, daemon_clients, send_command
+
+
+@pytest.fixture
+def short_socket(monkeypatch: pytest.MonkeyPatch) -> Iterator[pathlib.Path]:
+    # Unix socket paths are limited to ~100 bytes, so avoid pytest's long tmp_path.
+    base = pathlib.Path(tempfile.mkdtemp(prefix="cl", dir="/tmp"))
+    path = base / "d.sock"
+    monkeypatch.setenv("CATLINK_DAEMON_SOCKET", str(path))
+    yield path
+    shutil.rmtree(base, ignore_errors=True)
+
+
+@pytest.fixture
+def remote_client() -> MagicMock:
+    client = MagicMock()
+    client.api_base = "https://app-usa.catlinkus.com/api/"
+    client.cache_reads = True
+    return client
+
+
+@pytest.fixture
+def server(short_socket: pathlib.Path, remote_client: MagicMock) -> Iterator[DaemonServer]:
+    with patch(
+        "catlink_cli.daemon.get_authenticated_clients", return_value=[("usa", remote_client)]
+    ):
+        srv = DaemonServer(short_socket)
+        thread = threading.Thread(target=srv.serve_forever, daemon=True)
+        thread.start()
+        yield srv
+        srv.shutdown()
+        srv.server_close()
+        thread.join(timeout=5)
+
+
+class TestDaemonProtocol:
+    def test_no_daemon_running(self, short_socket: pathlib.Path) -> None:
+        assert daemon_clients() is None
+
+    def test_stale_socket_file_is_ignored(self, short_socket: pathlib.Path) -> None:
+        short_socket.touch()
+        assert daemon_clients() is None
+
+    def test_lists_clients(self, server: DaemonServer) -> None:
+        clients = daemon_clients()
+        assert [(name, c.api_base) for name, c in clients] == [
+            ("usa", "https://app-usa.catlinkus.com/api/")
+        ]
+
+    def test_unknown_region_raises(self, server: DaemonServer) -> None:
+        with pytest.raises(CatLinkAPIError, match="Not logged in"):
+            daemon_clients("china")
+
+    def test_forwards_calls(self, server: DaemonServer, remote_client: MagicMock) -> None:
+        remote_client.get_device_detail.return_value = {"id": "1", "workStatus": "00"}
+        ((_, client),) = daemon_clients()
+        try:
+            assert client.get_device_detail("1", "SCOOPER") == {"id": "1", "workStatus": "00"}
+        finally:
+            client.close()
+        remote_client.get_device_detail.assert_called_once_with("1", "SCOOPER")
+
+    def test_api_errors_are_relayed(self, server: DaemonServer, remote_client: MagicMock) -> None:
+        remote_client.send_action.side_effect = CatLinkAPIError("Device offline", code=5)
+        client = DaemonClient("usa", remote_client.api_base, server.path)
+        with pytest.raises(CatLinkAPIError, match="Device offline") as exc_info:
+            client.send_action("1", "01")
+        client.close()
+        assert exc_info.value.code == 5
+
+    def test_concurrent_calls_run_in_parallel(
+        self, server: DaemonServer, remote_client: MagicMock
+    ) -> None:
+        def detail(device_id: str, device_type: str) -> dict:
+            time.sleep(0.3)
+            return {"id": device_id}
+
+        remote_client.get_device_detail.side_effect = detail
+        client = DaemonClient("usa", remote_client.api_base, server.path)
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda i: client.get_device_detail(str(i), "SCOOPER"), range(8))
+            )
+        elapsed = time.monotonic() - started
+        client.close()
+        assert [r["id"] for r in results] == [str(i) for i in range(8)]
+        assert elapsed < 1.2
+
+    def test_hung_daemon_times_out(self, server: DaemonServer, remote_client: MagicMock) -> None:
+        release = threading.Event()
+        remote_client.get_devices.side_effect = lambda: release.wait(5) and []
+        client = DaemonClient("usa", remote_client.api_base, server.path, timeout=0.2)
+        try:
+            with pytest.raises(CatLinkAPIError, match="did not answer"):
+                client.get_devices()
+        finally:
+            release.set()
+            client.close()
+
+    def test_rejects_unlisted_methods(self, server: DaemonServer) -> None:
+        with pytest.raises(CatLinkAPIError, match="not allowed"):
+            send_command("call", server.path, region="usa", method="login", args=[], kwargs={})
+        assert not hasattr(DaemonClient("usa", "", server.path), "login")
+
+    def test_malformed_lines_get_a_reply(
+        self, server: DaemonServer, remote_client: MagicMock
+    ) -> None:
+        remote_client.get_devices.side_effect = TypeError("unexpected argument")
+        lines = [
+            b"{not json\n",
+            b"[1, 2]\n",
+            b'{"op": "call", "region": "usa", "method": "get_devices", "args": [1]}\n',
+            b'{"op": "ping"}\n',
+        ]
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(server.path))
+            replies = sock.makefile("rb")
+            responses = []
+            for line in lines:
+                sock.sendall(line)
+                responses.append(json.loads(replies.readline()))
+        assert responses[0] == {"ok": False, "error": "Malformed request", "code": 0}
+        assert responses[1] == {"ok": False, "error": "Malformed request", "code": 0}
+        assert responses[2] == {"ok": False, "error": "unexpected argument", "code": 0}
+        assert responses[3] == {"ok": True, "result": "ping"}
+
+    def test_fresh_calls_bypass_cache(self, server: DaemonServer, remote_client: MagicMock) -> None:
+        remote_client.get_devices.return_value = []
+        remote_client.send_action.return_value = {"returnCode": 0}
+        client = DaemonClient("usa", remote_client.api_base, server.path)
+        client.cache_reads = False
+        client.get_devices()
+        client.cache_reads = True
+        client.send_action("1", "01")
+        client.close()
+        remote_client.get_devices.assert_called_once_with(fresh=True)
+        remote_client.send_action.assert_called_once_with("1", "01")
+        assert remote_client.cache_reads is True
+
+    def test_reload_drops_clients(self, server: DaemonServer, remote_client: MagicMock) -> None:
+        daemon_clients()
+        send_command("reload", server.path)
+        remote_client.close.assert_called_once()
+
+
+class TestDaemonCLI:
+    def test_commands_route_through_daemon(
+        self, server: DaemonServer, remote_client: MagicMock
+    ) -> None:
+        remote_client.get_devices.return_value = [
+            {"id": "1", "deviceName": "Box", "deviceType": "SCOOPER", "model": "SE"}
+        ]
+        with patch("catlink_cli.cli.get_authenticated_clients") as mock_direct:
+            result = CliRunner().invoke(cli, ["devices"])
+        assert result.exit_code == 0, result.output
+        assert "Box" in result.output
+        mock_direct.assert_not_called()
+
+    def test_no_daemon_flag(self, server: DaemonServer, remote_client: MagicMock) -> None:
+        direct = MagicMock()
+        direct.get_devices.return_value = []
+        with patch("catlink_cli.cli.get_authenticated_clients", return_value=[("usa", direct)]):
+            result = CliRunner().invoke(cli, ["--no-daemon", "devices"])
+        assert result.exit_code == 0, result.output
+        direct.get_devices.assert_called_once()
+        remote_client.get_devices.assert_not_called()
+
+    def test_refuses_second_daemon(self, server: DaemonServer) -> None:
+        result = CliRunner().invoke(cli, ["daemon"])
+        assert result.exit_code == 1
+        assert "already running" in result.output
+
+    def test_stop_without_daemon(self, short_socket: pathlib.Path) -> None:
+        result = CliRunner().invoke(cli, ["daemon", "--stop"])
+        assert result.exit_code == 1
+        assert "not running" in result.output
@@ -0,0 +1,134 @@
+"""Tests for the Prometheus exporter."""
+
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from catlink_cli.api import CatLinkAPIError
+from catlink_cli.exporter import FleetPoller, MetricsServer, parse_listen
+
+
+def _client(devices: list[dict], details: dict[str, dict]) -> MagicMock:
+    client = MagicMock()
+    client.get_devices.return_value = devices
+    client.get_device_detail.side_effect = lambda dev_id, _type: details[dev_id]
+    return client
+
+
+@pytest.fixture
+def fleet() -> list[tuple[str, MagicMock]]:
+    usa = _client(
+        [
+            {"id": "2", "deviceName": "Feeder", "deviceType": "FEEDER", "model": "F1"},
+            {"id": "1", "deviceName": 'Box "A"', "deviceType": "SCOOPER", "model": "SE"},
+        ],
+        {
+            "1": {
+                "online": True,
+                "catLitterWeight": "4.5",
+                "litterCountdown": 12,
+                "inductionTimes": "30",
+                "manualTimes": 2,
+                "temperature": "-",
+            },
+            "2": {"online": "false", "weight": 120},
+        },
+    )
+    return [("usa", usa)]
+
+
+class TestParseListen:
+    def test_port_only(self) -> None:
+        assert parse_listen(":9877") == ("", 9877)
+
+    def test_host_and_port(self) -> None:
+        assert parse_listen("127.0.0.1:9100") == ("127.0.0.1", 9100)
+        assert parse_listen("[::1]:9100") == ("::1", 9100)
+
+    @pytest.mark.parametrize("value", ["9877", ":http", ":0", "host:70000"])
+    def test_invalid(self, value: str) -> None:
+        with pytest.raises(ValueError):
+            parse_listen(value)
+
+
+class TestFleetPoller:
+    def test_renders_device_metrics(self, fleet: list[tuple[str, MagicMock]]) -> None:
+        poller = FleetPoller(fleet, interval=60)
+        poller.poll_once()
+        text = poller.snapshot.decode()
+
+        box = (
+            'region="usa",device_id="1",device_name="Box \\"A\\"",'
+            'device_type="SCOOPER",model="SE"'
+        )
+        assert f"catlink_litter_weight_kg{{{box}}} 4.5" in text
+        assert f"catlink_litter_countdown_days{{{box}}} 12" in text
+        assert f"catlink_induction_cleans{{{box}}} 30" in text
+        assert f"catlink_manual_cleans{{{box}}} 2" in text
+        assert f"catlink_device_online{{{box}}} 1" in text
+        assert 'catlink_feeder_food_weight_grams{region="usa",device_id="2"' in text
+        assert 'catlink_device_online{region="usa",device_id="2"' in text
+        assert "catlink_temperature_celsius" not in text
+        assert 'catlink_exporter_region_up{region="usa"} 1' in text
+        assert "# TYPE catlink_litter_weight_kg gauge" in text
+        # Devices are listed in a stable order regardless of API order.
+        assert text.index('device_id="1"') < text.index('device_id="2"')
+
+    def test_failed_detail_and_region(self, fleet: list[tuple[str, MagicMock]]) -> None:
+        fleet[0][1].get_device_detail.side_effect = CatLinkAPIError("offline")
+        china = MagicMock()
+        china.get_devices.side_effect = CatLinkAPIError("expired")
+        poller = FleetPoller([*fleet, ("china", china)], interval=60)
+        poller.poll_once()
+        text = poller.snapshot.decode()
+
+        assert 'catlink_device_up{region="usa",device_id="1"' in text
+        assert text.count("catlink_device_up{") == 2
+        assert all(
+            line.endswith(" 0")
+            for line in text.splitlines()
+            if line.startswith("catlink_device_up{")
+        )
+        assert 'catlink_exporter_region_up{region="china"} 0' in text
+
+    def test_poll_uses_concurrency(self, fleet: list[tuple[str, MagicMock]]) -> None:
+        poller = FleetPoller(fleet, interval=60, concurrency=1)
+        with patch("catlink_cli.exporter.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            poller.poll_once()
+        pool.assert_called_once_with(max_workers=1)
+
+    def test_snapshot_before_first_poll(self, fleet: list[tuple[str, MagicMock]]) -> None:
+        poller = FleetPoller(fleet, interval=60)
+        assert b"catlink_exporter_region_up" not in poller.snapshot
+        assert b"# TYPE catlink_device_up gauge" in poller.snapshot
+        fleet[0][1].get_devices.assert_not_called()
+
+
+class TestMetricsServer:
+    def test_scrapes_do_not_call_upstream(self, fleet: list[tuple[str, MagicMock]]) -> None:
+        poller = FleetPoller(fleet, interval=60)
+        poller.poll_once()
+        client = fleet[0][1]
+        client.reset_mock()
+        server = MetricsServer(("127.0.0.1", 0), poller)
+        thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            for _ in range(3):
+                with urllib.request.urlopen(f"{base}/metrics") as rsp:
+                    assert rsp.status == 200
+                    assert rsp.headers["Content-Type"].startswith("text/plain")
+                    assert rsp.read() == poller.snapshot
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(f"{base}/other")
+            assert exc_info.value.code == 404
+        finally:
+            server.shutdown()
+            server.server_close()
+        client.get_devices.assert_not_called()
+        client.get_device_detail.assert_not_called()
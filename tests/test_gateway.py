@@ -0,0 +1,148 @@
+"""Tests for the local JSON HTTP gateway."""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from catlink_cli.api import CatLinkAPIError
+from catlink_cli.cache import DeviceRegistry
+from catlink_cli.gateway import Gateway, GatewayServer
+
+
+@pytest.fixture
+def usa() -> MagicMock:
+    client = MagicMock()
+    client.get_devices.return_value = [
+        {"id": "1", "deviceName": "Box", "deviceType": "LITTER_BOX_599"},
+    ]
+    client.get_device_detail.return_value = {"workStatus": "00"}
+    client.get_cats.return_value = [{"id": "c1", "name": "Tom"}]
+    return client
+
+
+@pytest.fixture
+def gateway(usa: MagicMock) -> Gateway:
+    return Gateway([("usa", usa)], max_upstream=2)
+
+
+@pytest.fixture
+def base_url(gateway: Gateway) -> Iterator[str]:
+    server = GatewayServer(("127.0.0.1", 0), gateway)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url: str | urllib.request.Request) -> tuple[int, dict]:
+    try:
+        with urllib.request.urlopen(url) as rsp:
+            return rsp.status, json.loads(rsp.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def _post(url: str, body: dict) -> tuple[int, dict]:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    return _get(request)
+
+
+class TestGatewayRoutes:
+    def test_devices(self, base_url: str) -> None:
+        status, body = _get(f"{base_url}/devices")
+        assert status == 200
+        assert body == {
+            "devices": [
+                {"id": "1", "deviceName": "Box", "deviceType": "LITTER_BOX_599", "region": "usa"}
+            ],
+            "errors": {},
+        }
+
+    def test_status_resolves_device_type(self, base_url: str, usa: MagicMock) -> None:
+        status, body = _get(f"{base_url}/devices/1")
+        assert status == 200
+        assert body["deviceType"] == "LITTER_BOX_599"
+        assert body["detail"] == {"workStatus": "00"}
+        usa.get_device_detail.assert_called_once_with("1", "LITTER_BOX_599")
+
+    def test_status_uses_registry(self, base_url: str, usa: MagicMock) -> None:
+        DeviceRegistry().record("usa", [{"id": "7", "deviceType": "FEEDER"}])
+        assert _get(f"{base_url}/devices/7")[0] == 200
+        usa.get_devices.assert_not_called()
+        usa.get_device_detail.assert_called_once_with("7", "FEEDER")
+
+    def test_unknown_device(self, base_url: str) -> None:
+        status, body = _get(f"{base_url}/devices/404")
+        assert status == 404
+        assert "not found" in body["error"]
+
+    def test_action(self, base_url: str, usa: MagicMock) -> None:
+        usa.send_action.return_value = {"returnCode": 0}
+        status, body = _post(f"{base_url}/devices/1/action", {"action": "clean"})
+        assert status == 200
+        assert body == {"region": "usa", "deviceId": "1", "result": {"returnCode": 0}}
+        usa.send_action.assert_called_once_with("1", "01", "LITTER_BOX_599")
+
+    def test_invalid_mode(self, base_url: str, usa: MagicMock) -> None:
+        status, body = _post(f"{base_url}/devices/1/mode", {"mode": "empty"})
+        assert status == 400
+        assert "Valid modes: auto, manual, time" in body["error"]
+        usa.change_mode.assert_not_called()
+
+    def test_wrong_method_and_path(self, base_url: str) -> None:
+        assert _post(f"{base_url}/devices", {})[0] == 405
+        assert _get(f"{base_url}/nope")[0] == 404
+
+    def test_upstream_errors(self, base_url: str, usa: MagicMock) -> None:
+        usa.get_cats.side_effect = CatLinkAPIError("Token expired", code=1002)
+        status, body = _get(f"{base_url}/cats")
+        assert status == 502
+        assert body["error"] == "usa: Token expired"
+
+    def test_cats(self, base_url: str) -> None:
+        status, body = _get(f"{base_url}/cats?region=usa")
+        assert status == 200
+        assert body["cats"] == [{"id": "c1", "name": "Tom", "region": "usa"}]
+        assert _get(f"{base_url}/cats?region=china")[0] == 404
+
+
+class TestUpstreamLimit:
+    def test_concurrent_callers_share_the_cap(self, gateway: Gateway, usa: MagicMock) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_detail(device_id: str, device_type: str) -> dict:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return {}
+
+        usa.get_device_detail.side_effect = slow_detail
+        threads = [
+            threading.Thread(target=gateway.status, args=("1", {"type": "SCOOPER"}))
+            for _ in range(6)
+        ]
+        DeviceRegistry().record("usa", [{"id": "1", "deviceType": "SCOOPER"}])
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert usa.get_device_detail.call_count == 6
+        assert peak == 2
@@ -0,0 +1,162 @@
+"""Tests for the paginated log history export."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from catlink_cli.api import CatLinkAPI, CatLinkAPIError, _extract_log_page
+from catlink_cli.cli import cli
+from catlink_cli.history import ExportCursor, LogExport, log_csv_row
+
+
+def _paged_client(pages: int, per_page: int = 2, fail_on: int | None = None) -> MagicMock:
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def get_page(device_id: str, device_type: str, page: int, since: int, until: int):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        # Later pages answer first, so ordering has to come from the exporter.
+        time.sleep(0.01 * (pages - page))
+        with lock:
+            active -= 1
+        if page == fail_on:
+            raise CatLinkAPIError("boom")
+        entries = [{"time": f"p{page}e{i}", "event": "clean"} for i in range(per_page)]
+        return entries, pages
+
+    client = MagicMock()
+    client.get_device_log_page.side_effect = get_page
+    client.peak = lambda: peak
+    return client
+
+
+class TestExtractLogPage:
+    def test_pages_field(self) -> None:
+        assert _extract_log_page({"records": [{"a": 1}], "pages": 4}, 1, 100) == ([{"a": 1}], 4)
+
+    def test_total_field(self) -> None:
+        assert _extract_log_page({"list": [], "total": 250}, 1, 100) == ([], 3)
+
+    def test_full_page_without_counts(self) -> None:
+        assert _extract_log_page({"records": [{}, {}]}, 3, 2)[1] == 4
+        assert _extract_log_page({"records": [{}]}, 3, 2)[1] == 3
+
+
+class TestGetDeviceLogPage:
+    def test_client_request_params(self) -> None:
+        client = CatLinkAPI(token="t")
+        client._request_with_reauth = MagicMock(
+            return_value={"returnCode": 0, "data": {"records": [], "pages": 0}}
+        )
+        assert client.get_device_log_page("9", "FEEDER", 2, 10, 20) == ([], 0)
+        client._request_with_reauth.assert_called_once_with(
+            "token/device/feeder/stats/log/page",
+            {"deviceId": "9", "current": 2, "size": 100, "startTime": 10, "endTime": 20},
+        )
+        client.close()
+
+    def test_non_json_body_means_no_endpoint(self) -> None:
+        client = CatLinkAPI(token="t")
+        client._request_with_reauth = MagicMock(side_effect=ValueError("Expecting value"))
+        with pytest.raises(CatLinkAPIError, match="history endpoint not available for PUREPRO"):
+            client.get_device_log_page("9", "PUREPRO", 1, 0, 20)
+        client._request_with_reauth.side_effect = CatLinkAPIError("Token expired", code=1002)
+        with pytest.raises(CatLinkAPIError, match="Token expired"):
+            client.get_device_log_page("9", "PUREPRO", 1, 0, 20)
+        client.close()
+
+
+class TestLogExport:
+    def test_pages_in_order_fetched_in_parallel(self) -> None:
+        client = _paged_client(pages=6)
+        export = LogExport(client, "1", "SCOOPER", 0, 1000, workers=3)
+        times = [entry["time"] for page in export.pages() for entry in page]
+        assert times == [f"p{p}e{i}" for p in range(1, 7) for i in range(2)]
+        assert client.peak() > 1
+        args = client.get_device_log_page.call_args_list[0].args
+        assert args == ("1", "SCOOPER", 1, 0, 1000)
+
+    def test_resumes_after_interruption(self) -> None:
+        cursor = ExportCursor("usa", "1", "SCOOPER", 0, None)
+        client = _paged_client(pages=5, fail_on=4)
+        export = LogExport(client, "1", "SCOOPER", 0, None, cursor)
+        seen = []
+        with pytest.raises(CatLinkAPIError):
+            for page in export.pages():
+                seen.append(page[0]["time"])
+        assert seen == ["p1e0", "p2e0", "p3e0"]
+        assert cursor.load() == {"until": export.until_ms, "page": 4}
+
+        resumed = LogExport(_paged_client(pages=5), "1", "SCOOPER", 0, None, cursor)
+        assert resumed.resumed
+        assert resumed.until_ms == export.until_ms
+        assert [page[0]["time"] for page in resumed.pages()] == ["p4e0", "p5e0"]
+        assert cursor.load() == {}
+
+    def test_csv_row(self) -> None:
+        record = {"region": "usa", "deviceId": "1", "createTime": "t", "msg": 'a "b", c'}
+        assert log_csv_row(record) == 'usa,1,t,"a ""b"", c",,'
+
+
+class TestLogsExportCommand:
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_streams_ndjson(self, mock_get_clients: MagicMock) -> None:
+        client = _paged_client(pages=2, per_page=1)
+        mock_get_clients.return_value = [("usa", client)]
+        result = CliRunner().invoke(
+            cli, ["logs", "1", "--type", "SCOOPER", "--all", "--since", "2024-01-01"]
+        )
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r["time"] for r in records] == ["p1e0", "p2e0"]
+        assert records[0]["region"] == "usa"
+        since = client.get_device_log_page.call_args.args[3]
+        assert since == 1000 * int(time.mktime((2024, 1, 1, 0, 0, 0, 0, 0, -1)))
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_csv_header(self, mock_get_clients: MagicMock) -> None:
+        mock_get_clients.return_value = [("usa", _paged_client(pages=1, per_page=1))]
+        result = CliRunner().invoke(
+            cli, ["logs", "1", "--type", "SCOOPER", "--all", "--format", "csv"]
+        )
+        assert result.exit_code == 0, result.output
+        assert result.output.splitlines() == [
+            "region,deviceId,time,event,firstSection,secondSection",
+            "usa,1,p1e0,clean,,",
+        ]
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_output_must_match_format(self, mock_get_clients: MagicMock) -> None:
+        mock_get_clients.return_value = [("usa", _paged_client(pages=1, per_page=1))]
+        args = ["logs", "1", "--type", "SCOOPER", "--all"]
+        result = CliRunner().invoke(cli, ["--output", "json", *args])
+        assert result.exit_code == 2
+        assert "use --format instead" in result.output
+        result = CliRunner().invoke(cli, ["--output", "ndjson", *args])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["time"] == "p1e0"
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_missing_history_endpoint(self, mock_get_clients: MagicMock) -> None:
+        client = CatLinkAPI(token="t")
+        client._client = MagicMock()
+        client._client.get.return_value.status_code = 404
+        client._client.get.return_value.json.side_effect = ValueError("not JSON")
+        mock_get_clients.return_value = [("usa", client)]
+        result = CliRunner().invoke(cli, ["logs", "1", "--type", "FEEDER", "--all"])
+        assert result.exit_code == 1
+        assert "history endpoint not available for FEEDER" in result.output
+        assert "Traceback" not in result.output
+
+    def test_range_requires_all(self) -> None:
+        result = CliRunner().invoke(cli, ["logs", "1", "--since", "2024-01-01"])
+        assert result.exit_code == 2
+        assert "require --all" in result.output
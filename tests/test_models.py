@@ -0,0 +1,101 @@
+"""Tests for the typed payload models."""
+
+import sys
+
+import pytest
+
+from catlink_cli.models import (
+    Cat,
+    CatSummary,
+    Device,
+    FeederDetail,
+    LitterBoxDetail,
+    LogEntry,
+    parse_detail,
+)
+
+
+class TestDevice:
+    def test_fallback_keys(self) -> None:
+        device = Device.from_payload({"deviceId": 7, "deviceType": "FEEDER"})
+        assert device == Device(id="7", name="", type="FEEDER", model="")
+        assert device.raw is None
+
+    def test_keep_raw(self) -> None:
+        payload = {"id": "1", "deviceName": "Box"}
+        assert Device.from_payload(payload, keep_raw=True).raw is payload
+
+
+class TestDetails:
+    def test_litter_box_normalizes_values(self) -> None:
+        detail = LitterBoxDetail.from_payload(
+            {
+                "online": "true",
+                "workStatus": " 01 ",
+                "catLitterWeight": "4.5",
+                "litterCountdown": "12",
+                "inductionTimes": "30",
+                "manualTimes": 2,
+                "temperature": "-",
+                "currentError": "E1",
+            }
+        )
+        assert detail.online is True
+        assert detail.work_status == "01"
+        assert detail.litter_weight == 4.5
+        assert detail.litter_days == 12
+        assert detail.total_cleans == 32
+        assert LitterBoxDetail.from_payload({"manualTimes": "2"}).induction_cleans is None
+        assert detail.temperature is None
+        assert detail.deodorant_days is None
+        assert detail.error == "E1"
+
+    def test_text_fields_keep_reported_values(self) -> None:
+        detail = LitterBoxDetail.from_payload({"online": "false", "catLitterWeight": "1.50"})
+        assert detail.online_text == "false"
+        assert detail.litter_weight_text == "1.50"
+        assert detail == LitterBoxDetail.from_payload({"online": 0, "catLitterWeight": 1.5})
+
+    def test_feeder_error_fallbacks(self) -> None:
+        detail = parse_detail({"online": False, "error": "jam", "weight": 120}, "FEEDER")
+        assert isinstance(detail, FeederDetail)
+        assert detail.online is False
+        assert detail.weight == 120
+        assert detail.error == "jam"
+
+    def test_parse_detail_picks_litter_box(self) -> None:
+        assert isinstance(parse_detail({}, "SCOOPER"), LitterBoxDetail)
+
+    def test_slots_have_no_instance_dict(self) -> None:
+        detail = LitterBoxDetail.from_payload({"workStatus": "00"})
+        assert not hasattr(detail, "__dict__")
+        assert sys.getsizeof(detail) < sys.getsizeof({"workStatus": "00"})
+        with pytest.raises(AttributeError):
+            detail.error = "x"  # type: ignore[misc]
+
+
+class TestLogEntry:
+    def test_fallback_keys_and_text(self) -> None:
+        entry = LogEntry.from_payload(
+            {"createTime": 1714651200000.0, "msg": "Clean", "secondSection": "auto"}
+        )
+        assert entry.time == "1714651200000"
+        assert entry.text == "Clean auto"
+
+    def test_empty_entry(self) -> None:
+        assert LogEntry.from_payload({}).text == ""
+
+
+class TestCats:
+    def test_cat(self) -> None:
+        cat = Cat.from_payload({"petId": 42, "petName": "Tom", "weight": "4.2", "breed": "Tabby"})
+        assert cat == Cat(id="42", name="Tom", weight=4.2, breed="Tabby")
+
+    def test_summary_keys(self) -> None:
+        summary = CatSummary.from_payload({"catWeight": "4.1", "toiletTimes": "-"}, "2024-05-01")
+        assert summary.weight == 4.1
+        assert summary.visits is None
+
+    def test_summary_visit_parts(self) -> None:
+        summary = CatSummary.from_payload({"peeTimes": 3, "poopTimes": "1"}, "2024-05-01")
+        assert summary.visits == 4
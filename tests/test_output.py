@@ -0,0 +1,53 @@
+"""Tests for buffered command output."""
+
+import io
+import json
+from unittest.mock import patch
+
+from catlink_cli import output
+from catlink_cli.output import OutputWriter, dumps
+
+
+class TestDumps:
+    def test_standard_library_fallback(self) -> None:
+        with patch.object(output, "orjson", None):
+            assert dumps({"name": "Café", "n": 1}) == '{"name":"Café","n":1}'.encode()
+
+
+class TestOutputWriter:
+    def test_text_ignores_records_without_lines(self) -> None:
+        stream = io.BytesIO()
+        out = OutputWriter("text", stream)
+        out.header("Region: usa")
+        out.record({"id": 1}, "  one", "  two")
+        out.record({"id": 2})
+        out.close()
+        assert stream.getvalue() == b"Region: usa\n  one\n  two\n"
+        assert out.count == 2
+
+    def test_ndjson_writes_on_flush(self) -> None:
+        stream = io.BytesIO()
+        out = OutputWriter("ndjson", stream)
+        out.header("Region: usa")
+        out.record({"id": 1}, "ignored")
+        assert stream.getvalue() == b""
+        out.flush()
+        assert stream.getvalue() == b'{"id":1}\n'
+
+    def test_buffer_limit_forces_a_write(self) -> None:
+        stream = io.BytesIO()
+        out = OutputWriter("ndjson", stream, buffer_size=20)
+        out.record({"id": 1})
+        assert stream.getvalue() == b""
+        out.record({"id": 2, "name": "x"})
+        assert stream.getvalue().count(b"\n") == 2
+
+    def test_json_is_one_array(self) -> None:
+        stream = io.BytesIO()
+        out = OutputWriter("json", stream)
+        out.record({"id": 1})
+        out.flush()
+        assert stream.getvalue() == b""
+        out.record({"id": 2})
+        out.close()
+        assert json.loads(stream.getvalue()) == [{"id": 1}, {"id": 2}]
@@ -0,0 +1,128 @@
+"""Tests for the cat health analytics."""
+
+import datetime
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from catlink_cli import stats
+from catlink_cli.cli import cli
+
+np = pytest.importorskip("numpy")
+
+NAN = float("nan")
+
+
+class TestKernels:
+    def test_rolling_mean_skips_missing_days(self) -> None:
+        values = np.array([[1.0, 3.0, NAN, 5.0, 7.0]])
+        result = stats.rolling_mean(values, 2)
+        np.testing.assert_allclose(result, [[1.0, 2.0, 3.0, 5.0, 6.0]])
+
+    def test_rolling_mean_empty_window(self) -> None:
+        result = stats.rolling_mean(np.array([NAN, NAN, 2.0]), 1)
+        assert np.isnan(result[:2]).all()
+        assert result[2] == 2.0
+
+    def test_zscores(self) -> None:
+        result = stats.zscores(np.array([[2.0, 4.0, NAN, 6.0], [1.0, 1.0, 1.0, NAN]]))
+        np.testing.assert_allclose(result[0, [0, 1, 3]], [-1.2247449, 0.0, 1.2247449])
+        assert np.isnan(result[0, 2])
+        np.testing.assert_array_equal(result[1, :3], [0.0, 0.0, 0.0])
+
+    def test_week_over_week(self) -> None:
+        values = np.array([1.0] * 7 + [2.0] * 7 + [NAN, 5.0])
+        weekly, deltas = stats.week_over_week(values)
+        np.testing.assert_allclose(weekly, [1.0, 2.0, 5.0])
+        assert np.isnan(deltas[0])
+        np.testing.assert_allclose(deltas[1:], [1.0, 3.0])
+
+
+class TestAnalyse:
+    def test_flags_anomalies_and_counts_visits(self) -> None:
+        days = [f"2024-05-{n:02d}" for n in range(1, 11)]
+        normal = {day: {"weight": "4.5", "toiletTimes": 3} for day in days}
+        normal["2024-05-10"] = {"weight": "4.5", "toiletTimes": 12}
+        parts = {"2024-05-01": {"catWeight": 5, "peeTimes": 2, "poopTimes": 1}}
+
+        result = stats.analyse(days, {"a": normal, "b": parts}, window=3, threshold=2.0)
+
+        a_days = result["a"]["days"]
+        assert [day["anomaly"] for day in a_days] == [False] * 9 + [True]
+        assert result["a"]["visitsPerDay"] == 3.9
+        assert [week["week"] for week in result["a"]["weeks"]] == ["2024-05-01", "2024-05-08"]
+        assert result["b"]["days"][0]["visits"] == 3.0
+        assert result["b"]["days"][1]["weight"] is None
+
+    def test_a_year_of_several_cats_is_fast(self) -> None:
+        start = datetime.date(2023, 1, 1)
+        days = [(start + datetime.timedelta(days=n)).isoformat() for n in range(365)]
+        summaries = {
+            f"cat{cat}": {
+                day: {"weight": 4 + n % 5 / 10, "toiletTimes": n % 6} for n, day in enumerate(days)
+            }
+            for cat in range(4)
+        }
+        started = time.perf_counter()
+        stats.analyse(days, summaries, window=7, threshold=2.0)
+        assert time.perf_counter() - started < 1.0
+
+
+class TestCatStatsCommand:
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_outputs_one_record_per_cat(self, mock_get_clients: MagicMock) -> None:
+        client = MagicMock()
+        client.account = None
+        client.get_cat_summary.side_effect = lambda pet_id, date, timezone_id=None: {
+            "weight": "4.2" if pet_id == "p1" else "5.0",
+            "toiletTimes": 2,
+        }
+        mock_get_clients.return_value = [("usa", client)]
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "--output",
+                "ndjson",
+                "cat-stats",
+                "p1",
+                "p2",
+                "--from",
+                "2024-05-01",
+                "--to",
+                "2024-05-03",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r["petId"] for r in records] == ["p1", "p2"]
+        assert records[0]["days"][2]["weightAvg"] == 4.2
+        assert records[1]["visitsPerDay"] == 2.0
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_text_table(self, mock_get_clients: MagicMock) -> None:
+        client = MagicMock()
+        client.account = None
+        client.get_cat_summary.return_value = {"weight": "4.2", "toiletTimes": 2}
+        mock_get_clients.return_value = [("usa", client)]
+
+        result = CliRunner().invoke(
+            cli, ["cat-stats", "p1", "--from", "2024-05-01", "--to", "2024-05-01"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert result.output.splitlines()[:3] == [
+            "Cat p1: 2.0 visits/day",
+            "  Date         Weight   Avg(7)  Visits  Weight z  Visits z",
+            "  2024-05-01     4.20     4.20       2      0.00      0.00",
+        ]
+
+    def test_requires_numpy(self) -> None:
+        with patch.object(stats, "np", None):
+            result = CliRunner().invoke(cli, ["cat-stats", "p1", "--from", "2024-05-01"])
+        assert result.exit_code == 1
+        assert "requires NumPy" in result.output
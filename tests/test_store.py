@@ -0,0 +1,156 @@
+"""Tests for the local status and log history store."""
+
+import datetime
+import json
+import pathlib
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from catlink_cli.api import CatLinkAPIError
+from catlink_cli.cli import cli
+from catlink_cli.store import HistoryStore, Recorder, log_time
+from catlink_cli.watch import WatchedDevice
+
+DAY = datetime.datetime(2024, 5, 2, 12, 0).timestamp()
+
+
+def _device(device_id: str = "1", name: str = "Box") -> WatchedDevice:
+    return WatchedDevice("usa", MagicMock(), device_id, "SCOOPER", name)
+
+
+@pytest.fixture
+def store(isolated_history_db: pathlib.Path) -> Iterator[HistoryStore]:
+    store = HistoryStore(isolated_history_db)
+    yield store
+    store.close()
+
+
+class TestLogTime:
+    def test_clock_time_is_dated_when_seen(self) -> None:
+        assert log_time({"time": "9:05"}, DAY) == "2024-05-02 09:05"
+
+    def test_clock_time_later_than_now_is_yesterday(self) -> None:
+        assert log_time({"time": "13:30"}, DAY) == "2024-05-01 13:30"
+
+    def test_epoch_milliseconds(self) -> None:
+        assert log_time({"createTime": int(DAY * 1000)}, 0) == "2024-05-02 12:00:00"
+
+    def test_full_time_is_kept(self) -> None:
+        assert log_time({"time": "2024-04-30 08:00:00"}, DAY) == "2024-04-30 08:00:00"
+
+
+class TestHistoryStore:
+    def test_logs_are_deduplicated(self, store: HistoryStore) -> None:
+        entries = [{"time": "10:00", "event": "Auto clean"}, {"time": "11:00", "event": "Cat"}]
+        assert store.write([_device()], [], [("1", DAY, entries)]) == 2
+        assert store.write([_device()], [], [("1", DAY + 60, entries[1:])]) == 0
+        rows = store.logs("1", since="2024-05-02 10:30")
+        assert [(row["time"], row["event"], row["name"]) for row in rows] == [
+            ("2024-05-02 11:00", "Cat", "Box")
+        ]
+
+    def test_status_range(self, store: HistoryStore) -> None:
+        details = [
+            ("1", DAY + hour * 3600, {"catLitterWeight": str(4 + hour), "online": True})
+            for hour in range(4)
+        ]
+        store.write([_device()], details, [])
+        rows = store.status("1", since=DAY + 3600, until=DAY + 2 * 3600)
+        assert [row["litter_weight"] for row in rows] == [5.0, 6.0]
+        assert rows[0]["online"] == 1
+        assert store.status("2") == []
+
+    def test_daily_counts_cleans(self, store: HistoryStore) -> None:
+        details = [
+            ("1", DAY, {"inductionTimes": 10, "manualTimes": 1, "catLitterWeight": 4}),
+            ("1", DAY + 60, {"inductionTimes": 13, "manualTimes": 2, "catLitterWeight": 5}),
+        ]
+        store.write([_device()], details, [])
+        [row] = store.daily()
+        assert row["day"] == "2024-05-02"
+        assert row["cleans"] == 4
+        assert row["litter_weight"] == 4.5
+        assert row["samples"] == 2
+
+
+class TestRecorder:
+    def test_poll_stores_all_devices_in_one_write(self, store: HistoryStore) -> None:
+        ok = _device("1")
+        ok.client.get_device_detail.return_value = {"catLitterWeight": 4}
+        ok.client.get_device_logs.return_value = [{"time": "10:00", "event": "clean"}]
+        broken = _device("2", "Feeder")
+        broken.client.get_device_detail.side_effect = CatLinkAPIError("offline")
+        broken.client.get_device_logs.return_value = []
+        lines: list[str] = []
+        recorder = Recorder([ok, broken], store, lines.append, 60, clock=lambda: DAY)
+
+        with patch.object(store, "write", wraps=store.write) as write:
+            assert recorder.poll_once() == (1, 1)
+        write.assert_called_once()
+        assert lines == ["Feeder (2) error: offline"]
+
+    def test_poll_uses_concurrency(self, store: HistoryStore) -> None:
+        devices = [_device(str(n)) for n in range(4)]
+        for device in devices:
+            device.client.get_device_detail.return_value = {}
+            device.client.get_device_logs.return_value = []
+        recorder = Recorder(devices, store, lambda _: None, 60, concurrency=2, clock=lambda: DAY)
+        with patch("catlink_cli.store.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            recorder.poll_once()
+        pool.assert_called_once_with(max_workers=2)
+
+
+class TestHistoryCommand:
+    def test_queries_without_api(self, store: HistoryStore) -> None:
+        store.write([_device()], [("1", DAY, {"catLitterWeight": "4.5"})], [])
+        with patch("catlink_cli.cli.get_authenticated_clients") as mock_get_clients:
+            result = CliRunner().invoke(cli, ["--output", "ndjson", "history", "1"])
+        mock_get_clients.assert_not_called()
+        assert result.exit_code == 0, result.output
+        [row] = [json.loads(line) for line in result.output.splitlines()]
+        assert row["litter_weight"] == 4.5
+        assert row["name"] == "Box"
+
+    def test_text_output(self, store: HistoryStore) -> None:
+        store.write([_device()], [("1", DAY, {"catLitterWeight": "4.5", "manualTimes": 2})], [])
+        result = CliRunner().invoke(cli, ["history", "--since", "2024-05-02"])
+        assert result.exit_code == 0, result.output
+        assert result.output == (
+            "2024-05-02 12:00:00  Box (1)  litter_weight=4.5 manual_cleans=2\n"
+        )
+
+    def test_missing_database(self) -> None:
+        result = CliRunner().invoke(cli, ["history"])
+        assert result.exit_code == 1
+        assert "Run 'catlink record' first" in result.output
+
+
+class TestRecordCommand:
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_records_selected_devices(
+        self, mock_get_clients: MagicMock, isolated_history_db: pathlib.Path
+    ) -> None:
+        client = MagicMock()
+        client.get_devices.return_value = [
+            {"id": "1", "deviceName": "Box", "deviceType": "SCOOPER"},
+            {"id": "2", "deviceName": "Feeder", "deviceType": "FEEDER"},
+        ]
+        client.get_device_detail.return_value = {"catLitterWeight": 4}
+        client.get_device_logs.return_value = []
+        mock_get_clients.return_value = [("usa", client)]
+
+        with patch("catlink_cli.store.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            result = CliRunner().invoke(cli, ["record", "1", "--count", "1", "--concurrency", "3"])
+
+        assert result.exit_code == 0, result.output
+        mock_get_clients.assert_called_once_with(region=None, max_concurrency=3)
+        pool.assert_called_once_with(max_workers=1)
+        assert "stored 1 status samples, 0 new log events" in result.output
+        client.get_device_detail.assert_called_once_with("1", "SCOOPER")
+        store = HistoryStore(isolated_history_db)
+        assert len(store.status()) == 1
+        store.close()
@@ -0,0 +1,132 @@
+"""Tests for the 'catlink top' dashboard."""
+
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from catlink_cli.api import CatLinkAPIError
+from catlink_cli.cli import cli
+from catlink_cli.models import FeederDetail, LitterBoxDetail
+from catlink_cli.top import HEADER_LINES, FleetDashboard, QuitDashboard, row_cells
+from catlink_cli.watch import WatchedDevice
+
+
+class FakeScreen:
+    def __init__(self, waits: int) -> None:
+        self.now = 0.0
+        self.waits = waits
+        self.drawn: list[tuple[int, str]] = []
+        self.redraw_all = lambda: None
+
+    def draw(self, line: int, text: str) -> None:
+        self.drawn.append((line, text))
+
+    def refresh(self) -> None:
+        pass
+
+    def wait(self, seconds: float) -> None:
+        if self.waits == 0:
+            raise QuitDashboard
+        self.waits -= 1
+        self.now += seconds
+
+
+def _device(device_id: str, details: list, device_type: str = "SCOOPER") -> WatchedDevice:
+    client = MagicMock()
+    client.get_device_detail.side_effect = details
+    return WatchedDevice("usa", client, device_id, device_type, f"Dev{device_id}")
+
+
+class TestRowCells:
+    def test_litter_box(self) -> None:
+        device = _device("1", [])
+        detail = LitterBoxDetail.from_payload(
+            {
+                "workStatus": "01",
+                "workModel": "00",
+                "catLitterWeight": 4.5,
+                "litterCountdown": 12,
+                "deodorantCountdown": "-",
+                "currentError": "Bin full",
+            }
+        )
+        assert row_cells(device, detail) == [
+            "Dev1 (1)",
+            "SCOOPER",
+            "running",
+            "auto",
+            "4.5 kg",
+            "12",
+            "",
+            "",
+            "Bin full",
+        ]
+
+    def test_feeder_and_errors(self) -> None:
+        feeder = _device("2", [], "FEEDER")
+        detail = FeederDetail.from_payload({"online": False, "weight": 80})
+        assert row_cells(feeder, detail)[2:8] == [
+            "offline",
+            "",
+            "",
+            "",
+            "",
+            "80 g",
+        ]
+        assert row_cells(feeder, CatLinkAPIError("timeout"))[-1] == "timeout"
+
+
+class TestFleetDashboard:
+    def test_only_changed_rows_are_redrawn(self) -> None:
+        idle = {"workStatus": "00", "litterCountdown": 10}
+        busy = _device("1", [idle, {**idle, "workStatus": "01"}, {**idle, "workStatus": "01"}])
+        quiet = _device("2", [idle, idle, idle])
+        screen = FakeScreen(waits=4)
+        dashboard = FleetDashboard([busy, quiet], screen, 5, 300, clock=lambda: screen.now)
+
+        dashboard.run(count=3)
+
+        row_draws = [(line, text) for line, text in screen.drawn if line >= HEADER_LINES]
+        first_line, second_line = HEADER_LINES, HEADER_LINES + 1
+        # Placeholder rows, then the first poll of both devices, then a single
+        # redraw when device 1 starts running; repeated identical details draw nothing.
+        assert [line for line, _ in row_draws] == [
+            first_line,
+            second_line,
+            first_line,
+            second_line,
+            first_line,
+        ]
+        assert "running" in row_draws[-1][1]
+        assert quiet.client.get_device_detail.call_count == 3
+
+    def test_quit_stops_the_loop(self) -> None:
+        device = _device("1", [{"workStatus": "00"}] * 10)
+        screen = FakeScreen(waits=0)
+        FleetDashboard([device], screen, 5, 300, clock=lambda: screen.now).run()
+        assert device.client.get_device_detail.call_count == 1
+
+
+class TestTopCommand:
+    def test_needs_a_terminal(self) -> None:
+        result = CliRunner().invoke(cli, ["top"])
+        assert result.exit_code == 1
+        assert "needs a terminal" in result.output
+
+    @patch("catlink_cli.cli.terminal_attached", return_value=True)
+    @patch("catlink_cli.cli.run_dashboard")
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_shows_every_device(
+        self, mock_get_clients: MagicMock, mock_run: MagicMock, _terminal: MagicMock
+    ) -> None:
+        client = MagicMock()
+        client.get_devices.return_value = [
+            {"id": "2", "deviceName": "Feeder", "deviceType": "FEEDER"},
+            {"id": "1", "deviceName": "Box", "deviceType": "SCOOPER"},
+        ]
+        mock_get_clients.return_value = [("usa", client)]
+        result = CliRunner().invoke(cli, ["top"])
+        assert result.exit_code == 0, result.output
+        devices = mock_run.call_args.args[0]
+        assert [d.device_id for d in devices] == ["1", "2"]
+        client.close.assert_called_once()
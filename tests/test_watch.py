@@ -0,0 +1,183 @@
+"""Tests for the adaptive device watcher."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from catlink_cli.api import CatLinkAPIError
+from catlink_cli.cli import cli
+from catlink_cli.models import FeederDetail, LitterBoxDetail
+from catlink_cli.watch import (
+    DeviceWatcher,
+    WatchedDevice,
+    changed_fields,
+    format_value,
+    next_interval,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _device(details: list[dict], device_type: str = "SCOOPER") -> WatchedDevice:
+    client = MagicMock()
+    client.get_device_detail.side_effect = details
+    return WatchedDevice("usa", client, "1", device_type, "Box")
+
+
+class TestChangedFields:
+    def test_first_poll_reports_present_fields(self) -> None:
+        current = LitterBoxDetail.from_payload({"workStatus": "00", "unrelated": 1})
+        assert changed_fields(None, current) == [("workStatus", None, "00")]
+
+    def test_only_changed_fields(self) -> None:
+        old = LitterBoxDetail.from_payload(
+            {"workStatus": "00", "litterCountdown": 10, "manualTimes": 1}
+        )
+        new = LitterBoxDetail.from_payload(
+            {"workStatus": "01", "litterCountdown": "10", "manualTimes": 1}
+        )
+        assert changed_fields(old, new) == [("workStatus", "00", "01")]
+
+    def test_error_fields_are_one_field(self) -> None:
+        old = FeederDetail.from_payload({"currentErrorMessage": "Jammed"})
+        new = FeederDetail.from_payload({"error": "Jammed"})
+        assert changed_fields(old, new) == []
+        assert changed_fields(new, FeederDetail.from_payload({})) == [("error", "Jammed", "")]
+
+    def test_format_value(self) -> None:
+        assert format_value("workStatus", "01", "SCOOPER") == "running"
+        assert format_value("workModel", "02", "LITTER_BOX_599") == "time"
+        assert format_value("weight", None, "FEEDER") == "-"
+        assert format_value("error", "", "FEEDER") == "-"
+
+
+class TestNextInterval:
+    def test_running_uses_minimum(self) -> None:
+        assert next_interval(80, True, 5, 300) == 5
+
+    def test_idle_backs_off_exponentially(self) -> None:
+        intervals = [0.0]
+        for _ in range(8):
+            intervals.append(next_interval(intervals[-1], False, 5, 300))
+        assert intervals[1:] == [10, 20, 40, 80, 160, 300, 300, 300]
+
+
+class TestDeviceWatcher:
+    def test_prints_changes_only(self) -> None:
+        lines: list[str] = []
+        device = _device(
+            [
+                {"workStatus": "00", "litterCountdown": 10},
+                {"workStatus": "00", "litterCountdown": 10},
+                {"workStatus": "01", "litterCountdown": 9},
+            ]
+        )
+        clock = FakeClock()
+        DeviceWatcher([device], lines.append, 5, 300, clock=clock, sleep=clock.sleep).run(count=3)
+
+        assert [line.split("] ", 1)[1] for line in lines] == [
+            "Box (1) workStatus: idle",
+            "Box (1) litterCountdown: 10",
+            "Box (1) workStatus: idle -> running",
+            "Box (1) litterCountdown: 10 -> 9",
+        ]
+        assert isinstance(device.detail, LitterBoxDetail)
+        assert device.detail.litter_days == 9
+        assert device.detail.raw is None
+
+    def test_schedule_follows_work_status(self) -> None:
+        idle = {"workStatus": "00"}
+        running = {"workStatus": "01"}
+        device = _device([idle, idle, running, running, idle])
+        clock = FakeClock()
+        watcher = DeviceWatcher([device], lambda _: None, 5, 300, clock=clock, sleep=clock.sleep)
+        watcher.run(count=5)
+        assert clock.sleeps == [10, 20, 5, 5]
+
+    def test_devices_keep_separate_schedules(self) -> None:
+        busy = _device([{"workStatus": "01"}] * 4)
+        quiet = _device([{"workStatus": "00"}] * 4)
+        quiet.device_id = "2"
+        clock = FakeClock()
+        batches: list[tuple[float, list[str]]] = []
+        watcher = DeviceWatcher(
+            [busy, quiet], lambda _: None, 5, 300, clock=clock, sleep=clock.sleep
+        )
+        poll = watcher.poll
+        watcher.poll = lambda devices: (
+            batches.append((clock.now, [d.device_id for d in devices])),
+            poll(devices),
+        )
+        watcher.run(count=4)
+        assert batches == [
+            (0, ["1", "2"]),
+            (5, ["1"]),
+            (10, ["1", "2"]),
+            (15, ["1"]),
+            (30, ["2"]),
+            (70, ["2"]),
+        ]
+
+    def test_poll_uses_concurrency(self) -> None:
+        devices = [_device([{"workStatus": "00"}]) for _ in range(4)]
+        watcher = DeviceWatcher(devices, lambda _: None, 5, 300, concurrency=2)
+        with patch("catlink_cli.watch.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            watcher.poll(devices)
+        pool.assert_called_once_with(max_workers=2)
+
+    def test_errors_are_reported_and_back_off(self) -> None:
+        lines: list[str] = []
+        device = _device([CatLinkAPIError("offline"), {"workStatus": "00"}])
+        clock = FakeClock()
+        DeviceWatcher([device], lines.append, 5, 300, clock=clock, sleep=clock.sleep).run(count=2)
+        assert "Box (1) error: offline" in lines[0]
+        assert clock.sleeps == [10]
+
+
+class TestWatchCommand:
+    @patch("catlink_cli.cli.DeviceWatcher")
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_watches_selected_devices(
+        self, mock_get_clients: MagicMock, mock_watcher_cls: MagicMock
+    ) -> None:
+        client = MagicMock()
+        client.get_devices.return_value = [
+            {"id": "1", "deviceName": "Box", "deviceType": "LITTER_BOX_599"},
+            {"id": "2", "deviceName": "Feeder", "deviceType": "FEEDER"},
+        ]
+        mock_get_clients.return_value = [("usa", client)]
+
+        result = CliRunner().invoke(cli, ["watch", "1", "9", "--count", "1", "--concurrency", "3"])
+
+        assert result.exit_code == 0, result.output
+        assert "device 9 not found" in result.output
+        watched = mock_watcher_cls.call_args.args[0]
+        assert [(d.device_id, d.device_type) for d in watched] == [("1", "LITTER_BOX_599")]
+        mock_watcher_cls.return_value.run.assert_called_once_with(1)
+        assert mock_watcher_cls.call_args.args[4] == 3
+        mock_get_clients.assert_called_once_with(region=None, max_concurrency=3)
+        assert client.cache_reads is False
+        client.close.assert_called_once()
+
+    @patch("catlink_cli.cli.get_authenticated_clients")
+    def test_no_matching_devices(self, mock_get_clients: MagicMock) -> None:
+        client = MagicMock()
+        client.get_devices.return_value = []
+        mock_get_clients.return_value = [("usa", client)]
+
+        result = CliRunner().invoke(cli, ["watch", "1"])
+
+        assert result.exit_code == 1
+        assert "no devices to watch" in result.output